@@ -38,9 +38,12 @@ modules = [
 
     # ----------------------- Regression List --------------------------
     'scripts/aerodynamics/aerodynamics.py', 
+    'scripts/aerodynamics/vlm_cache.py',
+    'scripts/aerodynamics/parallel_training.py',
     'scripts/airfoil_import/airfoil_import_test.py',    
     'scripts/atmosphere/atmosphere.py',
     'scripts/atmosphere/constant_temperature.py',
+    'scripts/atmosphere/lookup_table.py',
     'scripts/AVL/test_AVL.py',
     'scripts/B737/mission_B737.py',
     'scripts/battery/battery.py', 
@@ -48,6 +51,7 @@ modules = [
     'scripts/cmalpha/cmalpha.py',
     'scripts/cnbeta/cnbeta.py',    
     'scripts/concorde/concorde.py',
+    'scripts/data/data_access.py',
     'scripts/DC_10_noise/DC_10_noise.py',
     'scripts/ducted_fan/ducted_fan_network.py',
     'scripts/ducted_fan/battery_ducted_fan_network.py',
@@ -69,7 +73,14 @@ modules = [
     'scripts/motor/motor_test.py',     
     'scripts/multifidelity/optimize_mf.py',
     'scripts/noise_optimization/Noise_Test.py', 
+    'scripts/noise_optimization/jet_noise_SAE.py',
+    'scripts/noise_optimization/airframe_noise_Fink.py',
+    'scripts/noise_optimization/noise_footprint.py',
+    'scripts/noise_optimization/noise_metrics.py',
     'scripts/optimization_packages/optimization_packages.py',    
+    'scripts/optimization_packages/evaluation_cache.py',
+    'scripts/optimization_packages/alias_paths.py',
+    'scripts/optimization_packages/parallel_gradients.py',
     'scripts/payload_range/payload_range.py', 
     'scripts/plots/plot_test.py',    
     'scripts/propeller/propeller_test.py',
@@ -80,14 +91,19 @@ modules = [
     'scripts/rocket_network/Rocketdyne_F1.py',
     'scripts/rocket_network/Rocketdyne_J2.py',   
     'scripts/segments/segment_test.py',     
+    'scripts/segments/converge_root_jacobian.py',
+    'scripts/segments/batch_segments.py',
     'scripts/slipstream/slipstream_test.py',
     'scripts/solar_network/solar_network.py',
     'scripts/solar_network/solar_low_fidelity_network.py',
     'scripts/solar_radiation/solar_radiation.py',
     'scripts/SU2_surrogate/BWB-450.py',   
+    'scripts/SU2_surrogate/OpenVSP_surrogate.py',
     'scripts/sweeps/test_sweeps.py',
     'scripts/test_input_output/test_xml_read_write.py',
     'scripts/test_input_output/test_freemind_write.py',    
+    'scripts/test_input_output/test_binary_archive.py',
+    'scripts/test_input_output/test_segment_archive.py',
     'scripts/variable_cruise_distance/variable_cruise_distance.py', 
     'scripts/V_n_diagram/V_n_diagram_regression.py',      
     'scripts/VTOL/test_Multicopter.py',
@@ -0,0 +1,100 @@
+# OpenVSP_surrogate.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression and timing of the OpenVSP surrogate predicted at all of the control points at once, and of its
+    fast prediction on a grid
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Aerodynamics.OpenVSP_Surrogate_Class import OpenVSP_Surrogate_Class
+
+import numpy as np
+import os
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    surrogate = build_surrogate(fast_prediction=False)
+
+    # control points of a climb, a few of them outside of the training data
+    AoA  = np.linspace(-1.,7.,64)[:,None] * Units.deg
+    mach = np.linspace(0.25,0.9,64)[:,None]
+
+    ti = time.time()
+    CL, CD = surrogate.evaluate(state_setup(AoA,mach),Data(),Data())
+    tf = time.time()
+
+    print('Batched prediction of ' + str(len(AoA)) + ' points in ' + str(tf-ti) + ' s')
+
+    # the batched prediction is the prediction of each point on its own
+    for ii in range(len(AoA)):
+        point = [np.array([AoA[ii,0],mach[ii,0]])]
+        assert(np.abs(CL[ii,0] - surrogate.surrogates.lift_coefficient.predict(point)[0]) < 1e-12)
+        assert(np.abs(CD[ii,0] - surrogate.surrogates.drag_coefficient.predict(point)[0]) < 1e-12)
+
+    assert(CL.shape == (64,1))
+    assert(CD.shape == (64,1))
+
+    # the fast prediction is within the tolerance of the surrogate inside of the grid, and is the surrogate outside
+    fast_surrogate = build_surrogate(fast_prediction=True)
+    grid           = fast_surrogate.surrogates.grid
+
+    ti = time.time()
+    CL_fast, CD_fast = fast_surrogate.evaluate(state_setup(AoA,mach),Data(),Data())
+    tf = time.time()
+
+    print('Fast prediction on ' + str(grid.points) + ' points per dimension in ' + str(tf-ti) + ' s')
+    print('Estimated error of the grid in CL: ' + str(grid.error.lift_coefficient) + ', in CD: ' + str(grid.error.drag_coefficient))
+
+    tolerance = fast_surrogate.settings.fast_prediction_tolerance
+    assert(grid.error.lift_coefficient <= tolerance)
+    assert(grid.error.drag_coefficient <= tolerance)
+
+    points = np.hstack([AoA,mach])
+    inside = np.all((points >= grid.lower_bounds) & (points <= grid.upper_bounds),axis=1)
+    assert(np.any(inside) and not np.all(inside))
+
+    assert(np.all(np.abs(CL_fast - CL)[inside] <= tolerance))
+    assert(np.all(np.abs(CD_fast - CD)[inside] <= tolerance))
+    assert(np.all(CL_fast[~inside] == CL[~inside]))
+    assert(np.all(CD_fast[~inside] == CD[~inside]))
+
+    return
+
+def build_surrogate(fast_prediction):
+
+    surrogate = OpenVSP_Surrogate_Class()
+    surrogate.geometry.tag              = 'OpenVSP_surrogate_regression'
+    surrogate.training_file             = 'base_data.txt'
+    surrogate.settings.fast_prediction  = fast_prediction
+    surrogate.initialize()
+
+    os.remove(surrogate.geometry.tag + '_data.txt')
+
+    return surrogate
+
+def state_setup(AoA,mach):
+
+    state = Data()
+    state.conditions = Data()
+    state.conditions.freestream = Data()
+    state.conditions.freestream.mach_number = mach
+    state.conditions.aerodynamics = Data()
+    state.conditions.aerodynamics.angle_of_attack = AoA
+    state.conditions.aerodynamics.lift_breakdown  = Data()
+    state.conditions.aerodynamics.drag_breakdown  = Data()
+
+    return state
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# parallel_training.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks that sampling the surrogate training data of the vortex lattice and the lifting line
+    on a pool of processes, in chunks, gives the training data of a single process"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+import time
+
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Aerodynamics.Vortex_Lattice import compute_training_chunks
+
+from vlm_cache import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # vortex lattice, serial, on two processes and in chunks of one Mach number
+    training = []
+    for processes, memory_limit in [(1,2**30),(2,2**30),(2,1)]:
+        vlm = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+        vlm.geometry = vehicle_setup()
+        vlm.settings.number_of_processes = processes
+        vlm.settings.memory_limit        = memory_limit
+        vlm.initialize(False, False, 6, 2, False)
+
+        t0 = time.time()
+        vlm.sample_training()
+        print('vortex lattice on %d processes, %d byte limit: %.3f s' % (processes, memory_limit, time.time() - t0))
+        training.append(vlm.training)
+
+    for other in training[1:]:
+        for key in ['lift_coefficient_sub','lift_coefficient_sup','drag_coefficient_sub','drag_coefficient_sup']:
+            assert np.all(other[key] == training[0][key])
+        for key in ['wing_lift_coefficient_sub','wing_drag_coefficient_sup']:
+            for wing in training[0][key].keys():
+                assert np.all(other[key][wing] == training[0][key][wing])
+
+    # the chunks hold whole Mach numbers and cover the grid
+    settings = vlm.settings
+    n_mach   = len(vlm.training.Mach)
+    n_aoa    = len(vlm.training.angle_of_attack)
+    chunks   = compute_training_chunks(n_mach,n_aoa,settings)
+    assert len(chunks) == n_mach
+    settings.memory_limit = 2**30
+    chunks   = compute_training_chunks(n_mach,n_aoa,settings)
+    assert len(chunks) == 2
+    assert chunks[0].start == 0 and chunks[-1].stop == n_mach*n_aoa
+    assert all(chunk.start % n_aoa == 0 for chunk in chunks)
+
+    # lifting line, serial and on two processes
+    training = []
+    for processes in [1,2]:
+        ll = SUAVE.Analyses.Aerodynamics.Lifting_Line()
+        ll.geometry = vehicle_setup()
+        for wing in ll.geometry.wings:
+            wing.aspect_ratio = wing.spans.projected**2 / wing.areas.reference
+        ll.settings.number_of_processes = processes
+        ll.initialize(True, False, None, None, False)
+        training.append(ll.training)
+
+    assert np.all(training[1].lift_coefficient == training[0].lift_coefficient)
+    assert np.all(training[1].drag_coefficient == training[0].drag_coefficient)
+    assert training[0].lift_coefficient.shape == training[0].angle_of_attack.shape
+    for wing in training[0].wing_lift_coefficients.keys():
+        assert np.all(training[1].wing_lift_coefficients[wing] == training[0].wing_lift_coefficients[wing])
+
+    # each wing keeps its own training data
+    wing_CLs = training[0].wing_lift_coefficients
+    assert np.any(wing_CLs.main_wing != wing_CLs.horizontal_stabilizer)
+
+    return
+
+if __name__ == '__main__':
+    main()
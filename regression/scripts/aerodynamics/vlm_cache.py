@@ -0,0 +1,200 @@
+# vlm_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks that the vortex lattice reuses its vortex distribution and Mach number influences
+    while the geometry is unchanged, and gives the same answer as computing everything anew,
+    in chunks of conditions, in single precision or solving each condition alone"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+import time
+
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_induced_velocity_matrix import compute_induced_velocity_matrix, sum_legs_on_wing
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    state = setup_state()
+
+    # the same analysis evaluated twice
+    vlm = setup_vlm(vehicle_setup())
+    VD  = vlm.settings.vortex_distribution
+    CL_first  = evaluate(vlm,state)
+
+    t0 = time.time()
+    CL_second = evaluate(vlm,state)
+    cached_time = time.time() - t0
+
+    assert vlm.settings.vortex_distribution is VD
+    assert len(VD.wing_influence) == len(np.unique(state.conditions.freestream.mach_number))
+    assert np.all(CL_first == CL_second)
+
+    # against a new analysis every time
+    t0 = time.time()
+    CL_new = evaluate(setup_vlm(vehicle_setup()),state)
+    new_time = time.time() - t0
+    print('cached evaluation: %.4f s, new analysis: %.4f s' % (cached_time, new_time))
+    assert np.all(CL_new == CL_second)
+
+    # a changed geometry is picked up
+    vlm.geometry.wings.main_wing.sweeps.quarter_chord = 10. * Units.deg
+    CL_swept = evaluate(vlm,state)
+    assert vlm.settings.vortex_distribution is not VD
+    assert np.max(np.abs(CL_swept - CL_second)) > 1e-3
+
+    vehicle = vehicle_setup()
+    vehicle.wings.main_wing.sweeps.quarter_chord = 10. * Units.deg
+    CL_swept_new = evaluate(setup_vlm(vehicle),state)
+    assert np.all(CL_swept == CL_swept_new)
+
+    # the cache keeps the Mach numbers in use, dropping older ones over its size
+    VD   = vlm.settings.vortex_distribution
+    n    = len(VD.wing_influence)
+    mach = np.array([[0.3],[0.3],[0.6]])
+    aoa  = np.zeros_like(mach)
+    compute_induced_velocity_matrix(VD,VD.n_sw,VD.n_cw,aoa,mach,cache_size=0)
+    assert len(VD.wing_influence) == 2
+    compute_induced_velocity_matrix(VD,VD.n_sw,VD.n_cw,aoa,mach)
+    assert len(VD.wing_influence) == 2
+
+    check_chunks(state)
+    check_wake(state)
+
+    return
+
+def check_chunks(state):
+
+    # the legs on the wing add up like the loop over panels they replaced
+    n_cw   = 4
+    np.random.seed(0)
+    legs   = np.random.rand(2,3,3*n_cw,3)
+    summed = np.zeros_like(legs)
+    for n in range(legs.shape[2]):
+        n_te_p = (n_cw-(n+1)%n_cw)
+        if (n+1)%n_cw != 0:
+            summed[:,:,n,:] = np.sum(legs[:,:,n+1:n+n_te_p,:],axis=2)
+    assert np.allclose(sum_legs_on_wing(legs,n_cw),summed,rtol=1e-14,atol=1e-14)
+
+    vlm = setup_vlm(vehicle_setup(),n_cw=4)
+    CL  = evaluate(vlm,state)
+
+    # one condition at a time
+    vlm = setup_vlm(vehicle_setup(),n_cw=4)
+    vlm.settings.memory_limit = 1
+    CL_chunked = evaluate(vlm,state)
+    assert np.all(CL_chunked == CL)
+
+    # single precision
+    vlm = setup_vlm(vehicle_setup(),n_cw=4)
+    vlm.settings.floating_point_precision = np.float32
+    CL_single = evaluate(vlm,state)
+    assert CL_single.dtype == np.float64
+    print('single precision CL difference:', np.max(np.abs(CL_single - CL)))
+    assert np.max(np.abs(CL_single - CL)) < 1e-5
+
+    return
+
+def check_wake(state):
+
+    # with the wake along the chord the angles of attack at a Mach number share one solve
+    vlm = setup_vlm(vehicle_setup())
+    vlm.settings.chord_aligned_wake = True
+    CL  = evaluate(vlm,state)
+
+    for i in range(len(CL)):
+        single = setup_state(1)
+        single.conditions.aerodynamics.angle_of_attack[:,0] = state.conditions.aerodynamics.angle_of_attack[i,0]
+        single.conditions.freestream.mach_number[:,0]       = state.conditions.freestream.mach_number[i,0]
+        CL_single = evaluate(vlm,single)
+        assert np.abs(CL_single[0,0] - CL[i,0]) < 1e-12
+
+    # and stays close to the freestream wake at small angles
+    CL_free = evaluate(setup_vlm(vehicle_setup()),state)
+    print('chord aligned wake CL difference:', np.max(np.abs(CL - CL_free)))
+    assert np.max(np.abs(CL - CL_free)) < 1e-2
+
+    return
+
+def evaluate(vlm,state):
+    vlm.evaluate(state,vlm.settings,vlm.geometry)
+    return state.conditions.aerodynamics.lift_coefficient.copy()
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup_state(n=8):
+
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(n)
+
+    state.conditions.aerodynamics.angle_of_attack[:,0] = np.linspace(-2.,8.,n) * Units.deg
+    state.conditions.freestream.mach_number[:,0]       = np.repeat([0.2,0.4,0.6,0.8],2)[:n]
+    state.conditions.freestream.velocity[:,0]          = 100.
+
+    return state
+
+def setup_vlm(vehicle,n_cw=2):
+
+    vlm = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    vlm.geometry = vehicle
+    vlm.initialize(False, False, 8, n_cw, False)
+
+    return vlm
+
+def vehicle_setup():
+
+    vehicle = SUAVE.Vehicle()
+    vehicle.tag = 'vlm_cache'
+    vehicle.reference_area = 30.
+    vehicle.mass_properties.center_of_gravity = [2.5, 0., 0.]
+
+    wing = SUAVE.Components.Wings.Main_Wing()
+    wing.tag                     = 'main_wing'
+    wing.spans.projected         = 15.
+    wing.chords.root             = 2.5
+    wing.chords.tip              = 1.5
+    wing.chords.mean_aerodynamic = 2.04
+    wing.taper                   = 0.6
+    wing.sweeps.quarter_chord    = 0.
+    wing.twists.root             = 2. * Units.deg
+    wing.twists.tip              = 0.
+    wing.dihedral                = 3. * Units.deg
+    wing.areas.reference         = 30.
+    wing.origin                  = [2., 0., 0.]
+    wing.aerodynamic_center      = [0.5, 0., 0.]
+    wing.symmetric               = True
+    wing.vertical                = False
+    vehicle.append_component(wing)
+
+    wing = SUAVE.Components.Wings.Horizontal_Tail()
+    wing.tag                     = 'horizontal_stabilizer'
+    wing.spans.projected         = 5.
+    wing.chords.root             = 1.2
+    wing.chords.tip              = 0.8
+    wing.chords.mean_aerodynamic = 1.01
+    wing.taper                   = 0.67
+    wing.sweeps.quarter_chord    = 10. * Units.deg
+    wing.twists.root             = 0.
+    wing.twists.tip              = 0.
+    wing.areas.reference         = 5.
+    wing.origin                  = [9., 0., 0.5]
+    wing.aerodynamic_center      = [0.25, 0., 0.]
+    wing.symmetric               = True
+    wing.vertical                = False
+    vehicle.append_component(wing)
+
+    return vehicle
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+# lookup_table.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+""" checks the lookup table of the US 1976 standard atmosphere against the analytic
+    evaluation and times both"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+import time
+from copy import deepcopy
+
+from SUAVE.Core import Units
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    keys       = ['pressure','temperature','density','speed_of_sound','dynamic_viscosity']
+
+    # a dense sweep of the model, with every break and an offset from the standard day
+    z_breaks = atmosphere.breaks.altitude
+    z        = np.linspace(-2.,84.852,100001) * Units.km
+    z        = np.concatenate([z,z_breaks])
+    Rad      = atmosphere.planet.mean_radius
+    z        = z/(1. - z/Rad) # geopotential to geometric, so the breaks are hit
+    truth    = atmosphere.compute_values(z,10.)
+
+    # the analytic values at the breaks
+    p_breaks = truth.pressure[-len(z_breaks):,0]
+    assert np.all(np.abs(p_breaks[:-1]/atmosphere.breaks.pressure[:-1] - 1.) < 1e-12)
+
+    atmosphere.settings.lookup_table = True
+    for tolerance in [1e-4,1e-6,1e-9,1e-12]:
+        atmosphere.settings.lookup_table_tolerance = tolerance
+        values = atmosphere.compute_values(z,10.)
+        errors = [np.max(np.abs(values[key]/truth[key] - 1.)) for key in keys]
+        print('tolerance %.0e, %d intervals, largest relative errors:' % (tolerance,len(atmosphere.lookup_table.altitude)-1),
+              ' '.join(['%.2e' % error for error in errors]))
+
+        assert errors[0] <= tolerance
+        assert errors[2] <= tolerance*(1. + 1e-3)
+        assert np.all(values.temperature == truth.temperature)
+
+    # the values of an earlier call are filled in place
+    atmosphere.settings.lookup_table_tolerance = 1e-6
+    z_mission = np.linspace(0.,12.,64)[:,None] * Units.km
+    atmo_data = atmosphere.compute_values(z_mission)
+    pressure  = atmo_data.pressure
+    values    = atmosphere.compute_values(z_mission + 100.,atmo_data=atmo_data)
+    assert values is atmo_data and values.pressure is pressure
+    assert np.all(values.pressure == atmosphere.compute_values(z_mission + 100.).pressure)
+    values    = atmosphere.compute_values(z_mission[:10],atmo_data=atmo_data)
+    assert values is not atmo_data and len(values.pressure) == 10
+
+    # the table follows changes of the properties it is built from
+    for change in ['planet','fluid_properties','breaks']:
+        changed = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+        changed.settings.lookup_table = True
+        changed.compute_values(z_mission)
+        if change == 'planet':
+            changed.planet = SUAVE.Attributes.Planets.Earth()
+            changed.planet.sea_level_gravity = 9.7
+        elif change == 'fluid_properties':
+            changed.fluid_properties = SUAVE.Attributes.Gases.Air()
+            changed.fluid_properties.gas_specific_constant = 290.
+        else:
+            changed.breaks = deepcopy(changed.breaks)
+            changed.breaks.pressure = changed.breaks.pressure * 1.01
+        values = changed.compute_values(z_mission)
+        changed.settings.lookup_table = False
+        exact  = changed.compute_values(z_mission)
+        assert np.max(np.abs(values.pressure/exact.pressure - 1.)) <= 1e-6
+
+    # benchmark on the points of a mission segment
+    repetitions = 1000
+    for lookup_table in [False,True]:
+        atmosphere.settings.lookup_table = lookup_table
+        t0 = time.time()
+        for i in range(repetitions):
+            atmosphere.compute_values(z_mission)
+        print('lookup table %s: %.1f us per call' % (lookup_table,(time.time()-t0)/repetitions*1e6))
+
+    return
+
+if __name__ == '__main__':
+    main()
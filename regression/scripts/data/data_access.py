@@ -0,0 +1,242 @@
+# data_access.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks the attribute access and packing of Data() and times them against the implementations they replaced"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+import timeit
+from copy import deepcopy
+
+from SUAVE.Core import Data
+from SUAVE.Analyses.Mission.Segments.Conditions import Aerodynamics
+from SUAVE.Analyses.Mission.Segments.Conditions.State import State, Container
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_access()
+    check_packing()
+    check_conditions()
+
+    # a small mission like state
+    conditions = Aerodynamics()
+    conditions.expand_rows(16)
+    legacy = Legacy_Data()
+    legacy.freestream = Legacy_Data()
+    legacy.freestream.velocity = np.ones((16,1))
+
+    number = 20000
+    timings = Data()
+    timings.key_get       = time_it(lambda: conditions.freestream.velocity, lambda: legacy.freestream.velocity, number)
+    timings.method_get    = time_it(lambda: conditions.freestream.keys, lambda: legacy.freestream.keys, number)
+    timings.key_set       = time_it(lambda: setattr(conditions.freestream,'velocity',1.), lambda: setattr(legacy.freestream,'velocity',1.), number)
+    timings.instantiation = time_it(Aerodynamics, Legacy_Aerodynamics, number//20)
+
+    # unknowns like a cruise segment's
+    unknowns = Data()
+    legacy   = Data()
+    for key in ['throttle','body_angle','propeller_power_coefficient','battery_voltage_under_load']:
+        unknowns[key] = np.ones((16,1))
+        legacy[key]   = np.ones((16,1))
+    vector = unknowns.pack_array()
+    timings.pack          = time_it(unknowns.pack_array, lambda: legacy_pack_array(legacy), number)
+    timings.unpack        = time_it(lambda: unknowns.unpack_array(vector), lambda: legacy_unpack_array(legacy,vector), number)
+
+    for key, (new, old) in timings.items():
+        print('%-14s %8.3f us  legacy %8.3f us  speedup %5.2f' % (key, new*1e6, old*1e6, old/new))
+
+    return
+
+def check_access():
+
+    data = Data()
+    data.x = 1.
+    data['y'] = 2.
+    assert data.x == 1. and data['x'] == 1. and data.y == 2.
+
+    # methods are still found, keys win over methods
+    assert callable(data.pack_array)
+    data.keys_copy = data.keys
+    assert data.keys_copy() == data.keys()
+
+    # missing names raise AttributeError
+    try:
+        data.missing
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError('missing attribute did not raise')
+
+    del data.x
+    assert 'x' not in data
+
+    # class attributes stay object attributes
+    conditions = Aerodynamics()
+    conditions._size = 4
+    assert '_size' not in conditions
+    assert conditions.ones_row(2).shape == (4,2)
+
+    # defaults are filled trunk to leaf
+    assert 'freestream' in conditions and 'aerodynamics' in conditions and 'frames' in conditions
+
+    return
+
+def check_packing():
+
+    data = Data()
+    data.a       = np.arange(6.).reshape((3,2))
+    data.b       = Data()
+    data.b.c     = np.arange(3.)
+    data.b.s     = 2.
+    data.b.tag   = 'skipped'
+    data.b.cube  = np.zeros((2,2,2))
+
+    # fortran order, scalars and vectors, the rest skipped
+    truth  = np.array([0.,2.,4.,1.,3.,5.,0.,1.,2.,2.])
+    packed = data.pack_array()
+    assert np.all(packed == truth)
+    assert np.all(data.pack_array() == truth)
+
+    # arrays are unpacked in place
+    a = data.a
+    data.unpack_array(packed + 1.)
+    assert data.a is a
+    assert np.all(data.a == truth[:6].reshape((3,2),order='F') + 1.)
+    assert data.b.s == 3.
+
+    # the layout follows changes to the data
+    data.b.d = np.ones((3,1))
+    assert len(data.pack_array()) == 13
+    data.a = data.a.astype(complex)
+    assert data.pack_array().dtype == complex
+    del data.b.d
+    data.a = np.zeros((4,2))
+    assert len(data.pack_array()) == 12
+
+    # the packed vector is a new array every time
+    assert data.pack_array() is not data.pack_array()
+
+    # copies get their own layout
+    copied = deepcopy(data)
+    copied.unpack_array(np.ones(12))
+    assert np.all(data.a == 0.)
+    assert np.all(copied.a == 1.)
+
+    # empty arrays take no room in the vector
+    empty = Data()
+    empty.a = np.ones((3,1))
+    empty.b = np.zeros((0,1))
+    empty.c = 2.*np.ones(2)
+    packed = empty.pack_array()
+    assert np.all(packed == np.array([1.,1.,1.,2.,2.]))
+    empty.unpack_array(packed + 1.)
+    assert np.all(empty.c == 3.)
+    assert empty.b.shape == (0,1)
+
+    return
+
+def check_conditions():
+
+    conditions = Aerodynamics()
+    conditions.frames.inertial.time = np.array([[2.]])
+    conditions.expand_rows(4)
+
+    # the expanded arrays are columns of one buffer
+    velocity = conditions.freestream.velocity
+    time     = conditions.frames.inertial.time
+    assert velocity.shape == (4,1) and time.shape == (4,1)
+    assert np.all(time == 2.)
+    assert velocity.base is time.base and velocity.base is not None
+    assert conditions.frames._size == 4
+
+    # merging stacks the rows like appending them one by one
+    states = []
+    for rows in [3,5]:
+        state = State()
+        state.conditions.update(Aerodynamics())
+        state.expand_rows(rows)
+        state.conditions.frames.inertial.time[:,0] = np.arange(rows)
+        states.append(state)
+
+    container = Container()
+    container.segments.first  = states[0]
+    container.segments.second = states[1]
+    merged = container.merged()
+
+    time = merged.conditions.frames.inertial.time
+    assert time.shape == (8,1)
+    assert np.all(time[:,0] == [0.,1.,2.,0.,1.,2.,3.,4.])
+    assert list(merged.conditions.keys()) == [k for k in states[0].conditions.keys() if k != 'tag']
+    assert isinstance(merged.conditions.frames, type(states[0].conditions.frames))
+
+    return
+
+def time_it(new, old, number):
+    return timeit.timeit(new,number=number)/number, timeit.timeit(old,number=number)/number
+
+# ----------------------------------------------------------------------
+#   Reference Implementation
+# ----------------------------------------------------------------------
+
+class Legacy_Data(Data):
+    """ Data() with the exception driven attribute access it used to have """
+
+    def __getattribute__(self, k):
+        try:
+            return dict.__getitem__(self,k)
+        except:
+            return object.__getattribute__(self,k)
+
+    def __setattr__(self, k, v):
+        try:
+            object.__getattribute__(self, k)
+        except:
+            self[k] = v
+        else:
+            object.__setattr__(self, k, v)
+
+def legacy_pack_array(data):
+    """ Packs a flat Data() of arrays like pack_array did before the layout, without its recursion and type checks """
+
+    M = []
+    for v in data.values():
+        try:
+            rank = v.ndim
+        except:
+            rank = 0
+        M.append(np.atleast_2d(v).ravel(order='F'))
+    return np.hstack(M)
+
+def legacy_unpack_array(data,M):
+    """ Unpacks a flat Data() of 2D arrays like unpack_array did before the layout, without its recursion and type checks """
+
+    index = 0
+    for k,v in data.items():
+        try:
+            rank = v.ndim
+        except:
+            rank = 0
+        n,m = v.shape
+        data[k][:,:] = np.reshape(M[index:(index+(n*m))],[n,m],order='F')
+        index += n*m
+    return data
+
+def Legacy_Aerodynamics():
+    """ Builds Aerodynamics() conditions walking every __defaults__ of the class chain """
+
+    self = dict.__new__(Aerodynamics)
+    for klass in self.get_bases()[::-1]:
+        klass.__defaults__(self)
+    return self
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,7 @@
 # 
 # Created:  Feb 2015, A. Variyar
 # Modified: Sep 2018, W. Maier
-#        
+#           Oct 2026, SUAVE Team
 
 """ create and evaluate a gas turbine network
 """
@@ -26,6 +26,8 @@ Data, Container,
 from SUAVE.Components import Component, Physical_Component, Lofted_Body
 from SUAVE.Components.Energy.Networks.Turbofan import Turbofan
 from SUAVE.Methods.Propulsion.turbofan_sizing import turbofan_sizing
+from SUAVE.Methods.Propulsion.turbofan_cycle import can_evaluate_turbofan_cycle
+from SUAVE.Methods.Propulsion.turbofan_emission_index import turbofan_emission_index
 
 # ----------------------------------------------------------------------
 #   Main
@@ -319,6 +321,46 @@ def energy_network():
     
     for k,v in list(error.items()):
         assert(np.abs(v)<1e-6)    
+        
+    # the one pass cycle gives the results of the components linked one by one
+    assert can_evaluate_turbofan_cycle(turbofan)
+    # and leaves the combustor and thrust outputs read after the network is evaluated, as the
+    # emission index and the sweeps of Input_Output.PostProcess do
+    component_outputs = [turbofan.combustor.inputs, turbofan.combustor.outputs, turbofan.thrust.outputs]
+    read_outputs      = ['stagnation_temperature','stagnation_pressure','thrust','thrust_specific_fuel_consumption',
+                         'specific_impulse','power','fuel_flow_rate','core_mass_flow_rate','fuel_to_air_ratio']
+    for state in [state_sizing, state_off_design]:
+        turbofan.fused_cycle = False
+        results_components   = turbofan(state)
+        acoustic_components  = copy.deepcopy(state.conditions.propulsion.acoustic_outputs)
+        outputs_components   = copy.deepcopy(component_outputs)
+        for outputs in component_outputs:
+            for key in read_outputs:
+                if key in outputs:
+                    outputs[key] = 0.
+        turbofan.fused_cycle = True
+        results_fused        = turbofan(state)
+        acoustic_fused       = state.conditions.propulsion.acoustic_outputs
+        
+        assert np.all(results_fused.thrust_force_vector == results_components.thrust_force_vector)
+        assert np.all(results_fused.vehicle_mass_rate   == results_components.vehicle_mass_rate)
+        for stream in ['core','fan']:
+            for key in acoustic_components[stream].keys():
+                assert np.all(acoustic_fused[stream][key] == acoustic_components[stream][key])
+        for outputs, outputs_fused in zip(outputs_components,component_outputs):
+            for key in read_outputs:
+                if key in outputs:
+                    assert np.all(outputs_fused[key] == outputs[key])
+    
+    # the emission index reads the combustor of the off design state
+    state_off_design.numerics.time           = Data()
+    state_off_design.numerics.time.integrate = np.array([[1.]])
+    state_off_design.conditions.weights.vehicle_mass_rate = results_fused.vehicle_mass_rate
+    emissions = turbofan_emission_index(turbofan,state_off_design)
+    turbofan.fused_cycle = False
+    emissions_components = turbofan_emission_index(turbofan,state_off_design)
+    turbofan.fused_cycle = True
+    assert np.all(emissions.total.NOx == emissions_components.total.NOx)
     
     return
     
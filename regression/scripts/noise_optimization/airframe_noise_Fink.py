@@ -0,0 +1,105 @@
+# airframe_noise_Fink.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression and timing of the Fink airframe noise over a climb segment
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+import time
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_Fink
+
+from jet_noise_SAE import setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    turbofan, noise_segment, config, analyses = setup()
+    config = configs_setup()
+
+    ti = time.time()
+    EPNL, SPL_history, SENEL = noise_airframe_Fink(config,analyses,noise_segment)
+    tf = time.time()
+
+    print('Fink airframe noise of ' + str(SPL_history.shape[0]) + ' positions in ' + str(tf-ti) + ' s')
+    print('EPNL  = ' + str(EPNL))
+    print('SENEL = ' + str(SENEL))
+
+    # values of the model run one position at a time
+    EPNL_true  = 90.85118100544419
+    SPL_true   = 63.056047422740164
+    SENEL_true = 84.6732733316624
+
+    assert(SPL_history.shape == (68,24))
+    assert(np.all(SPL_history[-1] == 0.))
+    assert(np.abs((EPNL - EPNL_true)/EPNL_true) < 1e-6)
+    assert(np.abs((SPL_history[30,10] - SPL_true)/SPL_true) < 1e-6)
+    assert(np.abs((SENEL - SENEL_true)/SENEL_true) < 1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Configuration
+# ----------------------------------------------------------------------
+
+def configs_setup():
+
+    # Boeing 737 with the flaps and the landing gear down
+    config     = Data()
+    config.tag = 'landing'
+    config.wings = Data()
+
+    wing = Data()
+    wing.areas              = Data()
+    wing.spans              = Data()
+    wing.areas.reference    = 124.862
+    wing.spans.projected    = 34.32
+    wing.control_surfaces   = Data()
+
+    flap = Data()
+    flap.deflection         = 30. * Units.deg
+    flap.area               = 14.
+    flap.chord_dimensional  = 1.3
+    flap.configuration_type = 'double_slotted'
+    wing.control_surfaces.flap = flap
+    config.wings.main_wing     = wing
+
+    wing = Data()
+    wing.areas              = Data()
+    wing.spans              = Data()
+    wing.areas.reference    = 32.488
+    wing.spans.projected    = 14.2
+    config.wings.horizontal_stabilizer = wing
+
+    wing = Data()
+    wing.areas              = Data()
+    wing.spans              = Data()
+    wing.areas.reference    = 27.316
+    wing.spans.projected    = 7.777
+    config.wings.vertical_stabilizer = wing
+
+    landing_gear = Data()
+    landing_gear.main_tire_diameter = 1.12000 * Units.m
+    landing_gear.nose_tire_diameter = 0.6858 * Units.m
+    landing_gear.main_strut_length  = 1.8 * Units.m
+    landing_gear.nose_strut_length  = 1.3 * Units.m
+    landing_gear.main_units         = 2
+    landing_gear.nose_units         = 1
+    landing_gear.main_wheels        = 2
+    landing_gear.nose_wheels        = 2
+    landing_gear.gear_condition     = 'down'
+    config.landing_gear = landing_gear
+
+    return config
+
+if __name__ == '__main__':
+    main()
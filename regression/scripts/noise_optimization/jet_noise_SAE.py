@@ -0,0 +1,93 @@
+# jet_noise_SAE.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression and timing of the SAE jet noise of a turbofan over a climb segment
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+import time
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_geometric
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    turbofan, noise_segment, config, analyses = setup()
+
+    ti = time.time()
+    EPNL, SPL_history, SENEL = noise_SAE(turbofan,noise_segment,config,analyses)
+    tf = time.time()
+
+    print('SAE jet noise of ' + str(SPL_history.shape[0]) + ' positions in ' + str(tf-ti) + ' s')
+    print('EPNL  = ' + str(EPNL))
+    print('SENEL = ' + str(SENEL))
+
+    # values of the model run one position and one frequency band at a time
+    EPNL_true  = 92.55228423688611
+    SPL_true   = 57.30293273492052
+    SENEL_true = 87.86662381493323
+
+    assert(SPL_history.shape == (68,24))
+    assert(np.abs((EPNL - EPNL_true)/EPNL_true) < 1e-6)
+    assert(np.abs((SPL_history[30,10] - SPL_true)/SPL_true) < 1e-6)
+    assert(np.abs((SENEL - SENEL_true)/SENEL_true) < 1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup():
+
+    # climb of the noise optimization
+    results       = SUAVE.Input_Output.SUAVE.load('sideline.res')
+    noise_segment = results.segments.climb
+
+    # turbofan of the Boeing 737 at takeoff
+    turbofan = Data()
+    turbofan.core_nozzle             = Data()
+    turbofan.fan_nozzle              = Data()
+    turbofan.fan                     = Data()
+    turbofan.core_nozzle.noise_speed = 415.
+    turbofan.fan_nozzle.noise_speed  = 315.
+    turbofan.fan.rotation            = 3470.
+    turbofan.design_thrust           = 52700. * Units.N
+    turbofan.core_nozzle_diameter    = 0.92
+    turbofan.fan_nozzle_diameter     = 1.659
+    turbofan.engine_height           = 0.5
+    turbofan.exa                     = 1
+    turbofan.plug_diameter           = 0.1
+    turbofan.geometry_xe             = 1.
+    turbofan.geometry_ye             = 1.
+    turbofan.geometry_Ce             = 2.
+
+    config     = Data()
+    config.tag = 'takeoff'
+
+    # microphone under the flight path, as for the approach
+    analyses = Data()
+    analyses.atmosphere     = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    analyses.noise          = Data()
+    analyses.noise.settings = Data()
+    analyses.noise.settings.sideline       = 0
+    analyses.noise.settings.flyover        = 0
+    analyses.noise.settings.approach       = 1
+    analyses.noise.settings.mic_x_position = 0
+
+    noise_geometric(noise_segment,analyses,config)
+
+    return turbofan, noise_segment, config, analyses
+
+if __name__ == '__main__':
+    main()
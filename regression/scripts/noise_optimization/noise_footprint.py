@@ -0,0 +1,85 @@
+# noise_footprint.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression and timing of the noise footprint of a climb segment on a grid of microphones
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+import time
+from SUAVE.Methods.Noise.Fidelity_One import noise_footprint
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_Fink
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_counterplot
+
+from jet_noise_SAE import setup
+from airframe_noise_Fink import configs_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    turbofan, noise_segment, config, analyses = setup()
+    config = configs_setup()
+
+    analyses.noise = SUAVE.Analyses.Noise.Fidelity_One()
+    settings = analyses.noise.settings
+    settings.footprint_x_positions         = np.linspace(-500.,3500.,9)
+    settings.footprint_lateral_positions   = np.linspace(0.,900.,4)
+    settings.footprint_observers_per_shard = 10
+
+    ti = time.time()
+    footprint = noise_footprint(config,analyses,noise_segment,turbofan)
+    tf = time.time()
+
+    print('Noise footprint of ' + str(footprint.EPNL.size) + ' microphones in ' + str(tf-ti) + ' s')
+    print('EPNL  = ' + str(footprint.EPNL))
+
+    assert(footprint.EPNL.shape == (9,4))
+    assert(footprint.SENEL.shape == (9,4))
+
+    # the footprint at a microphone is the noise of the single microphone tools
+    for i, j in [(3,1),(0,0),(8,3)]:
+        analyses.mic_array = [footprint.x_positions[i,j],0.,footprint.lateral_positions[i,j]]
+        noise_counterplot(noise_segment,analyses,config)
+
+        EPNL_airframe, _, SENEL_airframe = noise_airframe_Fink(config,analyses,noise_segment)
+        EPNL_engine,   _, SENEL_engine   = noise_SAE(turbofan,noise_segment,config,analyses)
+        EPNL_total = 10. * np.log10(10**(EPNL_airframe/10) + 10**(EPNL_engine/10))
+
+        assert(np.abs(footprint.airframe.EPNL[i,j]  - EPNL_airframe)  < 1e-8)
+        assert(np.abs(footprint.airframe.SENEL[i,j] - SENEL_airframe) < 1e-8)
+        assert(np.abs(footprint.engine.EPNL[i,j]    - EPNL_engine)    < 1e-8)
+        assert(np.abs(footprint.engine.SENEL[i,j]   - SENEL_engine)   < 1e-8)
+        assert(np.abs(footprint.EPNL[i,j]           - EPNL_total)     < 1e-8)
+
+    # the shards give the same map on a pool of processes
+    settings.number_of_processes = 2
+
+    ti = time.time()
+    parallel_footprint = noise_footprint(config,analyses,noise_segment,turbofan)
+    tf = time.time()
+
+    print('Noise footprint on 2 processes in ' + str(tf-ti) + ' s')
+
+    assert(np.all(parallel_footprint.EPNL  == footprint.EPNL))
+    assert(np.all(parallel_footprint.SENEL == footprint.SENEL))
+
+    # without the turbofan only the airframe is heard
+    settings.number_of_processes = 1
+    airframe_footprint = noise_footprint(config,analyses,noise_segment)
+
+    assert(np.all(airframe_footprint.EPNL == footprint.airframe.EPNL))
+    assert(np.all(airframe_footprint.engine.EPNL == 0.))
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# noise_metrics.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression of the EPNL and SENEL of SPL time histories given all at once and a chunk of time steps at a time
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE_source, noise_SAE_spectra
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import pnl_noise, noise_tone_correction, epnl_noise, senel_noise
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import dbA_noise, Noise_Metrics_Accumulator
+
+from jet_noise_SAE import setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # a flyover with a tone in two bands, values of the model run one time step and one band at a time
+    levels = 90. - np.abs(np.arange(40)-25.)
+    SPL    = np.ones((40,24))*levels[:,None]
+    SPL[:,12] += 8.
+    SPL[:,5]  += 4.
+
+    tone_true  = 2.2222222222222237
+    EPNL_true  = 113.37939611260146
+    SENEL_true = 106.20465938199239
+
+    PNLT  = pnl_noise(SPL) + noise_tone_correction(SPL)
+    EPNL  = epnl_noise(PNLT)
+    SENEL = senel_noise(np.max(dbA_noise(SPL),axis=1))
+
+    assert(np.abs((noise_tone_correction(SPL)[25] - tone_true)/tone_true) < 1e-6)
+    assert(np.abs((EPNL - EPNL_true)/EPNL_true) < 1e-6)
+    assert(np.abs((SENEL - SENEL_true)/SENEL_true) < 1e-6)
+
+    # the jet of the climb of the noise optimization heard at microphones along the path
+    turbofan, noise_segment, config, analyses = setup()
+    source = noise_SAE_source(turbofan,noise_segment,analyses)
+    time   = noise_segment.conditions.frames.inertial.time[:,0]
+    dist   = np.interp(source.time,time,noise_segment.dist)
+    theta  = np.interp(source.time,time,noise_segment.theta)
+
+    shifts  = [0,10,20,30,40]
+    spectra = noise_SAE_spectra(source,np.array([np.roll(dist,k) for k in shifts]),np.array([np.roll(theta,k) for k in shifts]))
+
+    PNLT  = pnl_noise(spectra.total) + noise_tone_correction(spectra.total)
+    EPNL  = epnl_noise(PNLT)
+    SENEL = senel_noise(np.max(spectra.dBA,axis=-1))
+
+    # EPNL and SENEL of noise_SAE at the microphone of the setup
+    assert(np.abs((EPNL[0]  - 92.55228423688611)/92.55228423688611) < 1e-6)
+    assert(np.abs((SENEL[0] - 87.86662381493323)/87.86662381493323) < 1e-6)
+
+    # each history on its own gives the same levels
+    for i in range(len(shifts)):
+        assert(np.all(pnl_noise(spectra.total[i]) + noise_tone_correction(spectra.total[i]) == PNLT[i]))
+        assert(epnl_noise(PNLT[i]) == EPNL[i])
+
+    # the accumulator gives the same metrics whatever the chunks
+    for chunk in [1,7,68]:
+        accumulator = Noise_Metrics_Accumulator()
+        for k in range(0,spectra.total.shape[1],chunk):
+            accumulator.append(spectra.total[:,k:k+chunk],spectra.dBA[:,k:k+chunk])
+
+        print('Chunks of ' + str(chunk) + ' steps, ' + str(accumulator.PNLT.history.shape[-1]) + ' steps of PNLT kept')
+
+        assert(accumulator.number_of_steps == spectra.total.shape[1])
+        assert(np.all(accumulator.EPNL()  == EPNL))
+        assert(np.all(accumulator.SENEL() == SENEL))
+
+    # a single history drops the steps before its peak
+    accumulator = Noise_Metrics_Accumulator()
+    for k in range(0,40,4):
+        accumulator.append(SPL[k:k+4])
+
+    assert(accumulator.PNLT.history.shape[-1] < 40)
+    assert(accumulator.EPNL()  == EPNL_true)
+    assert(accumulator.SENEL() == SENEL_true)
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# alias_paths.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks that the aliases resolved once into paths set and retrieve the values set_values and
+    get_values do, and times both"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+import SUAVE.Optimization.helper_functions as help_fun
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    aliases = [
+        [ 'wing_area'        , ['vehicle_configurations.*.wings.main_wing.areas.reference',
+                                'summary.reference_area' ]                                   ],
+        [ 'wing_location'    , 'vehicle_configurations.*.wings.main_wing.origin[0]'          ],
+        [ 'wing_height'      , 'vehicle_configurations.base.wings.main_wing.origin[2]'       ],
+        [ 'flap_angle'       , 'vehicle_configurations.takeoff.wings.main_wing.flap'         ],
+        [ 'fuel_margin'      , 'summary.fuel_margin'                                         ],
+        [ 'last_throttle'    , 'summary.throttle[-1]'                                        ],
+        [ 'total_margin'     , 'summary.margins.sum()'                                       ],
+    ]
+
+    inputs = np.array([
+        [ 'wing_area'     ,  95. , (  90. , 130. ) , 100. , Units.meter**2 ],
+        [ 'wing_location' ,  10. , (   5. ,  15. ) ,  10. , Units.meter    ],
+        [ 'wing_height'   ,  -1. , (  -2. ,   0. ) ,   1. , Units.meter    ],
+        [ 'flap_angle'    ,  10. , (   0. ,  20. ) ,  10. , Units.degrees  ],
+    ],dtype=object)
+
+    constraints = np.array([
+        [ 'fuel_margin'   , '>' , 0. , 1. , Units.less ],
+        [ 'last_throttle' , '<' , 1. , 1. , Units.less ],
+        [ 'total_margin'  , '>' , 0. , 1. , Units.less ],
+        [ 'wing_height'   , '<' , 0. , 1. , Units.less ],
+    ],dtype=object)
+
+    # set the inputs both ways
+    converted_values = help_fun.convert_values(inputs)
+    old = problem_setup()
+    new = problem_setup()
+    help_fun.set_values(old,inputs,converted_values,aliases)
+    paths = help_fun.compile_input_paths(new,inputs,aliases)
+    help_fun.set_path_values(new,paths,converted_values)
+
+    assert len(paths[0]) == 4 and len(paths[1]) == 3
+    for config in ['base','takeoff','landing']:
+        wing = new.vehicle_configurations[config].wings.main_wing
+        assert wing.areas.reference == old.vehicle_configurations[config].wings.main_wing.areas.reference == 95.
+        assert np.all(wing.origin == old.vehicle_configurations[config].wings.main_wing.origin)
+    assert new.summary.reference_area == old.summary.reference_area == 95.
+    assert new.vehicle_configurations.base.wings.main_wing.origin[2] == -1.
+    assert new.vehicle_configurations.takeoff.wings.main_wing.flap == old.vehicle_configurations.takeoff.wings.main_wing.flap
+
+    # retrieve the constraints both ways
+    paths  = help_fun.compile_output_paths(constraints,aliases)
+    values = help_fun.get_path_values(new,paths)
+    assert np.all(values == help_fun.get_values(old,constraints,aliases))
+    assert np.all(values == [0.2,0.9,3.,-1.])
+
+    # every alias needs to be there
+    try:
+        help_fun.compile_output_paths(np.array([['missing','>',0.,1.,Units.less]],dtype=object),aliases)
+        assert False
+    except KeyError:
+        pass
+
+    # time many aliased constraints
+    n           = 200
+    aliases     = [['margin_%d' % ii,'summary.fuel_margin'] for ii in range(n)]
+    constraints = np.array([['margin_%d' % ii,'>',0.,1.,Units.less] for ii in range(n)],dtype=object)
+    paths       = help_fun.compile_output_paths(constraints,aliases)
+    times       = []
+    for retrieve in [lambda: help_fun.get_values(new,constraints,aliases),
+                     lambda: help_fun.get_path_values(new,paths)]:
+        t0 = time.time()
+        for ii in range(20):
+            retrieve()
+        times.append((time.time() - t0)/20)
+    print('%d constraints: %.2f ms with get_values, %.3f ms with paths' % (n,times[0]*1e3,times[1]*1e3))
+    assert np.all(help_fun.get_path_values(new,paths) == help_fun.get_values(new,constraints,aliases))
+
+    return
+
+def problem_setup():
+
+    dictionary = Data()
+    dictionary.vehicle_configurations = Data()
+    for config in ['base','takeoff','landing']:
+        wing = Data()
+        wing.areas = Data()
+        wing.areas.reference = 100.
+        wing.origin = np.array([12.,0.,-0.5])
+        wing.flap   = 0.
+        dictionary.vehicle_configurations[config] = Data()
+        dictionary.vehicle_configurations[config].wings = Data()
+        dictionary.vehicle_configurations[config].wings.main_wing = wing
+
+    dictionary.summary = Data()
+    dictionary.summary.fuel_margin    = 0.2
+    dictionary.summary.throttle       = np.array([0.8,1.,0.9])
+    dictionary.summary.margins        = np.array([1.,2.])
+    dictionary.summary.reference_area = 0.
+
+    return dictionary
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+# evaluation_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+""" checks that the evaluation cache of a nexus gives the values of the points it keeps
+    without running them again"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+import numpy as np
+import SUAVE.Optimization.Package_Setups.scipy_setup as scipy_setup
+import os, sys
+
+from optimization_packages import setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    constraints = np.array([
+        [ 'x1' , '>', -10., 1., Units.less],
+        [ 'x1' , '=',   0., 1., Units.less],
+        [ 'x2' , '>',   1., 1., Units.less],
+        [ 'x2' , '<',   2., 1., Units.less],
+    ])
+
+    # points an optimizer comes back to are only run once
+    problem = setup('SLSQP')
+    problem.optimization_problem.constraints = constraints
+    cache   = problem.evaluation_cache
+    cache.size = 2
+
+    x_a = np.array([ 0.5,1.5])
+    x_b = np.array([-0.5,1.2])
+    x_c = np.array([ 0.1,1.1])
+    obj_a = problem.objective(x_a)
+    con_a = problem.all_constraints(x_a)
+    obj_b = problem.objective(x_b)
+    assert np.all(problem.objective(x_a)       == obj_a)
+    assert np.all(problem.all_constraints(x_a) == con_a)
+    assert np.all(problem.inequality_constraint(x_a) == [ 10.5,0.5,0.5])
+    assert np.all(problem.equality_constraint(x_a)   == [0.5])
+    assert problem.evaluation_count == 2
+    assert cache.hits == 5 and cache.misses == 2
+
+    # the least recently used point is dropped past the size
+    problem.objective(x_c)
+    problem.objective(x_a)
+    problem.objective(x_b)
+    assert problem.evaluation_count == 4
+    assert len(cache.entries) == 2
+
+    # a point within the tolerance is a hit, a different fidelity is not
+    cache.tolerance = 1e-6
+    problem.objective(x_b + 1e-7)
+    assert problem.evaluation_count == 4
+    problem.fidelity_level = 2
+    problem.objective(x_b)
+    assert problem.evaluation_count == 5
+    problem.fidelity_level = 1
+
+    # forcing the evaluation skips the cache
+    problem.force_evaluate = True
+    problem.objective(x_b)
+    assert problem.evaluation_count == 6
+    problem.force_evaluate = False
+
+    # of several points within the tolerance the nearest is used
+    obj_b    = problem.objective(x_b)
+    obj_near = problem.objective(x_b + 5e-4)
+    assert problem.evaluation_count == 7
+    cache.tolerance = 1e-3
+    assert problem.objective(x_b + 4e-4) == obj_near != obj_b
+    assert problem.evaluation_count == 7
+    cache.tolerance = 1e-6
+
+    cache.clear()
+    assert cache.hits == 0 and len(cache.entries) == 0
+
+    # the points of the finite differences are looked up exactly, a tolerance as large as the step
+    # would give them the values of the point itself
+    gradients = []
+    for size, tolerance in [(0,0.),(100,0.),(100,1e-6)]:
+        problem = setup('SLSQP')
+        problem.optimization_problem.constraints = constraints
+        problem.evaluation_cache.size      = size
+        problem.evaluation_cache.tolerance = tolerance
+        problem.objective(x_a)
+        gradients.append(problem.finite_difference(x_a))
+
+    for grad_obj, jac_con in gradients[1:]:
+        assert np.all(grad_obj == gradients[0][0])
+        assert np.all(jac_con  == gradients[0][1])
+    assert np.all(gradients[2][0] != 0.)
+
+    # the same optimization with and without the cache
+    outputs  = []
+    for size in [0,100]:
+        problem = setup('SLSQP')
+        problem.optimization_problem.constraints = constraints
+        problem.evaluation_cache.size = size
+        sys.stdout = open(os.devnull,'w')
+        outputs.append(scipy_setup.SciPy_Solve(problem, solver='SLSQP' , sense_step = 1.4901161193847656e-08))
+        sys.stdout = sys.__stdout__
+        cache = problem.evaluation_cache
+        print('cache size %d: %d evaluations, %d hits, %d misses' % (size,problem.evaluation_count,cache.hits,cache.misses))
+
+    assert np.all(outputs[0] == outputs[1])
+    assert np.isclose(outputs[1][0],0,atol=1e-2)
+    assert np.isclose(outputs[1][1],1,atol=1e-2)
+
+    return
+
+if __name__ == '__main__':
+    main()
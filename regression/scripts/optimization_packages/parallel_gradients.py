@@ -0,0 +1,69 @@
+# parallel_gradients.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+""" checks that the finite difference gradients of a nexus are the same on a pool of processes
+    and that central differences are second order"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+import numpy as np
+
+from optimization_packages import setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    x = np.array([0.5,1.5])
+
+    # forward and central differences, serial and on two processes
+    gradients = []
+    for central in [False,True]:
+        for processes in [1,2]:
+            problem = setup('SLSQP')
+            problem.central_differences = central
+            problem.number_of_processes = processes
+            grad_obj, jac_con = problem.finite_difference(x,diff_interval=1e-4)
+            gradients.append((grad_obj,jac_con))
+
+            # every point is run once, by the nexus or by its copies
+            assert problem.evaluation_count == len(x)*(1 + central) + (not central)
+
+    for serial, parallel in [(gradients[0],gradients[1]),(gradients[2],gradients[3])]:
+        assert np.all(serial[0] == parallel[0])
+        assert np.all(serial[1] == parallel[1])
+
+    # with the cache on, a tolerance larger than the step does not change the gradients
+    for central in [False,True]:
+        for processes in [1,2]:
+            problem = setup('SLSQP')
+            problem.central_differences = central
+            problem.number_of_processes = processes
+            problem.evaluation_cache.size      = 100
+            problem.evaluation_cache.tolerance = 1e-3
+            problem.objective(x)
+            grad_obj, jac_con = problem.finite_difference(x,diff_interval=1e-4)
+            assert np.all(grad_obj == gradients[2*central][0])
+            assert np.all(jac_con  == gradients[2*central][1])
+
+    # the objective is x1**2 + x2**2, the constraints are x1 and x2
+    forward, central = gradients[0], gradients[2]
+    print('forward differences:', forward[0])
+    print('central differences:', central[0])
+    assert np.all(np.abs(forward[0] - 2.*x) < 2e-4)
+    assert np.all(np.abs(central[0] - 2.*x) < 1e-8)
+    assert np.allclose(central[1],np.eye(2),atol=1e-8)
+    assert central[1].shape == (2,2)
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,7 @@
 # 
 # Created:  Sep 2014, E. Botero
 # Modified: Feb 2020, M. Clarke  
+#           Oct 2026, SUAVE Team
 
 #----------------------------------------------------------------------
 #   Imports
@@ -16,8 +17,10 @@ Data, Container,
 )
 
 import numpy as np
-import copy, time
+import copy, time, os, shutil, tempfile
 from SUAVE.Methods.Propulsion import propeller_design
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_polars import \
+     compute_airfoil_polars, build_airfoil_polar_table
 from SUAVE.Components.Energy.Networks.Battery_Propeller import Battery_Propeller
 
 def main():
@@ -190,9 +193,63 @@ def main():
     
     for k,v in list(error.items()):
         assert(np.abs(v)<1e-6)
+        
+    # several control points at once, each converges on its own
+    velocities = np.array([V, 0.8*V, V, 1.2*V])
+    conditions_n = stack_conditions(conditions,velocities)
+    prop_a.inputs.omega = np.ones((len(velocities),1))*prop.angular_velocity
+    F_n, Q_n, P_n, Cp_n, output_n, etap_n = prop_a.spin(conditions_n)
+    
+    assert np.all(output_n.converged)
+    assert not np.any(output_n.axial_flight)
+    assert np.all(outputr_a.axial_flight) and np.all(outputr.axial_flight)
+    assert np.abs(F_n[0,0] - F_a_truth) < 1e-6
+    assert np.all(F_n[2] == F_n[0])
+    assert F_n[1,0] != F_n[0,0] and F_n[3,0] != F_n[0,0]
+    
+    for i in [1,3]:
+        conditions_i = stack_conditions(conditions,velocities[i:i+1])
+        prop_a.inputs.omega = np.array(prop.angular_velocity,ndmin=2)
+        F_i, Q_i, P_i, Cp_i, output_i, etap_i = prop_a.spin(conditions_i)
+        assert np.all(F_i == F_n[i])
+        assert np.all(output_i.lift_coefficient == output_n.lift_coefficient[i])
+        
+    # the airfoil polars are built once per airfoil files and aspect ratio
+    geo   = prop_a.airfoil_geometry
+    pol   = prop_a.airfoil_polars
+    table = compute_airfoil_polars(prop_a, geo, pol)
+    assert compute_airfoil_polars(prop_a, geo, pol) is table
+    
+    # and read back from a directory when they were kept there
+    directory = tempfile.mkdtemp()
+    kept      = build_airfoil_polar_table(geo, pol, 5., directory)
+    read      = build_airfoil_polar_table(geo, pol, 5., directory)
+    assert len(os.listdir(directory)) == 1
+    assert np.all(read.lift_coefficients == kept.lift_coefficients)
+    assert np.all(read.drag_coefficients == kept.drag_coefficients)
+    shutil.rmtree(directory)
+    
+    # variable pitch with airfoil polars
+    prop_a.inputs.omega = np.array(prop.angular_velocity,ndmin=2)
+    F_v, Q_v, P_v, Cp_v, output_v, etap_v = prop_a.spin_variable_pitch(conditions)
+    assert np.all(output_v.converged)
      
     return
 
+def stack_conditions(conditions,velocities):
+    """ Copies single point conditions to one control point per velocity """
+    
+    n = len(velocities)
+    conditions_n = copy.deepcopy(conditions)
+    for key in ['density','dynamic_viscosity','speed_of_sound','temperature']:
+        conditions_n.freestream[key] = np.ones((n,1))*conditions.freestream[key]
+    conditions_n.frames.inertial.velocity_vector   = np.zeros((n,3))
+    conditions_n.frames.inertial.velocity_vector[:,0] = velocities
+    conditions_n.propulsion.throttle               = np.ones((n,1))
+    conditions_n.frames.body.transform_to_inertial = np.tile(np.eye(3),(n,1,1))
+    
+    return conditions_n
+
 # ----------------------------------------------------------------------        
 #   Call Main
 # ----------------------------------------------------------------------    
@@ -0,0 +1,137 @@
+# batch_segments.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks that a batch of segment variants solved on one stacked state matches solving each variant alone"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+
+from SUAVE.Methods.Missions.Segments.converge_root            import converge_root
+from SUAVE.Methods.Missions.Segments.Common.Numerics          import initialize_differentials_dimensionless
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    n_cp    = 8
+    targets = [1., 2., 3., 4.]
+
+    # every variant alone
+    single_evals = 0
+    singles      = []
+    for target in targets:
+        segment = setup_segment(n_cp)
+        segment.target = target
+        segment.initialize()
+        converge_root(segment)
+        assert segment.state.numerics.converged
+        single_evals += segment.counts.residuals
+        singles.append(segment)
+
+    # all variants at once
+    segment = setup_segment(n_cp)
+    batch   = SUAVE.Analyses.Mission.Batch()
+    batch.pointwise_steps.append(pointwise_system)
+    batch.append_variants(segment,'target',targets)
+    batch.evaluate()
+
+    assert batch.state.numerics.converged
+    assert batch.state.unknowns.x.shape == (n_cp*len(targets),1)
+
+    for variant, single, rows in zip(batch.segments.values(),singles,batch.stacked.rows):
+        assert variant.state.numerics.converged
+        x_error = np.max(np.abs(variant.state.unknowns.x - single.state.unknowns.x))
+        y_error = np.max(np.abs(variant.state.unknowns.y - single.state.unknowns.y))
+        print(variant.tag, 'target', variant.target, 'x difference:', x_error, 'y difference:', y_error)
+        assert x_error < 1e-8
+        assert y_error < 1e-8
+
+        # the pointwise results land in the rows of each variant
+        assert np.all(variant.state.conditions.z == batch.state.conditions.z[rows])
+
+    # the pointwise step runs once per batch iteration on the stacked state, which hands it
+    # the first variant's attributes, and the coupled step runs once per variant
+    iterations = batch.segments[0].counts.pointwise
+    print('batch iterations:', iterations, 'single residual evaluations:', single_evals)
+    for variant in batch.segments.values():
+        assert variant.counts.residuals == iterations
+    assert iterations < single_evals
+
+    # variants that aren't stacked along rows are refused
+    segment = setup_segment(n_cp)
+    segment.state.unknowns.scalar = 1.
+    batch   = SUAVE.Analyses.Mission.Batch()
+    batch.append_variants(segment,'target',targets)
+    try:
+        batch.evaluate()
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('a scalar unknown should not be batched')
+
+    return
+
+# ----------------------------------------------------------------------
+#   Test System
+# ----------------------------------------------------------------------
+
+def setup_segment(n_cp):
+
+    segment = SUAVE.Analyses.Mission.Segments.Segment()
+    segment.tag    = 'batch_test'
+    segment.target = 2.
+
+    segment.counts = SUAVE.Core.Data()
+    segment.counts.pointwise = 0
+    segment.counts.residuals = 0
+
+    segment.state.numerics.number_control_points = n_cp
+    segment.state.numerics.max_evaluations       = 2000
+
+    segment.state.unknowns.x   = np.ones((n_cp,1))
+    segment.state.unknowns.y   = np.zeros((n_cp,1))
+    segment.state.conditions.z = np.zeros((n_cp,1))
+    segment.state.residuals.a  = np.zeros((n_cp,1))
+    segment.state.residuals.b  = np.zeros((n_cp,1))
+
+    segment.process.initialize.differentials        = initialize_differentials_dimensionless
+    segment.process.iterate.conditions.pointwise    = pointwise_system
+    segment.process.iterate.residuals.test_system   = coupled_system
+
+    return segment
+
+def pointwise_system(segment):
+    """ z = x^3 + x - target only depends on each control point, target is a column in a batch """
+
+    segment.counts.pointwise += 1
+
+    x = segment.state.unknowns.x
+    segment.state.conditions.z = x*x*x + x - segment.target
+
+    return
+
+def coupled_system(segment):
+    """ a = z + y, b = Dy + y - t with y(0) = 0 couples every point through D """
+
+    segment.counts.residuals += 1
+
+    D = segment.state.numerics.dimensionless.differentiate
+    t = segment.state.numerics.dimensionless.control_points
+    y = segment.state.unknowns.y
+
+    segment.state.residuals.a = segment.state.conditions.z + y
+    b      = np.dot(D,y) + y - t
+    b[0,0] = y[0,0]
+    segment.state.residuals.b = b
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+# converge_root_jacobian.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+""" checks the jacobian and broyden options of converge_root on a small coupled system"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+import sys
+
+from SUAVE.Methods.Missions.Segments.converge_root            import converge_root
+from SUAVE.Methods.Missions.Segments.Common.Numerics          import initialize_differentials_dimensionless
+
+converge_root_module = sys.modules['SUAVE.Methods.Missions.Segments.converge_root']
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    
+    n_cp = 16
+    
+    x_solved = {}
+    evals    = {}
+    for method in ['none','function','finite_difference','complex_step']:
+        segment = setup_segment(n_cp)
+        segment.state.numerics.solver_jacobian   = method
+        segment.state.numerics.jacobian_function = analytic_jacobian
+        
+        # solve twice, the second solve reuses the sparsity pattern
+        converge_root(segment)
+        segment.state.unknowns.x = np.ones((n_cp,1))
+        segment.state.unknowns.y = np.zeros((n_cp,1))
+        segment.count = 0
+        converge_root(segment)
+        
+        assert segment.state.numerics.converged
+        x_solved[method] = segment.state.unknowns.pack_array()
+        evals[method]    = segment.count
+        print(method, 'residual evaluations:', segment.count)
+    
+    for method in ['function','finite_difference','complex_step']:
+        error = np.max(np.abs(x_solved[method] - x_solved['none']))
+        print(method, 'difference from default:', error)
+        assert error < 1e-8
+        
+    # an exact jacobian needs no finite differencing at all
+    assert evals['function'] < evals['none']
+    
+    # the pointwise unknowns share colours with the coupled ones, and colours never share a row
+    sparsity = segment.state.numerics.jacobian_sparsity
+    colours  = converge_root_module.colour_columns(sparsity)
+    print('columns:', 2*n_cp, 'colours:', len(colours))
+    assert len(colours) <= n_cp + 1
+    for columns in colours:
+        assert np.all(np.sum(sparsity[:,columns],axis=1) <= 1)
+    
+    # the stored pattern matches the analytic jacobian
+    J = analytic_jacobian(x_solved['none'],segment)
+    assert np.all(sparsity == (J != 0.))
+    
+    # with x y in b, whose derivative in x is zero at the first iterate where y is zero, the pattern
+    # still has every entry
+    product = setup_segment(n_cp,product=True)
+    converge_root(product)
+    x_product = product.state.unknowns.pack_array()
+    J_product = analytic_jacobian(x_product,product)
+    
+    for method in ['finite_difference','complex_step']:
+        segment = setup_segment(n_cp,product=True)
+        segment.state.numerics.solver_jacobian = method
+        converge_root(segment)
+        
+        assert segment.state.numerics.converged
+        assert np.all(segment.state.numerics.jacobian_sparsity == (J_product != 0.))
+        assert np.max(np.abs(segment.state.unknowns.pack_array() - x_product)) < 1e-8
+    
+        # a pattern missing a residual, as one flat where the pattern was found, is found again from the
+        # changes outside of it
+        segment = setup_segment(n_cp,product=True)
+        segment.state.numerics.solver_jacobian   = method
+        segment.state.numerics.jacobian_sparsity = (J_product != 0.)
+        segment.state.numerics.jacobian_sparsity[0,:] = False
+        converge_root(segment)
+        
+        assert segment.state.numerics.converged
+        assert np.all(segment.state.numerics.jacobian_sparsity == (J_product != 0.))
+        assert np.max(np.abs(segment.state.unknowns.pack_array() - x_product)) < 1e-8
+    
+    # broyden updates on a reused jacobian, warm started from the last converged solve of a
+    # slightly different problem as an optimizer would
+    segment = setup_segment(n_cp)
+    segment.state.numerics.solver_broyden    = True
+    segment.state.numerics.solver_warm_start = True
+    converge_root(segment)
+    segment.target = 2.01
+    segment.state.unknowns.x = np.ones((n_cp,1))
+    segment.state.unknowns.y = np.zeros((n_cp,1))
+    segment.count = 0
+    converge_root(segment)
+    print('broyden warm start residual evaluations:', segment.count)
+    
+    assert segment.state.numerics.converged
+    assert segment.count < evals['function']
+    
+    cold = setup_segment(n_cp)
+    cold.target = 2.01
+    converge_root(cold)
+    assert np.max(np.abs(segment.state.unknowns.pack_array() - cold.state.unknowns.pack_array())) < 1e-8
+    
+    # the stored jacobian is close to the true one
+    J       = analytic_jacobian(segment.state.unknowns.pack_array(),segment)
+    J_error = np.max(np.abs(segment.state.numerics.jacobian - J))/np.max(np.abs(J))
+    print('broyden jacobian relative error:', J_error)
+    assert J_error < 1e-2
+    
+    return
+
+# ----------------------------------------------------------------------
+#   Test System
+# ----------------------------------------------------------------------
+
+def setup_segment(n_cp,product=False):
+    
+    segment = SUAVE.Analyses.Mission.Segments.Segment()
+    segment.tag   = 'jacobian_test'
+    segment.count  = 0
+    segment.target = 2.
+    segment.product = product
+    
+    segment.state.numerics.number_control_points = n_cp
+    segment.state.numerics.max_evaluations       = 2000
+    initialize_differentials_dimensionless(segment)
+    
+    segment.state.unknowns.x  = np.ones((n_cp,1))
+    segment.state.unknowns.y  = np.zeros((n_cp,1))
+    segment.state.residuals.a = np.zeros((n_cp,1))
+    segment.state.residuals.b = np.zeros((n_cp,1))
+    
+    segment.process.iterate.residuals.test_system = test_system
+    
+    return segment
+
+def test_system(segment):
+    """ a = x^3 + x + y - target is pointwise, b = Dy + y - t with y(0) = 0 couples every point through D,
+        with product b also has x y """
+    
+    segment.count += 1
+    
+    D = segment.state.numerics.dimensionless.differentiate
+    t = segment.state.numerics.dimensionless.control_points
+    x = segment.state.unknowns.x
+    y = segment.state.unknowns.y
+    
+    segment.state.residuals.a = x*x*x + x + y - segment.target
+    b      = np.dot(D,y) + y - t
+    if segment.product:
+        b = b + x*y
+    b[0,0] = y[0,0]
+    segment.state.residuals.b = b
+    
+    return
+
+def analytic_jacobian(unknowns,segment):
+    
+    n = segment.state.numerics.number_control_points
+    D = segment.state.numerics.dimensionless.differentiate
+    x = unknowns[:n]
+    y = unknowns[n:]
+    
+    J = np.zeros((2*n,2*n))
+    J[:n,:n] = np.diag(3.*x*x + 1.)
+    J[:n,n:] = np.eye(n)
+    J[n:,n:] = D + np.eye(n)
+    if segment.product:
+        J[n:,:n] = np.diag(y)
+        J[n:,n:] = J[n:,n:] + np.diag(x)
+    J[n,:]   = 0.
+    J[n,n]   = 1.
+    
+    return J
+
+if __name__ == '__main__':
+    main()
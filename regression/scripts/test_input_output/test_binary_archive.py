@@ -0,0 +1,111 @@
+# test_binary_archive.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks that a data structure archived in the binary format loads back with the values, types and
+    key order of the JSON archive, and times both"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE.Input_Output as IO
+from SUAVE.Core import Data, DataOrdered
+import numpy as np
+import time
+import os
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    results = results_setup(20,64)
+
+    t0 = time.time()
+    IO.SUAVE.archive(results,'results.res')
+    t1 = time.time()
+    IO.SUAVE.archive_binary(results,'results.bin')
+    t2 = time.time()
+    from_json = IO.SUAVE.load('results.res')
+    t3 = time.time()
+    from_bin  = IO.SUAVE.load_binary('results.bin')
+    t4 = time.time()
+    print('archive: %.3f s json, %.3f s binary' % (t1-t0,t2-t1))
+    print('load:    %.3f s json, %.3f s binary' % (t3-t2,t4-t3))
+
+    # the same structure as the JSON archive, with the arrays kept as they were
+    compare(from_json,from_bin)
+    compare(results,from_bin,exact_types=True)
+    assert list(from_bin.segments.keys()) == list(results.segments.keys())
+    assert isinstance(from_bin.segments,DataOrdered)
+
+    # the arrays are read only views of the file unless asked otherwise
+    pressure = from_bin.segments.segment_3.conditions.freestream.pressure
+    assert not pressure.flags.writeable
+    from_copy = IO.SUAVE.load_binary('results.bin',mmap_mode=None)
+    from_copy.segments.segment_3.conditions.freestream.pressure[0] = 0.
+    del from_bin, pressure
+
+    # a single value
+    time_3 = IO.SUAVE.load_binary_value('results.bin','segments.segment_3.conditions.frames.inertial.time')
+    assert np.all(time_3 == results.segments.segment_3.conditions.frames.inertial.time)
+    tag = IO.SUAVE.load_binary_value('results.bin','segments.segment_3.tag')
+    assert tag == 'segment_3'
+
+    # a structure without arrays
+    empty = Data()
+    empty.tag = 'none'
+    IO.SUAVE.archive_binary(empty,'empty.bin')
+    assert IO.SUAVE.load_binary('empty.bin').tag == 'none'
+
+    for filename in ['results.res','results.bin','empty.bin']:
+        os.remove(filename)
+
+    return
+
+def results_setup(n_segments,n_points):
+
+    results = Data()
+    results.segments = DataOrdered()
+    for ii in range(n_segments):
+        segment = Data()
+        segment.tag = 'segment_%d' % ii
+        segment.converged = ii % 2 == 0
+        segment.iterations = ii
+        segment.none = None
+        segment.numbers = [1.,2.,ii]
+        segment.conditions = Data()
+        segment.conditions.frames = Data()
+        segment.conditions.frames.inertial = Data()
+        segment.conditions.frames.inertial.time = np.linspace(0.,ii,n_points)[:,None]
+        segment.conditions.frames.inertial.position_vector = np.random.rand(n_points,3)
+        segment.conditions.frames.body = Data()
+        segment.conditions.frames.body.transform_to_inertial = np.random.rand(n_points,3,3)
+        segment.conditions.freestream = Data()
+        segment.conditions.freestream.pressure = np.random.rand(n_points,1)*1e5
+        segment.conditions.freestream.mach_number = np.float64(0.78)
+        segment.conditions.stability = Data()
+        segment.conditions.stability.flags = np.random.rand(n_points) > 0.5
+        segment.conditions.stability.counts = np.arange(n_points,dtype=np.int32)
+        results.segments['segment_%d' % ii] = segment
+
+    return results
+
+def compare(a,b,exact_types=False):
+
+    assert list(a.keys()) == list(b.keys())
+    for key in a.keys():
+        x, y = a[key], b[key]
+        if isinstance(x,dict):
+            compare(x,y,exact_types)
+        elif isinstance(x,np.ndarray) or isinstance(x,list):
+            assert np.array_equal(x,y)
+            if exact_types and isinstance(x,np.ndarray):
+                assert x.dtype == y.dtype and x.shape == y.shape
+        else:
+            assert x == y and type(x) == type(y) or (type(x) == np.float64 and type(y) == float)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+# test_segment_archive.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+""" checks that the segments of a mission written as they are finalized read back one at a time
+    with the conditions of the mission results"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import SUAVE.Input_Output as IO
+from SUAVE.Core import Data
+import numpy as np
+import os
+from copy import deepcopy
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    archive = IO.SUAVE.Segment_Archive()
+    archive.filename = 'segments.bin'
+
+    mission = mission_setup(archive)
+    results = mission.evaluate()
+
+    # every segment was written once, as soon as it was finalized
+    assert mission.written == [1,2,3,4]
+
+    tags = []
+    for segment in IO.SUAVE.load_segments('segments.bin'):
+        tags.append(segment.tag)
+        conditions = results.segments[segment.tag].conditions
+        assert np.all(segment.conditions.frames.inertial.time == conditions.frames.inertial.time)
+        assert np.all(segment.conditions.freestream.altitude  == conditions.freestream.altitude)
+        assert segment.conditions.freestream.altitude.shape == (16,1)
+        assert not segment.conditions.freestream.altitude.flags.writeable
+    assert tags == ['climb','cruise_1','cruise_2','descent']
+
+    # read into memory one segment at a time
+    segments = IO.SUAVE.load_segments('segments.bin',mmap_mode=None)
+    first    = next(segments)
+    first.conditions.freestream.altitude[0] = 0.
+    assert first.tag == 'climb'
+    assert len(list(segments)) == 3
+
+    # running the mission again replaces it
+    mission.evaluate()
+    assert mission.written[4:] == [1,2,3,4]
+    assert len(list(IO.SUAVE.load_segments('segments.bin'))) == 4
+
+    # so does running a copy of it, the counting steps are shared with the mission
+    copied = deepcopy(mission)
+    copied.evaluate()
+    assert mission.written[8:] == [1,2,3,4]
+
+    # a file cut short is not read
+    with open('segments.bin','r+b') as f:
+        f.truncate(os.path.getsize('segments.bin') - 10)
+    try:
+        list(IO.SUAVE.load_segments('segments.bin'))
+        assert False
+    except ValueError:
+        pass
+
+    os.remove('segments.bin')
+
+    # the file has to be set
+    try:
+        IO.SUAVE.Segment_Archive().clear()
+        assert False
+    except ValueError:
+        pass
+
+    return
+
+def mission_setup(archive):
+
+    mission = SUAVE.Analyses.Mission.Sequential_Segments()
+    mission.written = []
+
+    for tag, altitude in [('climb',[0.,10.]),('cruise_1',[10.,10.]),('cruise_2',[10.,10.]),('descent',[10.,0.])]:
+        mission.append_segment(segment_setup(tag,altitude))
+
+    archive.attach(mission)
+
+    # count the segments in the file as each segment is done
+    for segment in mission.segments.values():
+        segment.process.check = lambda segment, mission=mission: \
+            mission.written.append(len(list(IO.SUAVE.load_segments(archive.filename))))
+
+    return mission
+
+def segment_setup(tag,altitude):
+
+    segment = SUAVE.Analyses.Mission.Segments.Segment()
+    segment.tag = tag
+    segment.altitude = altitude
+    segment.process.initialize.expand_state = expand_state
+    segment.process.iterate.conditions.fill = fill_conditions
+
+    return segment
+
+def expand_state(segment):
+    pass
+
+def fill_conditions(segment):
+
+    conditions = segment.state.conditions
+    conditions.frames = Data()
+    conditions.frames.inertial = Data()
+    conditions.frames.inertial.time = np.linspace(0.,60.,16)[:,None]
+    conditions.freestream = Data()
+    conditions.freestream.altitude = np.linspace(segment.altitude[0],segment.altitude[1],16)[:,None]
+
+if __name__ == '__main__':
+    main()
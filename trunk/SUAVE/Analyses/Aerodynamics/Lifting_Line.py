@@ -3,6 +3,7 @@
 # 
 # Created:  Aug 2017, E. Botero
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,6 +12,7 @@
 import numpy as np
 from SUAVE.Core import Data, Units
 from SUAVE.Methods.Aerodynamics.Lifting_Line import lifting_line as LL
+from SUAVE.Methods.Utilities.parallel_map import parallel_map, number_of_processes_used
 from .Aerodynamics import Aerodynamics
 
 # ----------------------------------------------------------------------
@@ -58,6 +60,7 @@ class Lifting_Line(Aerodynamics):
 
         # vortex lattice configurations
         self.settings.number_of_stations  = 100
+        self.settings.number_of_processes = 1 # processes sampling the training angles, None for every core
         
         # conditions table, used for surrogate model training
         self.training = Data()        
@@ -195,6 +198,7 @@ class Lifting_Line(Aerodynamics):
         Properties Used:
         self.geometry.wings.*.tag
         self.settings                 (passed to calculate vortex lattice)
+        self.settings.number_of_processes
         self.training.angle_of_attack [radians]
         """        
         # unpack
@@ -203,27 +207,29 @@ class Lifting_Line(Aerodynamics):
         training = self.training
         
         AoA = training.angle_of_attack
-        CL  = np.zeros_like(AoA)
-        CDi = np.zeros_like(AoA)
         
-        wing_CLs = Data.fromkeys(geometry.wings.keys(), np.zeros_like(AoA))
-        wing_CDis = Data.fromkeys(geometry.wings.keys(), np.zeros_like(AoA)) 
-
         # condition input, local, do not keep
-        konditions              = Data()
-        konditions.aerodynamics = Data()
-
-        # calculate aerodynamics for table
-        for i,_ in enumerate(AoA):
+        # the angles of attack are evaluated together, split among the processes
+        processes = number_of_processes_used(settings.get('number_of_processes',1),len(AoA))
+        arguments = []
+        chunks    = np.array_split(np.arange(len(AoA)),processes)
+        for chunk in chunks:
+            konditions              = Data()
+            konditions.aerodynamics = Data()
+            konditions.aerodynamics.angle_of_attack = np.reshape(AoA[chunk],(-1,1))
+            arguments.append((konditions,settings,geometry))
             
-            # overriding conditions, thus the name mangling
-            konditions.aerodynamics.angle_of_attack = AoA[i]
-            
-            # these functions are inherited from Aerodynamics() or overridden
-            CL[i], wing_lifts , CDi[i], wing_drags  = calculate_lift_lifting_line(konditions, settings, geometry)
-            for wing in geometry.wings.values():
-                wing_CLs[wing.tag][i] = wing_lifts[wing.tag]
-                wing_CDis[wing.tag][i] = wing_drags[wing.tag]
+        # calculate aerodynamics for table
+        results = parallel_map(calculate_lift_lifting_line_chunk,arguments,processes)
+        
+        # vertical wings give scalars, the rest one value per angle
+        CL        = gather_chunks(chunks,[result[0] for result in results],AoA)
+        CDi       = gather_chunks(chunks,[result[2] for result in results],AoA)
+        wing_CLs  = Data()
+        wing_CDis = Data()
+        for wing in geometry.wings.keys():
+            wing_CLs[wing]  = gather_chunks(chunks,[result[1][wing] for result in results],AoA)
+            wing_CDis[wing] = gather_chunks(chunks,[result[3][wing] for result in results],AoA)
 
         # store training data
         training.lift_coefficient       = CL
@@ -336,3 +342,51 @@ def calculate_lift_lifting_line(conditions,settings,geometry):
         wing_drags[wing.tag] = wing_drag_coeff
 
     return total_lift_coeff, wing_lifts , total_drag_coeff , wing_drags
+
+def calculate_lift_lifting_line_chunk(arguments):
+    """Runs calculate_lift_lifting_line on a chunk of the training angles, the function handed to parallel_map.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    arguments                       [tuple] conditions, settings and geometry of calculate_lift_lifting_line
+
+    Outputs:
+    see calculate_lift_lifting_line
+
+    Properties Used:
+    N/A
+    """
+    conditions, settings, geometry = arguments
+    
+    return calculate_lift_lifting_line(conditions,settings,geometry)
+
+def gather_chunks(chunks,values,AoA):
+    """Puts the results of the chunks of training angles back together in an array shaped like the angles.
+
+    Assumptions:
+    A scalar result holds for every angle of its chunk.
+
+    Source:
+    N/A
+
+    Inputs:
+    chunks                          [list of arrays] indices of the angles in each chunk
+    values                          [list] results of each chunk
+    AoA                             [radians]
+
+    Outputs:
+    gathered                        [array]
+
+    Properties Used:
+    N/A
+    """
+    gathered = np.zeros(len(AoA))
+    for chunk, value in zip(chunks,values):
+        gathered[chunk] = np.ravel(value)
+        
+    return np.reshape(gathered,np.shape(AoA))
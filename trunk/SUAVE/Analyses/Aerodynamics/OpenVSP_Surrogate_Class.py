@@ -2,6 +2,7 @@
 # OpenVSP_surrogate.py
 #
 # Created:  June 2019, B. Dalman
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -20,6 +21,7 @@ from sklearn.gaussian_process.kernels import ExpSineSquared
 # Package imports
 import numpy as np
 import time
+from scipy.interpolate import RegularGridInterpolator
 import pylab as plt
 import sklearn
 from sklearn import gaussian_process
@@ -68,6 +70,14 @@ class OpenVSP_Surrogate_Class(Aerodynamics):
         #self.settings.processors         = 1
         #self.settings.maximum_iterations = 1500
 
+        # Fast prediction, the surrogates are tabulated on a regular grid over the training range and
+        # interpolated linearly there, the grid is refined until its estimated error is within the tolerance
+        self.settings.fast_prediction                  = False
+        self.settings.fast_prediction_tolerance        = 1e-4
+        self.settings.fast_prediction_initial_points   = 9
+        self.settings.fast_prediction_maximum_points   = 257
+        self.settings.fast_prediction_samples_per_cell = 4
+
         # Conditions table, used for surrogate model training
         self.training = Data()        
         self.training.angle_of_attack  = np.array([-2.,3.,8.]) * Units.deg
@@ -127,6 +137,7 @@ class OpenVSP_Surrogate_Class(Aerodynamics):
         self.surrogates.
           lift_coefficient [-] CL
           drag_coefficient [-] CD
+          grid             (optional - see build_fast_predictor)
         """  
         # Unpack
         surrogates = self.surrogates        
@@ -136,14 +147,12 @@ class OpenVSP_Surrogate_Class(Aerodynamics):
         #print('Mach number is: ', mach)
         AoA  = conditions.aerodynamics.angle_of_attack
         #print('AoA is: ', AoA)
-        lift_model = surrogates.lift_coefficient
-        drag_model = surrogates.drag_coefficient
+
+        # All of the control points at once
+        points = np.hstack([np.reshape(AoA,(-1,1)),np.reshape(mach,(-1,1))])
         
         # Inviscid lift
-        data_len = len(AoA)
-        inviscid_lift = np.zeros([data_len,1])
-        for ii,_ in enumerate(AoA):
-            inviscid_lift[ii] = lift_model.predict([np.array([AoA[ii][0],mach[ii][0]])]) #sklearn fix
+        inviscid_lift = predict_surrogate(surrogates,'lift_coefficient',points)
             
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift       = Data()
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift.total = inviscid_lift
@@ -152,9 +161,7 @@ class OpenVSP_Surrogate_Class(Aerodynamics):
         
 
         # Inviscid drag, zeros are a placeholder for possible future implementation
-        inviscid_drag = np.zeros([data_len,1])
-        for ii,_ in enumerate(AoA):
-            inviscid_drag[ii] = drag_model.predict([np.array([AoA[ii][0], mach[ii][0]])])
+        inviscid_drag = predict_surrogate(surrogates,'drag_coefficient',points)
 
         conditions.aerodynamics.drag_breakdown.untrimmed           = inviscid_drag       
         state.conditions.aerodynamics.inviscid_drag_coefficient    = inviscid_drag
@@ -261,9 +268,10 @@ class OpenVSP_Surrogate_Class(Aerodynamics):
         self.surrogates.
           lift_coefficient <Guassian process surrogate>
           drag_coefficient <Guassian process surrogate>
+          grid             (only with self.settings.fast_prediction - see build_fast_predictor)
 
         Properties Used:
-        No others
+        self.settings.fast_prediction
         """  
         # Unpack data
         training  = self.training
@@ -300,6 +308,9 @@ class OpenVSP_Surrogate_Class(Aerodynamics):
         self.surrogates.lift_coefficient = cl_surrogate
         self.surrogates.drag_coefficient = cd_surrogate
 
+        if self.settings.fast_prediction:
+            self.build_fast_predictor()
+
         # Resets plot to whatever your actual surrogate range is, plus 20%
         range_aoa = np.absolute(xy[0,0] - xy[-1,0]) * 1
         range_mach = np.absolute(xy[0,1] - xy[-1,1]) * 1
@@ -320,13 +331,10 @@ class OpenVSP_Surrogate_Class(Aerodynamics):
         
         AoA_mesh,mach_mesh = np.meshgrid(AoA_points,mach_points)
         
-        CL_sur = np.zeros(np.shape(AoA_mesh))
-        CD_sur = np.zeros(np.shape(AoA_mesh))        
+        mesh_points = np.vstack([AoA_mesh.flatten(),mach_mesh.flatten()]).T
         
-        for jj in range(len(AoA_points)):
-            for ii in range(len(mach_points)):
-                CL_sur[ii,jj] = cl_surrogate.predict([np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]])])
-                CD_sur[ii,jj] = cd_surrogate.predict([np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]])])  #sklearn fix        
+        CL_sur = np.reshape(cl_surrogate.predict(mesh_points),np.shape(AoA_mesh))
+        CD_sur = np.reshape(cd_surrogate.predict(mesh_points),np.shape(AoA_mesh))
 
         fig = plt.figure('Coefficient of Lift Surrogate Plot')    
         plt_handle = plt.contourf(AoA_mesh/Units.deg,mach_mesh,CL_sur,levels=None)
@@ -352,11 +360,139 @@ class OpenVSP_Surrogate_Class(Aerodynamics):
 
         return
 
+    def build_fast_predictor(self):
+        """Tabulates the surrogates on a regular grid of angles of attack and Mach numbers spanning the
+        training data, so that they are interpolated linearly there instead of predicted. The number of points
+        per dimension is doubled until the estimated error of the interpolation is within the tolerance.
+
+        Assumptions:
+        The error is estimated from the differences to the surrogates at the centres and the midpoints of the
+        edges of the cells, and at random points in each cell. It is an estimate, not a bound, the error can be
+        larger between the points checked.
+
+        Source:
+        N/A
+
+        Inputs:
+        self.surrogates.
+          lift_coefficient <Guassian process surrogate>
+          drag_coefficient <Guassian process surrogate>
+        self.training.grid_points [radians,-] angles of attack and mach numbers
+
+        Outputs:
+        self.surrogates.grid.
+          lower_bounds     [radians,-] smallest angle of attack and mach number of the grid
+          upper_bounds     [radians,-] largest angle of attack and mach number of the grid
+          points           [-] number of points per dimension
+          lift_coefficient <RegularGridInterpolator>
+          drag_coefficient <RegularGridInterpolator>
+          error.
+            lift_coefficient [-] estimated error in CL, the largest difference to the surrogate checked
+            drag_coefficient [-] estimated error in CD, the largest difference to the surrogate checked
+
+        Properties Used:
+        self.settings.
+          fast_prediction_tolerance        [-]
+          fast_prediction_initial_points   [-]
+          fast_prediction_maximum_points   [-]
+          fast_prediction_samples_per_cell [-]
+        """
+        # Unpack
+        settings   = self.settings
+        surrogates = self.surrogates
+        xy         = self.training.grid_points
+        tolerance  = settings.fast_prediction_tolerance
+        lower      = np.min(xy,axis=0)
+        upper      = np.max(xy,axis=0)
+        keys       = ['lift_coefficient','drag_coefficient']
+        samples    = settings.fast_prediction_samples_per_cell
+        random     = np.random.RandomState(0)
+
+        n_points = settings.fast_prediction_initial_points
+        while True:
+            axes = [np.linspace(lower[ii],upper[ii],n_points) for ii in range(2)]
+            nodes = np.vstack([mesh.flatten() for mesh in np.meshgrid(*axes,indexing='ij')]).T
+            
+            # The centres and the midpoints of the edges of the cells are the points of the halved grid that
+            # are not nodes, the random points are spread over each cell
+            halved     = [np.linspace(lower[ii],upper[ii],2*n_points-1) for ii in range(2)]
+            i_mesh, j_mesh = np.meshgrid(np.arange(2*n_points-1),np.arange(2*n_points-1),indexing='ij')
+            midpoints  = (i_mesh % 2 == 1) | (j_mesh % 2 == 1)
+            checks     = np.vstack([halved[0][i_mesh[midpoints]],halved[1][j_mesh[midpoints]]]).T
+            corners    = np.vstack([mesh.flatten() for mesh in np.meshgrid(axes[0][:-1],axes[1][:-1],indexing='ij')]).T
+            steps      = (upper-lower)/(n_points-1)
+            randoms    = np.repeat(corners,samples,axis=0) + random.rand(len(corners)*samples,2)*steps
+            randoms    = np.minimum(randoms,upper)
+            checks     = np.vstack([checks,randoms])
+            
+            # The surrogates at the nodes and at the points checked, each predicted at once
+            grid       = Data()
+            grid.error = Data()
+            for key in keys:
+                values      = np.reshape(surrogates[key].predict(nodes),(n_points,n_points))
+                grid[key]   = RegularGridInterpolator(axes,values,method='linear')
+                grid.error[key] = np.max(np.abs(grid[key](checks) - surrogates[key].predict(checks)))
+            
+            converged = max(grid.error.values()) <= tolerance
+            if converged or 2*n_points-1 > settings.fast_prediction_maximum_points:
+                break
+            
+            # Halve the cells, the nodes of the coarser grid are kept
+            n_points = 2*n_points-1
+            
+        if not converged:
+            print('Warning: the fast prediction of the OpenVSP surrogate is not within its tolerance on ' \
+                  + str(n_points) + ' points, the estimated error is ' + str(max(grid.error.values())))
+        
+        grid.lower_bounds = lower
+        grid.upper_bounds = upper
+        grid.points       = n_points
+        surrogates.grid   = grid
+
+        return
+
 
 
 # ----------------------------------------------------------------------
 #  Helper Functions
 # ----------------------------------------------------------------------
+
+## @ingroup Analyses-Aerodynamics
+def predict_surrogate(surrogates,key,points):
+    """Predicts a coefficient at all of the points at once, with the grid of the fast prediction inside
+    its bounds if there is one and with the surrogate elsewhere.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    surrogates         see OpenVSP_Surrogate_Class.build_surrogate
+    key                <string> lift_coefficient or drag_coefficient
+    points             [radians,-] angles of attack and mach numbers, [points,2]
+
+    Outputs:
+    coefficient        [-] [points,1]
+
+    Properties Used:
+    N/A
+    """
+
+    grid = surrogates.get('grid',None)
+    if grid is None:
+        return np.reshape(surrogates[key].predict(points),(-1,1))
+
+    inside = np.all((points >= grid.lower_bounds) & (points <= grid.upper_bounds),axis=1)
+
+    coefficient = np.zeros([len(points),1])
+    if np.any(inside):
+        coefficient[inside,0] = grid[key](points[inside])
+    if not np.all(inside):
+        coefficient[~inside,0] = surrogates[key].predict(points[~inside])
+
+    return coefficient
 '''
 def call_SU2(conditions,settings,geometry):
     """Calculates lift and drag using SU2
@@ -9,6 +9,7 @@
 #           Dec 2018, M. Clarke
 #           Apr 2020, M. Clarke
 #           Jun 2020, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -23,12 +24,15 @@ from SUAVE.Core import Units
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM import VLM
 # local imports
 from .Aerodynamics import Aerodynamics
-from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_vortex_distribution import compute_vortex_distribution
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_vortex_distribution import update_vortex_distribution
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_induced_velocity_matrix import compute_condition_chunks
+from SUAVE.Methods.Utilities.parallel_map import parallel_map, number_of_processes_used
 from SUAVE.Plots import plot_vehicle_vlm_panelization  
 from SUAVE.Methods.Aerodynamics.Supersonic_Zero.Drag.Cubic_Spline_Blender import Cubic_Spline_Blender
 
 # package imports
 import numpy as np 
+from copy import copy
 from scipy.interpolate import interp2d, RectBivariateSpline, RegularGridInterpolator
 
 # ----------------------------------------------------------------------
@@ -70,6 +74,10 @@ class Vortex_Lattice(Aerodynamics):
         self.settings.number_panels_chordwise        = 2 
         self.settings.vortex_distribution            = Data()
         self.settings.plot_surrogate                 = True   
+        self.settings.floating_point_precision       = np.float64
+        self.settings.memory_limit                   = 2**30 # bytes of influence matrices evaluated at once
+        self.settings.chord_aligned_wake             = False # True factors the VLM once per Mach number
+        self.settings.number_of_processes            = 1     # processes sampling the training grid, None for every core
         
         # conditions table, used for surrogate model training
         self.training                                = Data()    
@@ -168,8 +176,8 @@ class Vortex_Lattice(Aerodynamics):
         if n_cw is not None:
             settings.number_panels_chordwise = n_cw
             
-        # generate vortex distribution
-        VD = compute_vortex_distribution(geometry,settings)      
+        # generate vortex distribution, the VLM reuses it until the geometry changes
+        VD = update_vortex_distribution(geometry,settings)      
         
         # Pack
         settings.vortex_distribution        = VD
@@ -305,7 +313,7 @@ class Vortex_Lattice(Aerodynamics):
         """Evaluates lift and drag directly using VLM
         
         Assumptions:
-        no changes to initial geometry or settings
+        The vortex distribution is only recomputed when the wings, fuselages or number of panels change
         
         Source:
         N/A
@@ -388,6 +396,8 @@ class Vortex_Lattice(Aerodynamics):
         Properties Used:
         self.geometry.wings.*.tag
         self.settings                 (passed to calculate vortex lattice)
+        self.settings.number_of_processes
+        self.settings.memory_limit    [bytes]
         self.training.angle_of_attack [radians]
         """
         # unpack
@@ -415,16 +425,33 @@ class Vortex_Lattice(Aerodynamics):
         Machs  = np.atleast_2d(np.tile(Mach,lenAoA).flatten()).T
         zeros  = np.zeros_like(Machs)
         
-        # Setup Konditions                      
-        konditions                              = Data()
-        konditions.aerodynamics                 = Data()
-        konditions.freestream                   = Data()
-        konditions.aerodynamics.angle_of_attack = AoAs
-        konditions.freestream.mach_number       = Machs
-        konditions.freestream.velocity          = zeros
-        
-        total_lift, total_drag, wing_lifts, wing_drags, wing_lift_distribution , wing_drag_distribution, pressure_coefficient = \
-                        calculate_VLM(konditions,settings,geometry)     
+        # evaluate the grid in chunks of whole Mach numbers, on a pool of processes if asked for
+        chunks    = compute_training_chunks(lenM,lenAoA,settings)
+        processes = number_of_processes_used(settings.get('number_of_processes',1),len(chunks))
+        if processes > 1:
+            worker_settings, worker_geometry = strip_vortex_distribution(settings,geometry)
+            worker_settings.memory_limit     = settings.get('memory_limit',2**30) // processes
+        else:
+            worker_settings, worker_geometry = settings, geometry
+            
+        arguments = []
+        for chunk in chunks:
+            chunk_konditions = Data()
+            chunk_konditions.aerodynamics                 = Data()
+            chunk_konditions.freestream                   = Data()
+            chunk_konditions.aerodynamics.angle_of_attack = AoAs[chunk]
+            chunk_konditions.freestream.mach_number       = Machs[chunk]
+            chunk_konditions.freestream.velocity          = zeros[chunk]
+            arguments.append((chunk_konditions,worker_settings,worker_geometry))
+            
+        results    = parallel_map(calculate_VLM_chunk,arguments,processes)
+        total_lift = np.vstack([result[0] for result in results])
+        total_drag = np.vstack([result[1] for result in results])
+        wing_lifts = Data()
+        wing_drags = Data()
+        for wing in geometry.wings.keys():
+            wing_lifts[wing] = np.vstack([result[2][wing] for result in results])
+            wing_drags[wing] = np.vstack([result[3][wing] for result in results])
         
         # Split subsonic from supersonic
         sub_sup_split = np.where(Machs < 1.0)[0][-1] + 1 
@@ -723,3 +750,94 @@ def calculate_VLM(conditions,settings,geometry):
         i+=1
 
     return total_lift_coeff, total_induced_drag_coeff, wing_lifts, wing_drags , cl_y , cdi_y , CPi
+
+def calculate_VLM_chunk(arguments):
+    """Runs calculate_VLM on one chunk of the training grid, the function handed to parallel_map.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    arguments                       [tuple] conditions, settings and geometry of calculate_VLM
+
+    Outputs:
+    see calculate_VLM
+
+    Properties Used:
+    N/A
+    """
+    conditions, settings, geometry = arguments
+    
+    return calculate_VLM(conditions,settings,geometry)
+
+def compute_training_chunks(n_mach,n_aoa,settings):
+    """Splits the training grid, whose conditions run over the angles of attack for each Mach number 
+    in turn, into chunks of whole Mach numbers. Each process gets at least one chunk and the chunks of 
+    all the processes together stay within the memory limit.
+
+    Assumptions:
+    A chunk holds at least one Mach number, whatever the limit.
+
+    Source:
+    N/A
+
+    Inputs:
+    n_mach                          [Unitless]
+    n_aoa                           [Unitless]
+    settings.number_of_processes    [Unitless]
+    settings.memory_limit           [bytes]
+    settings.floating_point_precision
+    settings.vortex_distribution.n_cp
+
+    Outputs:
+    chunks                          [list of slices]
+
+    Properties Used:
+    N/A
+    """
+    n_cp      = settings.vortex_distribution.n_cp
+    precision = settings.get('floating_point_precision',np.float64)
+    processes = number_of_processes_used(settings.get('number_of_processes',1),n_mach)
+    budget    = settings.get('memory_limit',2**30) // processes
+    
+    # the largest number of conditions that fit in each process's share of the memory
+    conditions = compute_condition_chunks(n_mach*n_aoa,n_cp,precision,budget)[0]
+    n_per      = max(1,(conditions.stop - conditions.start)//n_aoa)
+    n_per      = min(n_per,int(np.ceil(n_mach/processes)))
+    
+    return [slice(start*n_aoa,min(start+n_per,n_mach)*n_aoa) for start in range(0,n_mach,n_per)]
+
+def strip_vortex_distribution(settings,geometry):
+    """Copies the settings and geometry that are sent to other processes, without the influence 
+    matrices cached on the vortex distribution.
+
+    Assumptions:
+    The copies are shallow, only the vortex distribution is replaced.
+
+    Source:
+    N/A
+
+    Inputs:
+    settings.vortex_distribution    [Data]
+    geometry                        [Data]
+
+    Outputs:
+    settings                        [Data]
+    geometry                        [Data]
+
+    Properties Used:
+    N/A
+    """
+    VD = copy(settings.vortex_distribution)
+    if 'wing_influence' in VD:
+        del VD.wing_influence
+        
+    settings = copy(settings)
+    geometry = copy(geometry)
+    settings.vortex_distribution = VD
+    geometry.vortex_distribution = VD
+    
+    return settings, geometry
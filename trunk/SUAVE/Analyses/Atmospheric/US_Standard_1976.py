@@ -4,6 +4,7 @@
 # Created: 
 # Modified: Feb 2016, Andrew Wendorff
 #           Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -21,9 +22,12 @@ from SUAVE.Attributes.Planets import Earth
 
 from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
 
-from SUAVE.Core import Units
+from SUAVE.Core import Units, Data
 from SUAVE.Core.Arrays import atleast_2d_col
 
+# properties the atmosphere is defined for
+air   = Air()
+earth = Earth()
 
 # ----------------------------------------------------------------------
 #  Classes
@@ -62,13 +66,20 @@ class US_Standard_1976(Atmospheric):
         
         atmo_data = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
         self.update(atmo_data)        
+        
+        # pressure is interpolated in a table instead of evaluated when the lookup table is on
+        self.settings.lookup_table           = False
+        self.settings.lookup_table_tolerance = 1e-6  # relative error bound of the tabulated pressure
+        self.lookup_table                    = None
     
-    def compute_values(self,altitude,temperature_deviation=0.0,var_gamma=False):
+    def compute_values(self,altitude,temperature_deviation=0.0,var_gamma=False,atmo_data=None):
 
         """Computes atmospheric values.
 
         Assumptions:
-        US 1976 Standard Atmosphere
+        US 1976 Standard Atmosphere. With settings.lookup_table the pressure is interpolated in a
+        table built the first time it is needed, see build_lookup_table. The temperature is exact
+        either way.
 
         Source:
         U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
@@ -76,6 +87,8 @@ class US_Standard_1976(Atmospheric):
         Inputs:
         altitude                                 [m]
         temperature_deviation                    [K]
+        atmo_data                                (optional) values of an earlier call, filled in place
+                                                 when they have the number of points of this one
 
         Output:
         atmo_data.
@@ -93,31 +106,35 @@ class US_Standard_1976(Atmospheric):
             altitude                             [m]
             temperature                          [K]
             pressure                             [Pa]
+          settings.
+            lookup_table                         [bool]
+            lookup_table_tolerance               [-]
         """
 
         # unpack
         zs        = altitude
         gas       = self.fluid_properties
         planet    = self.planet
-        grav      = self.planet.sea_level_gravity        
-        Rad       = self.planet.mean_radius
+        grav      = planet.sea_level_gravity        
+        Rad       = planet.mean_radius
         R         = gas.gas_specific_constant
+        breaks    = self.breaks
+        settings  = self.settings
         delta_isa = temperature_deviation
         
-        #print('Entered US std: ', zs)
-
         # check properties
-        if not gas == Air():
+        if not gas == air:
             warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
+        if not planet == earth:
             warn('US Standard Atmosphere not using Earth planet properties')          
         
         # convert input if necessary
         zs = atleast_2d_col(zs)
 
         # get model altitude bounds
-        zmin = self.breaks.altitude[0]
-        zmax = self.breaks.altitude[-1]   
+        z_breaks = breaks.altitude
+        zmin     = z_breaks[0]
+        zmax     = z_breaks[-1]   
         
         # convert geometric to geopotential altitude
         zs = zs/(1 + zs/Rad)
@@ -130,39 +147,57 @@ class US_Standard_1976(Atmospheric):
             print("Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km")   
             zs[zs > zmax] = zmax        
 
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mu    = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in range( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = self.breaks.temperature[i]
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            alpha[ i_inside ] = -(self.breaks.temperature[i+1] - self.breaks.temperature[i])/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
-        
-        # interpolate the breaks
-        dz = zs-z0
-        i_isoth = (alpha == 0.)
-        i_adiab = (alpha != 0.)
-        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
-        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
+        if settings.lookup_table:
+            table = self.lookup_table
+            if table is None or table.key != self.lookup_table_key():
+                table = self.build_lookup_table()
+            
+            # find the table interval of each altitude, an altitude on a break belongs to the layer above
+            # it and the altitudes are clipped to the breaks, so only the top break has to be moved down
+            j = np.searchsorted(table.altitude,zs,side='right') - 1
+            np.minimum(j,len(table.altitude)-2,out=j)
+            z0    = table.layer_altitude[j]
+            T0    = table.layer_temperature[j]
+            alpha = table.lapse_rate[j]
+            
+            # cubic Hermite interpolation of the pressure
+            t = (zs - table.altitude[j])*table.inverse_spacing[j]
+            c = table.pressure_coefficients[j]
+            p = c[...,0] + t*(c[...,1] + t*(c[...,2] + t*c[...,3]))
+            
+            dz = zs - z0
+            
+        else:
+            # find the layer of each altitude, an altitude on a break belongs to the layer above it
+            T_breaks = breaks.temperature
+            i = np.searchsorted(z_breaks,zs,side='right') - 1
+            np.minimum(i,len(z_breaks)-2,out=i)
+            z0    = z_breaks[i]
+            T0    = T_breaks[i]
+            p0    = breaks.pressure[i]
+            alpha = -(T_breaks[i+1] - T0)/(z_breaks[i+1] - z0)
+            
+            # interpolate the breaks
+            dz = zs-z0
+            p  = np.empty_like(zs)
+            i_isoth = (alpha == 0.)
+            i_adiab = (alpha != 0.)
+            p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
+            p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
         
         T   = T0 - dz*alpha + delta_isa
         rho = gas.compute_density(T,p)
         a   = gas.compute_speed_of_sound(T,p,var_gamma)
         mu  = gas.compute_absolute_viscosity(T)
+        
+        # fill the values of an earlier call of the same size
+        if atmo_data is not None and np.shape(atmo_data.pressure) == zs.shape:
+            atmo_data.pressure[:]          = p
+            atmo_data.temperature[:]       = T
+            atmo_data.density[:]           = rho
+            atmo_data.speed_of_sound[:]    = a
+            atmo_data.dynamic_viscosity[:] = mu
+            return atmo_data
                 
         atmo_data = Conditions()
         atmo_data.expand_rows(zs.shape[0])
@@ -173,6 +208,150 @@ class US_Standard_1976(Atmospheric):
         atmo_data.dynamic_viscosity = mu
         
         return atmo_data
+    
+    def build_lookup_table(self):
+        """Tabulates the pressure of each layer between the breaks for the lookup table of compute_values.
+        The spacing in a layer is the largest that keeps the cubic Hermite interpolation of the pressure
+        within settings.lookup_table_tolerance, from the error bound of the interpolation.
+        compute_values builds the table again when any of the properties it is built from change,
+        see lookup_table_key.
+
+        Assumptions:
+        Hydrostatic layers, so dp/dz = -g p/(R T). The error of a cubic Hermite interpolation on a
+        spacing h is at most h^4/384 max|p|, with p/p = |n(n-1)(n-2)(n-3)| (lapse/T)^4 in a
+        layer where p ~ T^n, and (g/(R T))^4 in an isothermal one.
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        None
+
+        Outputs:
+        table.
+          key                                    see lookup_table_key
+          tolerance                              [-]
+          altitude                               [m]    geopotential, edges of the intervals
+          layer_altitude                         [m]    base of the layer of each interval
+          layer_temperature                      [K]
+          lapse_rate                             [K/m]
+          inverse_spacing                        [1/m]
+          pressure_coefficients                  [Pa]   of the cubic in the fraction of each interval
+
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+          settings.lookup_table_tolerance        [-]
+        """
+        
+        # unpack
+        grav      = self.planet.sea_level_gravity
+        R         = self.fluid_properties.gas_specific_constant
+        z_breaks  = np.asarray(self.breaks.altitude,dtype=float)
+        T_breaks  = np.asarray(self.breaks.temperature,dtype=float)
+        p_breaks  = np.asarray(self.breaks.pressure,dtype=float)
+        tolerance = self.settings.lookup_table_tolerance
+        
+        edges      = []
+        layers     = []
+        for i in range(len(z_breaks)-1):
+            z0    = z_breaks[i]
+            T0    = T_breaks[i]
+            alpha = -(T_breaks[i+1] - T0)/(z_breaks[i+1] - z0)
+            
+            # largest relative fourth derivative of the pressure in the layer
+            T_min = min(T0,T_breaks[i+1])
+            if alpha == 0.:
+                d4 = (grav/(R*T_min))**4
+            else:
+                n  = grav/(alpha*R)
+                d4 = abs(n*(n-1.)*(n-2.)*(n-3.))*(alpha/T_min)**4
+            
+            # half the bound is left for the change of the pressure over an interval
+            h = (0.5*384.*tolerance/d4)**0.25
+            m = max(1,int(np.ceil((z_breaks[i+1] - z0)/h)))
+            edges.append(np.linspace(z0,z_breaks[i+1],m+1)[:-1])
+            layers.append(np.full(m,i))
+        
+        altitude = np.append(np.concatenate(edges),z_breaks[-1])
+        layer    = np.concatenate(layers)
+        z0       = z_breaks[layer]
+        T0       = T_breaks[layer]
+        alpha    = -(T_breaks[layer+1] - T0)/(z_breaks[layer+1] - z0)
+        
+        # pressure at both ends of each interval from its own layer, the breaks are not continuous
+        dz    = np.stack([altitude[:-1],altitude[1:]],axis=1) - z0[:,None]
+        T     = T0[:,None] - dz*alpha[:,None]
+        p     = np.empty_like(dz)
+        isoth = (alpha == 0.)
+        adiab = ~isoth
+        p[isoth] = p_breaks[layer][isoth,None] * np.exp(-1.*dz[isoth]*grav/(R*T0[isoth,None]))
+        p[adiab] = p_breaks[layer][adiab,None] * ( (1.-alpha[adiab,None]*dz[adiab]/T0[adiab,None]) \
+                   **(1.*grav/(alpha[adiab,None]*R)) )
+        
+        # Hermite cubic of each interval, in powers of the fraction of the interval
+        h  = np.diff(altitude)
+        dp = -grav*p/(R*T)*h[:,None]
+        coefficients      = np.empty((len(h),4))
+        coefficients[:,0] = p[:,0]
+        coefficients[:,1] = dp[:,0]
+        coefficients[:,2] = 3.*(p[:,1] - p[:,0]) - 2.*dp[:,0] - dp[:,1]
+        coefficients[:,3] = 2.*(p[:,0] - p[:,1]) + dp[:,0] + dp[:,1]
+        
+        table = Data()
+        table.key                   = self.lookup_table_key()
+        table.tolerance             = tolerance
+        table.altitude              = altitude
+        table.layer_altitude        = z0
+        table.layer_temperature     = T0
+        table.lapse_rate            = alpha
+        table.inverse_spacing       = 1./h
+        table.pressure_coefficients = coefficients
+        
+        self.lookup_table = table
+        
+        return table
+
+    def lookup_table_key(self):
+        """The values the lookup table is built from, the table is built again when they change.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        key                                      [tuple]
+
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+          settings.lookup_table_tolerance        [-]
+        """
+        
+        breaks = self.breaks
+        key    = (self.settings.lookup_table_tolerance,
+                  self.planet.sea_level_gravity,
+                  self.fluid_properties.gas_specific_constant,
+                  np.asarray(breaks.altitude,dtype=float).tobytes(),
+                  np.asarray(breaks.temperature,dtype=float).tobytes(),
+                  np.asarray(breaks.pressure,dtype=float).tobytes())
+        
+        return key
 
 
 # ----------------------------------------------------------------------
@@ -0,0 +1,135 @@
+## @ingroup Analyses-Mission
+# Batch.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from copy import deepcopy
+
+from SUAVE.Core import Data
+from SUAVE.Methods import Missions as Methods
+
+from .Mission import Mission
+
+# ----------------------------------------------------------------------
+#   Class
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission
+class Batch(Mission):
+    """ Solves many variants of a segment at once on one stacked state
+
+        The variants are stacked along the control point rows. Steps in pointwise_steps
+        are evaluated once for all variants, every other step is evaluated variant by
+        variant on views of the stacked state. The stacked unknowns are solved together
+        with a block diagonal finite difference jacobian, so one jacobian costs as many
+        evaluations as one variant would.
+
+        Assumptions:
+        All variants have the same iterate process and share their analyses
+
+        Source:
+        None
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+            """
+
+        self.tag = 'batch'
+
+        # steps that only act row by row on the conditions
+        common = Methods.Segments.Common
+        self.pointwise_steps = [common.Aerodynamics.update_altitude,
+                                common.Aerodynamics.update_atmosphere,
+                                common.Weights.update_gravity,
+                                common.Aerodynamics.update_freestream,
+                                common.Frames.update_orientations,
+                                common.Aerodynamics.update_aerodynamics,
+                                common.Aerodynamics.update_stability,
+                                common.Frames.update_forces]
+
+        self.stacked = Data()
+
+        # --------------------------------------------------------------
+        #   The Solving Process
+        # --------------------------------------------------------------
+
+        # --------------------------------------------------------------
+        #   Initialize
+        # --------------------------------------------------------------
+        self.process.initialize.variants             = Methods.Segments.Common.Batch.initialize_variants
+        self.process.initialize.stack_variant_states = Methods.Segments.Common.Batch.stack_variant_states
+
+        # --------------------------------------------------------------
+        #   Converge
+        # --------------------------------------------------------------
+        self.process.converge.converge_root          = Methods.Segments.converge_root
+
+        # --------------------------------------------------------------
+        #   Iterate
+        # --------------------------------------------------------------
+        self.process.iterate.variants                = Methods.Segments.Common.Batch.iterate_variants
+
+        # --------------------------------------------------------------
+        #   Finalize
+        # --------------------------------------------------------------
+        self.process.finalize.variants               = Methods.Segments.Common.Batch.finalize_variants
+
+    def append_variants(self,segment,key,values):
+        """ Adds one copy of a segment for each value of one of its attributes
+
+            Assumptions:
+            The copies share the analyses and the process of the segment
+
+            Source:
+            N/A
+
+            Inputs:
+            segment  [Segment()]
+            key      [string], dotted paths like 'state.numerics.number_control_points' are allowed
+            values   [list]
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        analyses = segment.analyses
+        process  = segment.process
+        segment.analyses = None
+        segment.process  = None
+
+        try:
+            for i, value in enumerate(values):
+                variant = deepcopy(segment)
+                variant.analyses = analyses
+                variant.process  = process
+                variant.tag = segment.tag + '_' + str(i)
+                variant.deep_set(key,value)
+                self.append_segment(variant)
+        finally:
+            segment.analyses = analyses
+            segment.process  = process
+
+        return
@@ -5,6 +5,7 @@
 # Modified: Feb 2016, A. Wendorff
 #           Jun 2017, E. Botero
 #           Jan 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -101,7 +102,8 @@ class Conditions(Data):
             right size.
         
             Assumptions:
-            None
+            The 2D arrays of these and any nested conditions become column views of one buffer per dtype.
+            Nested conditions that expand their rows differently are left to do so.
     
             Source:
             N/A
@@ -116,23 +118,61 @@ class Conditions(Data):
             None
         """           
         
+        # recursively find the condition and unknown arrays 
+        # that need the given row length
+        entries = []
+        self.collect_rows(rows,entries)
+        
+        # size them out in one buffer per dtype
+        for dtype, group in group_columns(entries).items():
+            columns = sum([v.shape[1] for data,k,v in group])
+            buffer  = np.empty([rows,columns],dtype=dtype,order='F')
+            start   = 0
+            for data,k,v in group:
+                end  = start + v.shape[1]
+                view = buffer[:,start:end]
+                if v.shape[0] in (1,rows):
+                    view[:,:] = v
+                else:
+                    view[:,:] = np.resize(v,[rows,v.shape[1]])
+                data[k] = view
+                start   = end
+        
+        return
+    
+    def collect_rows(self,rows,entries):
+        """ Stores the row length and lists the 2D arrays that expand_rows sizes out, recursing into nested conditions
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            rows    [int]
+            entries [list]
+    
+            Outputs:
+            entries [list of (data, key, array)]
+    
+            Properties Used:
+            None
+        """  
+        
         # store
         self._size = rows
         
-        # recursively initialize condition and unknown arrays 
-        # to have given row length
-        
         for k,v in self.items():
-            try:
-                rank = v.ndim
-            except:
-                rank = 0
             # recursion
             if isinstance(v,Conditions):
-                v.expand_rows(rows)
+                if type(v).expand_rows is Conditions.expand_rows:
+                    v.collect_rows(rows,entries)
+                else:
+                    v.expand_rows(rows)
             # need arrays here
-            elif rank == 2:
-                self[k] = np.resize(v,[rows,v.shape[1]])
+            elif isinstance(v,np.ndarray) and v.ndim == 2:
+                entries.append((self,k,v))
             #: if type
         #: for each key,value
         
@@ -156,4 +196,29 @@ class Conditions(Data):
             Properties Used:
             None
         """          
-        self.expand_rows()
\ No newline at end of file
+        self.expand_rows()
+
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def group_columns(entries):
+    """ Groups arrays by dtype so each group can share one buffer
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        entries [list of (data, key, array)]
+
+        Outputs:
+        groups  [dict of lists]
+
+        Properties Used:
+        None
+    """       
+    groups = {}
+    for entry in entries:
+        groups.setdefault(entry[-1].dtype,[]).append(entry)
+    return groups
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -52,7 +53,16 @@ class Numerics(Conditions):
         self.number_control_points = 16
         self.discretization_method = chebyshev_data
         
-        self.solver_jacobian                  = "none"
+        self.solver_jacobian                  = "none" # "none", "function", "finite_difference" or "complex_step"
+        self.jacobian_function                = None
+        self.jacobian_sparsity                = None
+        self.jacobian_sparsity_shift          = 1e-3 # relative shift of the second point the pattern is taken at
+        self.jacobian_step                    = np.sqrt(np.finfo(float).eps)
+        self.jacobian                         = None
+        self.jacobian_from_previous_segment   = False
+        self.solver_broyden                   = False
+        self.solver_warm_start                = False
+        self.converged_unknowns               = None
         self.tolerance_solution               = 1e-8
         self.converged                        = None
         self.max_evaluations                  = 0.
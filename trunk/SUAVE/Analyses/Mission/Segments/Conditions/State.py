@@ -4,6 +4,7 @@
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
 #           Jan 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -149,12 +150,9 @@ class Container(State):
         
         state_out = State()
         
-        for i,(tag,sub_state) in enumerate(self.segments.items()):
-            for key in ['unknowns','conditions','residuals']:
-                if i == 0:
-                    state_out[key].update(sub_state[key])
-                else:
-                    state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
+        sub_states = list(self.segments.values())
+        for key in ['unknowns','conditions','residuals']:
+            state_out[key] = merge_rows(state_out[key],[sub_state[key] for sub_state in sub_states])
             
         return state_out
         
@@ -183,4 +181,83 @@ def append_array(A,B=None):
     if isinstance(A,array_type) and isinstance(B,array_type):
         return np.vstack([A,B])
     else:
-        return None
\ No newline at end of file
+        return None
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def merge_rows(out,datas):
+    """ Stacks the arrays of several data structures along their rows, giving the same result as
+        appending them one by one with append_array. The 2D arrays are copied once into one
+        buffer per dtype and handed back as column views of it.
+
+        Assumptions:
+        Only keys that every data structure has are merged, values that aren't arrays in all of them are dropped.
+        A single data structure is merged by reference, like an update.
+
+        Source:
+        N/A
+
+        Inputs:
+        out    [Data], gives the class of the merged structure, it is updated if there is only one data structure
+        datas  [list of Data]
+
+        Outputs:
+        merged [Data]
+
+        Properties Used:
+        None
+    """       
+    if len(datas) == 0:
+        return out
+    if len(datas) == 1:
+        out.update(datas[0])
+        return out
+    
+    klass   = out.__class__
+    entries = []
+    
+    def do_merge(As,C):
+        for k,a in As[0].items():
+            if not all([k in A for A in As[1:]]):
+                continue
+            values = [a] + [A[k] for A in As[1:]]
+            # recursion
+            if isinstance(a,SUAVE.Core.Data):
+                if all([isinstance(v,SUAVE.Core.Data) for v in values]):
+                    c = klass()
+                    C[k] = c
+                    do_merge(values,c)
+            # arrays
+            elif all([isinstance(v,array_type) for v in values]):
+                if all([v.ndim == 2 and v.shape[1] == a.shape[1] for v in values]):
+                    # keeps the key order, filled in below
+                    C[k] = None
+                    entries.append((C,k,values))
+                else:
+                    C[k] = np.vstack(values)
+    
+    result = klass()
+    do_merge(datas,result)
+    
+    # rows of each data structure in the merged arrays, the row counts can differ between keys
+    by_rows = {}
+    for entry in entries:
+        rows = tuple([v.shape[0] for v in entry[-1]])
+        by_rows.setdefault(rows,[]).append(entry)
+        
+    for rows, row_entries in by_rows.items():
+        starts = np.cumsum((0,) + rows)
+        groups = {}
+        for C,k,values in row_entries:
+            groups.setdefault(np.result_type(*values),[]).append((C,k,values))
+        for dtype, group in groups.items():
+            columns = sum([values[0].shape[1] for C,k,values in group])
+            buffer  = np.empty([starts[-1],columns],dtype=dtype,order='F')
+            start   = 0
+            for C,k,values in group:
+                end = start + values[0].shape[1]
+                for i, v in enumerate(values):
+                    buffer[starts[i]:starts[i+1],start:end] = v
+                C[k]  = buffer[:,start:end]
+                start = end
+    
+    return result
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Sep 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,8 +13,7 @@
 
 from SUAVE.Analyses import Analysis, Settings, Process
 from .Conditions import State
-from SUAVE.Core.Arrays import array_type
-import numpy as np
+from .Conditions.State import merge_rows, append_array
 
 # ----------------------------------------------------------------------
 #  Segment
@@ -221,13 +221,9 @@ class Segment(Analysis):
         
         state_out = State()
         
-        for i,(tag,sub_seg) in enumerate(self.segments.items()):
-            sub_state = sub_seg.state
-            for key in ['unknowns','conditions','residuals']:
-                if i == 0:
-                    state_out[key].update(sub_state[key])
-                else:
-                    state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
+        sub_states = [sub_seg.state for sub_seg in self.segments.values()]
+        for key in ['unknowns','conditions','residuals']:
+            state_out[key] = merge_rows(state_out[key],[sub_state[key] for sub_state in sub_states])
             
         return state_out
 
@@ -294,28 +290,3 @@ class Container(Segment):
         
 Segment.Container = Container
 
-
-## @ingroup Analyses-Mission-Segments-Conditions
-def append_array(A,B=None):
-    """ A stacking operation used by merged to put together data structures
-
-        Assumptions:
-        None
-
-        Source:
-        N/A
-
-        Inputs:
-        A [array]
-        B [array]
-
-        Outputs:
-        array
-
-        Properties Used:
-        None
-    """       
-    if isinstance(A,array_type) and isinstance(B,array_type):
-        return np.vstack([A,B])
-    else:
-        return None
\ No newline at end of file
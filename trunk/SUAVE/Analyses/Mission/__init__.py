@@ -4,6 +4,7 @@
 
 # classes
 from .All_At_Once import All_At_Once
+from .Batch import Batch
 from .Mission import Mission
 from .Sequential_Segments import Sequential_Segments
 
@@ -3,12 +3,15 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 from .Noise import Noise
 
+import numpy as np
+
 # ----------------------------------------------------------------------
 #  Analysis
 # ----------------------------------------------------------------------
@@ -54,4 +57,10 @@ class Fidelity_One(Noise):
         settings.approach       = 0
         settings.sideline       = 0
         settings.mic_x_position = 0
+
+        # microphone grid of noise_footprint
+        settings.footprint_x_positions         = np.linspace(-1000.,9000.,21)
+        settings.footprint_lateral_positions   = np.linspace(0.,1500.,7)
+        settings.footprint_observers_per_shard = 100
+        settings.number_of_processes           = 1
         
\ No newline at end of file
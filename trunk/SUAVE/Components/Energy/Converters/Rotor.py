@@ -5,6 +5,7 @@
 # Modified: Jan 2016, T. MacDonald
 #           Feb 2019, M. Vegh            
 #           Mar 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
@@ -19,6 +20,7 @@ from scipy.optimize import fsolve
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_polars import compute_airfoil_polars
 from SUAVE.Methods.Geometry.Three_Dimensional \
      import angles_to_dcms, orientation_product, orientation_transpose
+from SUAVE.Methods.Propulsion.rotor_inflow import solve_rotor_inflow
 
 from warnings import warn
 
@@ -72,6 +74,7 @@ class Rotor(Energy_Component):
         self.airfoil_geometry         = None
         self.airfoil_polars           = None
         self.airfoil_polar_stations   = None 
+        self.airfoil_polar_cache_directory = None
         self.radius_distribution      = None
         self.rotation                 = None
         self.ducted                   = False
@@ -117,6 +120,8 @@ class Rotor(Energy_Component):
           thrust                     [N]
           power                      [W]
           mid_chord_aligment         [m] (distance from the mid chord to the line axis out of the center of the blade)
+          converged                  [-] (convergence of the inflow at each control point)
+          axial_flight               [-] (control points in vertical/axial flight, the rest in forward flight)
         conditions.propulsion.etap   [-]
         thrust                       [N]
         torque                       [Nm]
@@ -212,16 +217,20 @@ class Rotor(Energy_Component):
         #Things that don't change with iteration
         N       = len(c) # Number of stations     
         
+        polars  = None
+        
         if  a_pol != None and a_loc != None:
             airfoil_polars = Data() 
             # check dimension of section
             if len(a_loc) != N:
                 raise AssertionError('Dimension of airfoil sections must be equal to number of stations on rotor')
             # compute airfoil polars for airfoils 
-            airfoil_polars = compute_airfoil_polars(self, a_geo, a_pol)
-            airfoil_cl     = airfoil_polars.lift_coefficients
-            airfoil_cd     = airfoil_polars.drag_coefficients
-            AoA_sweep      = airfoil_polars.angle_of_attacks
+            airfoil_polars = compute_airfoil_polars(self, a_geo, a_pol, self.airfoil_polar_cache_directory)
+            
+            # the polar of each station, interpolated at every condition at once
+            polars                   = Data()
+            polars.angle_of_attacks  = airfoil_polars.angle_of_attacks
+            polars.lift_coefficients = airfoil_polars.lift_coefficients[a_loc]
         
         if self.radius_distribution is None:
             chi0    = Rh/R   # Where the rotor blade actually starts
@@ -242,103 +251,17 @@ class Rotor(Energy_Component):
         Ut          = omegar - ut
         U           = np.sqrt(Ua*Ua + Ut*Ut)
         
-        #Things that will change with iteration
-        size = (len(a),N)
-        Cl = np.zeros((1,N)) 
-        
-        #Setup a Newton iteration
-        psi    = np.ones(size)
-        psiold = np.zeros(size)
-        diff   = 1.
-        
-        ii = 0
-        broke = False        
-        while (diff>tol):
-            sin_psi = np.sin(psi)
-            cos_psi = np.cos(psi)
-            Wa      = 0.5*Ua + 0.5*U*sin_psi
-            Wt      = 0.5*Ut + 0.5*U*cos_psi   
-            va      = Wa - Ua
-            vt      = Ut - Wt
-            alpha   = beta - np.arctan2(Wa,Wt)
-            W       = (Wa*Wa + Wt*Wt)**0.5
-            Ma      = (W)/a #a is the speed of sound  
-            lamdaw  = r*Wa/(R*Wt)
-            
-            # Limiter to keep from Nan-ing
-            lamdaw[lamdaw<0.] = 0.
-            
-            f            = (B/2.)*(1.-r/R)/lamdaw
-            piece        = np.exp(-f)
-            arccos_piece = np.arccos(piece)
-            F            = 2.*arccos_piece/pi
-            Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
-            
-            # Estimate Cl max
-            Re         = (W*c)/nu 
-            Cl_max_ref = -0.0009*tc**3 + 0.0217*tc**2 - 0.0442*tc + 0.7005
-            Re_ref     = 9.*10**6      
-            Cl1maxp    = Cl_max_ref * ( Re / Re_ref ) **0.1
-            
-            # Compute blade CL distribution from the airfoil data 
-            if  a_pol != None and a_loc != None: 
-                for k in range(N):
-                    Cl[0,k] = np.interp(alpha[0,k],AoA_sweep,airfoil_cl[a_loc[k]])
-            else:
-                # If not airfoil polar provided, use 2*pi as lift curve slope
-                Cl = 2.*pi*alpha
-            
-            # By 90 deg, it's totally stalled.
-            Cl[Cl>Cl1maxp]  = Cl1maxp[Cl>Cl1maxp] # This line of code is what changed the regression testing
-            Cl[alpha>=pi/2] = 0.
-                
-            # Scale for Mach, this is Karmen_Tsien
-            Cl[Ma[:,:]<1.] = Cl[Ma[:,:]<1.]/((1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5))*Cl[Ma<1.]/2)
-        
-            # If the blade segments are supersonic, don't scale
-            Cl[Ma[:,:]>=1.] = Cl[Ma[:,:]>=1.] 
-        
-            Rsquiggly = Gamma - 0.5*W*c*Cl
-            
-            #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
-            #This was solved symbolically in Matlab and exported        
-            f_wt_2 = 4*Wt*Wt
-            f_wa_2 = 4*Wa*Wa
-            Ucospsi  = U*cos_psi
-            Usinpsi  = U*sin_psi
-            Utcospsi = Ut*cos_psi
-            Uasinpsi = Ua*sin_psi
-            
-            UapUsinpsi = (Ua + Usinpsi)
-            utpUcospsi = (Ut + Ucospsi)
-            
-            utpUcospsi2 = utpUcospsi*utpUcospsi
-            UapUsinpsi2 = UapUsinpsi*UapUsinpsi
-            
-            dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
-                       (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                       + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                       - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. - 
-                      (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
-                       r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U + 
-                       Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5))) 
-            
-            dR_dpsi[np.isnan(dR_dpsi)] = 0.1
-                      
-            dpsi   = -Rsquiggly/dR_dpsi
-            psi    = psi + dpsi
-            diff   = np.max(abs(psiold-psi))
-            psiold = psi
-            
-            # If its really not going to converge
-            if np.any(psi>(pi*85.0/180.)) and np.any(dpsi>0.0):
-                break
-                
-            ii+=1
-                
-            if ii>2000:
-                broke = True
-                break
+        # Solve for the inflow angle, the conditions that converged drop out of the iteration
+        sections, converged, iterations = solve_rotor_inflow(Ua,Ut,U,beta,r,c,R,B,a,nu,tc,polars,True,1.,tol)
+        Wa    = sections.Wa
+        Wt    = sections.Wt
+        va    = sections.va
+        vt    = sections.vt
+        alpha = sections.alpha
+        Ma    = sections.Ma
+        Re    = sections.Re
+        Gamma = sections.Gamma
+        Cl    = sections.Cl
         
         #There is also RE scaling
         #This is an atrocious fit of DAE51 data at RE=50k for Cd
@@ -368,18 +291,18 @@ class Rotor(Energy_Component):
         Ct       = thrust/(rho*(n*n)*(D*D*D*D)) # used for motor model
         Ct[Ct<0] = 0.  
         Cd0      = self.profile_drag_coefficient   
-        Cp       = np.zeros_like(Ct)
         Cpl      = np.zeros_like(Ct)
         power    = np.zeros_like(Ct) 
-        for i in range(len(Vv)): 
-            if -1. < Vv[i][0] < 1.: # vertical/axial flight 
-                Cpl[i]      = (kappa*(Ctl[i]**1.5)/(2**.5))+sigma*Cd0/8. # Eqn 2.43 Principles of Helicopter Aerodynamics 
-                power[i]    = Cpl[i]*rho[i]*disk_area*(tip_speed[i]*tip_speed[i]*tip_speed[i]) 
-                torque[i]   = power[i]/omega[i]    
-            else:   
-                power[i]    = torque[i]*omega[i]   
-                torque[i]   = power[i]/omega[i]  
-            Cp[i] = power[i]/(rho[i]*(n[i]*n[i]*n[i])*(D*D*D*D*D))   
+        
+        # vertical/axial flight, the rest is forward flight
+        axial   = np.logical_and(-1. < Vv[:,0], Vv[:,0] < 1.)
+        forward = np.logical_not(axial)
+        
+        Cpl[axial]     = (kappa*(Ctl[axial]**1.5)/(2**.5))+sigma*Cd0/8. # Eqn 2.43 Principles of Helicopter Aerodynamics
+        power[axial]   = Cpl[axial]*rho[axial]*disk_area*(tip_speed[axial]*tip_speed[axial]*tip_speed[axial])
+        power[forward] = torque[forward]*omega[forward]
+        torque         = power/omega
+        Cp             = power/(rho*(n*n*n)*(D*D*D*D*D))
         
         # torque coefficient 
         Cq = torque/(rho*(n*n)*(D*D*D*D)*R) 
@@ -424,7 +347,9 @@ class Rotor(Energy_Component):
             torque_coefficient               = Cq,   
             power                            = power,
             power_coefficient                = Cp, 
-            mid_chord_aligment               = self.mid_chord_aligment     
+            mid_chord_aligment               = self.mid_chord_aligment,
+            converged                        = converged,
+            axial_flight                     = axial[:,None]
         ) 
  
         return thrust, torque, power, Cp, outputs  , etap  
@@ -469,6 +394,8 @@ class Rotor(Energy_Component):
           thrust                     [N]
           power                      [W]
           mid_chord_aligment         [m] (distance from the mid chord to the line axis out of the center of the blade)
+          converged                  [-] (convergence of the inflow at each control point)
+          axial_flight               [-] (control points in vertical/axial flight, the rest in forward flight)
         conditions.propulsion.etap   [-]
         thrust                       [N]
         torque                       [Nm]
@@ -556,16 +483,20 @@ class Rotor(Energy_Component):
         #Things that don't change with iteration
         N       = len(c) # Number of stations     
         
+        polars  = None
+        
         if  a_pol != None and a_loc != None:
             airfoil_polars = Data() 
             # check dimension of section
             if len(a_loc) != N:
                 raise AssertionError('Dimension of airfoil sections must be equal to number of stations on rotor')
             # compute airfoil polars for airfoils 
-            airfoil_polars = compute_airfoil_polars(self, a_geo, a_pol)
-            airfoil_cl     = airfoil_polars.lift_coefficients
-            airfoil_cd     = airfoil_polars.drag_coefficients
-            AoA_sweep      = airfoil_polars.angle_of_attacks
+            airfoil_polars = compute_airfoil_polars(self, a_geo, a_pol, self.airfoil_polar_cache_directory)
+            
+            # the polar of each station, interpolated at every condition at once
+            polars                   = Data()
+            polars.angle_of_attacks  = airfoil_polars.angle_of_attacks
+            polars.lift_coefficients = airfoil_polars.lift_coefficients[a_loc]
         
         if self.radius_distribution is None:
             chi0    = Rh/R   # Where the rotor blade actually starts
@@ -587,106 +518,19 @@ class Rotor(Energy_Component):
         Ut         = omegar - ut
         U          = np.sqrt(Ua*Ua + Ut*Ut)
         
-        #Things that will change with iteration
-        size = (len(a),N)
-        Cl   = np.zeros((1,N))  
-        
-        #Setup a Newton iteration
-        psi    = np.ones(size)*0.5
-        psiold = np.zeros(size)
-        diff   = 1.
-        
-        ii    = 0
-        broke = False 
-        tol   = 1e-6    # Convergence tolerance         
-        while (diff>tol):
-            sin_psi = np.sin(psi)
-            cos_psi = np.cos(psi)
-            Wa      = 0.5*Ua + 0.5*U*sin_psi
-            Wt      = 0.5*Ut + 0.5*U*cos_psi   
-            va      = Wa - Ua
-            vt      = Ut - Wt
-            alpha   = beta - np.arctan2(Wa,Wt)
-            W       = (Wa*Wa + Wt*Wt)**0.5
-            Ma      = (W)/a #a is the speed of sound  
-            lamdaw  = r*Wa/(R*Wt)
-            
-            # Limiter to keep from Nan-ing
-            lamdaw[lamdaw<0.] = 0.
-            
-            f            = (B/2.)*(1.-r/R)/lamdaw
-            piece        = np.exp(-f)
-            arccos_piece = np.arccos(piece)
-            F            = 2.*arccos_piece/pi
-            Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
-            
-            # Estimate Cl max
-            Re         = (W*c)/nu 
-            Cl_max_ref = -0.0009*tc**3 + 0.0217*tc**2 - 0.0442*tc + 0.7005
-            Re_ref     = 9.*10**6      
-            Cl1maxp    = Cl_max_ref * ( Re / Re_ref ) **0.1
-            
-            # Compute blade CL distribution from the airfoil data 
-            if  a_pol != None and a_loc != None: 
-                for k in range(N):
-                    Cl[0,k] = np.interp(alpha[0,k],AoA_sweep,airfoil_cl[a_loc[k]])
-            else:
-                # If not airfoil polar provided, use 2*pi as lift curve slope
-                Cl = 2.*pi*alpha
-            
-            # By 90 deg, it's totally stalled.
-            Cl[Cl>Cl1maxp]  = Cl1maxp[Cl>Cl1maxp] # This line of code is what changed the regression testing
-            Cl[alpha>=pi/2] = 0.
-            
-            # Scale for Mach, this is Karmen_Tsien
-            Cl[Ma[:,:]<1.] = Cl[Ma[:,:]<1.]/((1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5))*Cl[Ma<1.]/2)
-            
-            # If the blade segments are supersonic, don't scale
-            Cl[Ma[:,:]>=1.] = Cl[Ma[:,:]>=1.] 
-            
-            Rsquiggly = Gamma - 0.5*W*c*Cl
-            
-            #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
-            #This was solved symbolically in Matlab and exported        
-            f_wt_2 = 4*Wt*Wt
-            f_wa_2 = 4*Wa*Wa
-            Ucospsi  = U*cos_psi
-            Usinpsi  = U*sin_psi
-            Utcospsi = Ut*cos_psi
-            Uasinpsi = Ua*sin_psi
-            
-            UapUsinpsi = (Ua + Usinpsi)
-            utpUcospsi = (Ut + Ucospsi)
-            
-            utpUcospsi2 = utpUcospsi*utpUcospsi
-            UapUsinpsi2 = UapUsinpsi*UapUsinpsi
-            
-            dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
-                       (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                       + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                       - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. - 
-                      (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
-                       r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U + 
-                       Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5))) 
-            
-            dR_dpsi[np.isnan(dR_dpsi)] = 0.1
-                      
-            dpsi   = -Rsquiggly/dR_dpsi
-            psi    = psi + dpsi
-            diff   = np.max(abs(psiold-psi))
-            psiold = psi
-            
-            # If its really not going to converge
-            if np.any(psi>(pi*85.0/180.)) and np.any(dpsi>0.0):
-                broke = True
-                break
-                
-            ii+=1
-                
-            if ii>2000:
-                broke = True
-                break
-            
+        tol   = 1e-6    # Convergence tolerance
+        # Solve for the inflow angle, the conditions that converged drop out of the iteration
+        sections, converged, iterations = solve_rotor_inflow(Ua,Ut,U,beta,r,c,R,B,a,nu,tc,polars,True,0.5,tol)
+        Wa    = sections.Wa
+        Wt    = sections.Wt
+        va    = sections.va
+        vt    = sections.vt
+        alpha = sections.alpha
+        Ma    = sections.Ma
+        Re    = sections.Re
+        Gamma = sections.Gamma
+        Cl    = sections.Cl
+        
         # There is also RE scaling
         #This is an atrocious fit of DAE51 data at RE=50k for Cd
         Cdval = (0.108*(Cl*Cl*Cl*Cl)-0.2612*(Cl*Cl*Cl)+0.181*(Cl*Cl)-0.0139*Cl+0.0278)*((50000./Re)**0.2)
@@ -715,18 +559,18 @@ class Rotor(Energy_Component):
         Ct       = thrust/(rho*(n*n)*(D*D*D*D)) # used for motor model
         Ct[Ct<0] = 0.  
         Cd0      = self.profile_drag_coefficient   
-        Cp       = np.zeros_like(Ct)
         Cpl      = np.zeros_like(Ct)
         power    = np.zeros_like(Ct) 
-        for i in range(len(Vv)): 
-            if -1. < Vv[i][0] < 1.: # vertical/axial flight 
-                Cpl[i]      = (kappa*(Ctl[i]**1.5)/(2**.5))+sigma*Cd0/8. # Eqn 2.43 Principles of Helicopter Aerodynamics 
-                power[i]    = Cpl[i]*rho[i]*disk_area*(tip_speed[i]*tip_speed[i]*tip_speed[i]) 
-                torque[i]   = power[i]/omega[i]    
-            else:   
-                power[i]    = torque[i]*omega[i]   
-                torque[i]   = power[i]/omega[i]  
-            Cp[i] = power[i]/(rho[i]*(n[i]*n[i]*n[i])*(D*D*D*D*D))  
+        
+        # vertical/axial flight, the rest is forward flight
+        axial   = np.logical_and(-1. < Vv[:,0], Vv[:,0] < 1.)
+        forward = np.logical_not(axial)
+        
+        Cpl[axial]     = (kappa*(Ctl[axial]**1.5)/(2**.5))+sigma*Cd0/8. # Eqn 2.43 Principles of Helicopter Aerodynamics
+        power[axial]   = Cpl[axial]*rho[axial]*disk_area*(tip_speed[axial]*tip_speed[axial]*tip_speed[axial])
+        power[forward] = torque[forward]*omega[forward]
+        torque         = power/omega
+        Cp             = power/(rho*(n*n*n)*(D*D*D*D*D))
         
         # torque coefficient 
         Cq = torque/(rho*(n*n)*(D*D*D*D)*R) 
@@ -772,7 +616,9 @@ class Rotor(Energy_Component):
             torque_coefficient               = Cq,   
             power                            = power,
             power_coefficient                = Cp, 
-            mid_chord_aligment               = self.mid_chord_aligment     
+            mid_chord_aligment               = self.mid_chord_aligment,
+            converged                        = converged,
+            axial_flight                     = axial[:,None]
         ) 
         
         return thrust, torque, power, Cp, outputs , etap
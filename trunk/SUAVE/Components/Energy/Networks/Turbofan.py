@@ -7,6 +7,7 @@
 #           Aug 2017, E. Botero
 #           Oct 2017, E. Botero
 #           Nov 2018, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -20,6 +21,7 @@ import numpy as np
 
 from SUAVE.Core import Data
 from SUAVE.Components.Propulsors.Propulsor import Propulsor
+from SUAVE.Methods.Propulsion.turbofan_cycle import evaluate_turbofan_cycle, can_evaluate_turbofan_cycle
 
 # ----------------------------------------------------------------------
 #  Turbofan Network
@@ -64,6 +66,7 @@ class Turbofan(Propulsor):
         self.bypass_ratio         = 0.0
         self.SFC_adjustment       = 0.0 # Less than 1 is a reduction
         self.OpenVSP_flow_through = False
+        self.fused_cycle          = True # evaluates the standard components in one pass
         
         #areas needed for drag; not in there yet
         self.areas             = Data()
@@ -78,12 +81,14 @@ class Turbofan(Propulsor):
         self.generative_design_char_min_bounds = [1000.,2.,0.1,0.,-0.7,-0.7]   
         self.generative_design_char_max_bounds = [np.inf,2,np.inf,0.7,0.7,0.7]    
         
-    # linking the different network components
     def evaluate_thrust(self,state):
         """ Calculate thrust given the current state of the vehicle
     
             Assumptions:
-            None
+            With fused_cycle, a network of the standard components is evaluated in one pass by
+            evaluate_turbofan_cycle, which only updates the stagnation states in and out of the
+            combustor and the outputs of the thrust among the inputs and outputs of the components.
+            Any other network is evaluated by linking its components, see evaluate_components.
     
             Source:
             N/A
@@ -112,6 +117,32 @@ class Turbofan(Propulsor):
             Defaulted values
         """           
 
+        if self.fused_cycle and can_evaluate_turbofan_cycle(self):
+            return evaluate_turbofan_cycle(self,state.conditions)
+        
+        return self.evaluate_components(state)
+    
+    # linking the different network components
+    def evaluate_components(self,state):
+        """ Calculate thrust given the current state of the vehicle, by linking the inputs and
+            outputs of the components one after the other
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            state [state()]
+    
+            Outputs:
+            see evaluate_thrust
+    
+            Properties Used:
+            Defaulted values
+        """           
+
         #Unpack
         conditions = state.conditions
         
@@ -318,6 +349,11 @@ class Turbofan(Propulsor):
         #Unpack components
         conditions = state.conditions
         thrust     = self.thrust
+        
+        # the thrust is sized on the inputs linked by the components
+        if self.fused_cycle:
+            self.evaluate_components(state)
+            
         thrust.size(conditions)
         
     def engine_out(self,state):
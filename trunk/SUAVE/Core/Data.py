@@ -4,6 +4,7 @@
 # Created:  Jun 2016, E. Botero
 # Modified: Jan 2020, M. Clarke
 #           May 2020, E. Botero
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -13,12 +14,23 @@
 # for enforcing attribute style access names
 import string
 from warnings import warn
+from .Layout import Layout
 chars = string.punctuation + string.whitespace
 t_table = str.maketrans( chars          + string.ascii_uppercase , 
                             '_'*len(chars) + string.ascii_lowercase )
 
-dictgetitem = dict.__getitem__
+dictgetitem  = dict.__getitem__
+dictget      = dict.get
 objgetattrib = object.__getattribute__
+objsetattr   = object.__setattr__
+objdelattr   = object.__delattr__
+
+# marks a key that isn't in the dictionary
+_missing = object()
+
+# per class caches, filled on first use
+_class_attributes = {}
+_class_defaults   = {}
 
 # ----------------------------------------------------------------------
 #   Data
@@ -41,7 +53,7 @@ class Data(dict):
         """ Retrieves an attribute set by a key k
     
             Assumptions:
-            Does a try if it is a dict, but if that fails treats it as an object
+            Looks k up as a key first, if it isn't one treats it as an object attribute
     
             Source:
             N/A
@@ -55,16 +67,16 @@ class Data(dict):
             Properties Used:
             N/A
             """         
-        try:
-            return dictgetitem(self,k)
-        except:
+        v = dictget(self,k,_missing)
+        if v is _missing:
             return objgetattrib(self,k)
+        return v
 
     def __setattr__(self, k, v):
         """ An override of the standard __setattr_ in Python.
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            k is treated as an object attribute if the instance or its class has one, otherwise as a key.
     
             Source:
             N/A
@@ -79,18 +91,16 @@ class Data(dict):
             Properties Used:
             N/A    
         """
-        try:
-            objgetattrib(self, k)
-        except:
+        if is_attribute(self, k):
+            objsetattr(self, k, v)
+        else:
             self[k] = v
-        else:          
-            object.__setattr__(self, k, v) 
             
     def __delattr__(self, k):
         """ An override of the standard __delattr_ in Python. This deletes whatever is called by k
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            k is treated as an object attribute if the instance or its class has one, otherwise as a key.
     
             Source:
             N/A
@@ -104,12 +114,10 @@ class Data(dict):
             Properties Used:
             N/A    
         """        
-        try:
-            objgetattrib(self, k)
-        except:
-            del self[k]
+        if is_attribute(self, k):
+            objdelattr(self, k)
         else:
-            object.__delattr__(self, k)
+            del self[k]
     
     def __defaults__(self):
         """ A stub for all classes that come later
@@ -155,12 +163,13 @@ class Data(dict):
         self = super(Data,cls).__new__(cls)
         super(Data,self).__init__() 
         
-        # get base class list
-        klasses = self.get_bases()
-                
         # fill in defaults trunk to leaf
-        for klass in klasses[::-1]:
-            klass.__defaults__(self)
+        defaults = _class_defaults.get(cls)
+        if defaults is None:
+            defaults = class_defaults(self)
+            _class_defaults[cls] = defaults
+        for default in defaults:
+            default(self)
             
         return self
     
@@ -587,6 +596,12 @@ class Data(dict):
         
         """
         
+        # vectors are packed with the recorded layout when the data still fits it
+        if output == 'vector':
+            layout = self.layout()
+            if layout.valid:
+                return layout.pack()
+        
         # dont require dict to have numpy
         import numpy as np
         from .Arrays import atleast_2d_col, array_type, matrix_type
@@ -674,6 +689,13 @@ class Data(dict):
         """           
 
         
+        # vectors are unpacked with the recorded layout when the data still fits it
+        if M.ndim == 1:
+            layout = self.layout()
+            if layout.valid and layout.size == M.shape[0]:
+                layout.unpack(M)
+                return self
+        
         # dont require dict to have numpy
         import numpy as np
         from .Arrays import atleast_2d_col, array_type, matrix_type
@@ -753,6 +775,33 @@ class Data(dict):
         # done!
         return self     
     
+    def layout(self):
+        """ Returns the packing layout of the data, recording a new one if the data changed since the last
+    
+            Assumptions:
+            The layout is kept as an object attribute, so it isn't one of the keys
+    
+            Source:
+            N/A
+    
+            Inputs:
+            N/A
+            
+            Outputs:
+            layout - a Layout() of the packed values
+    
+            Properties Used:
+            N/A    
+        """
+        
+        attributes = objgetattrib(self,'__dict__')
+        layout     = attributes.get('_layout')
+        if layout is None or not layout.matches(self):
+            layout = Layout(self)
+            attributes['_layout'] = layout
+            
+        return layout
+    
     def do_recursive(self,method,other=None,default=None):
         """ Recursively applies a method of the class.
     
@@ -807,4 +856,65 @@ class Data(dict):
         # do the update!
         do_operation(self,other,result)    
     
-        return result
\ No newline at end of file
+        return result
+
+# ----------------------------------------------------------------------
+#   Class Caches
+# ----------------------------------------------------------------------        
+
+## @ingroup Core
+def is_attribute(data, k):
+    """ Checks if k is an object attribute of a Data() or its class, without raising on a miss
+        
+        Assumptions:
+        The class attribute names are cached the first time a class is used. Class attributes 
+        added after that are treated as keys when set on an instance.
+
+        Source:
+        N/A
+
+        Inputs:
+        data         [Data()]
+        k            [key]
+
+        Outputs:
+        is_attribute [bool]
+
+        Properties Used:
+        N/A    
+    """
+    if k in objgetattrib(data, '__dict__'):
+        return True
+    cls   = type(data)
+    names = _class_attributes.get(cls)
+    if names is None:
+        names = frozenset().union(*[vars(klass) for klass in cls.__mro__])
+        _class_attributes[cls] = names
+    return k in names
+
+## @ingroup Core
+def class_defaults(data):
+    """ Lists the __defaults__ a new Data() runs, trunk to leaf
+        
+        Assumptions:
+        Only classes that define their own __defaults__ are listed, so an inherited one 
+        isn't run twice and the stub in Data() isn't run at all
+
+        Source:
+        N/A
+
+        Inputs:
+        data         [Data()]
+
+        Outputs:
+        defaults     [list of functions]
+
+        Properties Used:
+        N/A    
+    """
+    defaults = []
+    for klass in data.get_bases()[::-1]:
+        default = vars(klass).get('__defaults__')
+        if default is not None and klass is not Data:
+            defaults.append(default)
+    return defaults
@@ -0,0 +1,265 @@
+## @ingroup Core
+# Layout.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from .Arrays import array_type, matrix_type
+
+dictget     = dict.get
+dictgetitem = dict.__getitem__
+
+# ----------------------------------------------------------------------
+#   Layout
+# ----------------------------------------------------------------------
+
+# kinds of leaves
+SKIP   = 0
+SCALAR = 1
+ARRAY  = 2
+
+## @ingroup Core
+class Layout(object):
+    """ Records where every value of a nested dictionary goes in the packed vector of
+        Data.pack_array, so packing and unpacking are slice copies without walking the tree.
+
+        Assumptions:
+        Same packing rules as Data.pack_array: int, float and arrays up to rank 2 are packed,
+        2D arrays in Fortran order. The layout is checked against the tree on every use,
+        a tree that changed keys, types, shapes or dtypes needs a new layout.
+        Trees holding np.matrix values aren't laid out.
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,data):
+        """ Walks the tree once and records the key, kind, shape and offset of every value
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data       [dict]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        self.nodes   = []
+        self.leaves  = []
+        self.size    = 0
+        self.valid   = True
+
+        dtypes = []
+        self.__walk(None,None,data,dtypes)
+
+        self.dtype = np.result_type(*dtypes) if dtypes else np.dtype(float)
+
+    def __walk(self,parent,key,node,dtypes):
+        """ Records a dictionary and everything in it
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            parent     [dict]
+            key        [key]
+            node       [dict]
+            dtypes     [list]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        self.nodes.append((parent,key,node,len(node)))
+
+        for k, v in node.items():
+            if isinstance(v,dict):
+                self.__walk(node,k,v,dtypes)
+                continue
+
+            if isinstance(v,matrix_type):
+                self.valid = False
+                kind  = SKIP
+                shape = None
+                dtype = None
+            elif isinstance(v,array_type) and v.ndim <= 2:
+                kind  = ARRAY
+                shape = v.shape
+                dtype = v.dtype
+                dtypes.append(dtype)
+            elif isinstance(v,(int,float)):
+                kind  = SCALAR
+                shape = ()
+                dtype = float if isinstance(v,float) else int
+                dtypes.append(np.dtype(dtype))
+            else:
+                kind  = SKIP
+                shape = getattr(v,'shape',None)
+                dtype = type(v)
+
+            start = self.size
+            if kind == SCALAR:
+                self.size += 1
+            elif kind == ARRAY:
+                self.size += v.size
+            self.leaves.append((node,k,kind,start,self.size,shape,dtype))
+
+    def matches(self,data):
+        """ Checks that the tree still has the keys, types, shapes and dtypes of the layout
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data       [dict]
+
+            Outputs:
+            matches    [bool]
+
+            Properties Used:
+            N/A
+        """
+
+        if not self.valid:
+            return False
+
+        parent, key, node, n = self.nodes[0]
+        if node is not data:
+            return False
+
+        for parent, key, node, n in self.nodes:
+            if len(node) != n:
+                return False
+            if parent is not None and dictget(parent,key) is not node:
+                return False
+
+        for node, key, kind, start, stop, shape, dtype in self.leaves:
+            v = dictgetitem(node,key)
+            if kind == ARRAY:
+                if type(v) is not array_type or v.shape != shape or v.dtype != dtype:
+                    return False
+            elif kind == SCALAR:
+                if not isinstance(v,dtype) or (dtype is int and isinstance(v,float)):
+                    return False
+            elif type(v) is not dtype or getattr(v,'shape',None) != shape:
+                return False
+
+        return True
+
+    def pack(self):
+        """ Copies every packed value into one new vector
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            vector     [array]
+
+            Properties Used:
+            N/A
+        """
+
+        vector = np.empty(self.size,dtype=self.dtype)
+
+        for node, key, kind, start, stop, shape, dtype in self.leaves:
+            if kind == ARRAY:
+                vector[start:stop] = dictgetitem(node,key).ravel(order='F')
+            elif kind == SCALAR:
+                vector[start] = dictgetitem(node,key)
+
+        return vector
+
+    def unpack(self,vector):
+        """ Copies a vector back into the values of the tree, arrays are filled in place
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            vector     [array]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        for node, key, kind, start, stop, shape, dtype in self.leaves:
+            if kind == ARRAY:
+                dictgetitem(node,key)[...] = vector[start:stop].reshape(shape,order='F')
+            elif kind == SCALAR:
+                node[key] = vector[start]
+
+        return
+
+    def __deepcopy__(self,memo):
+        """ Copies of a tree get a layout that doesn't match, so they lay themselves out again
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            memo       [dict]
+
+            Outputs:
+            layout     [Layout]
+
+            Properties Used:
+            N/A
+        """
+        return Layout({})
+
+    def __getstate__(self):
+        """ Layouts aren't archived, see __deepcopy__
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            state      [dict]
+
+            Properties Used:
+            N/A
+        """
+        return {'nodes':[(None,None,{},0)],'leaves':[],'size':0,'valid':False,'dtype':np.dtype(float)}
@@ -2,4 +2,7 @@
 # Functions needed to save SUAVE data structures in JSON form
 # @ingroup Input_Output
 from .load import load
-from .archive import archive
\ No newline at end of file
+from .archive import archive
+from .archive_binary import archive_binary
+from .load_binary import load_binary, load_binary_value
+from .archive_segments import Segment_Archive, load_segments
\ No newline at end of file
@@ -0,0 +1,228 @@
+## @ingroup Input_Output-SUAVE
+# archive_binary.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import types
+import json
+import struct
+from collections import OrderedDict
+
+# ----------------------------------------------------------------------
+#  Format
+# ----------------------------------------------------------------------
+
+# The file starts with the magic bytes, then holds the arrays, each aligned to 64 bytes, then a JSON index
+# of the data structure with the arrays replaced by their place in the file. It ends with the offset and
+# length of the index and the magic bytes again. The index is padded so the file is a multiple of 64 bytes
+# long, files written one after the other keep their arrays aligned.
+binary_magic     = b'SUAVEBIN'
+binary_alignment = 64
+binary_trailer   = struct.Struct('<QQ8s')
+array_marker     = '__array__'
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+def archive_binary(data,filename):
+    """Converts a SUAVE data structure to a binary file for storage. The arrays are written as they are in
+    memory, so they can be memory mapped one by one when loaded with load_binary.
+
+    Assumptions:
+    Data must be numpy arrays, strings, booleans, floats, ints, or lists.
+    Functions are ignored and all other data raises an error.
+
+    Source:
+    N/A
+
+    Inputs:
+    data       SUAVE data structure
+    filename   <string> - file to be output
+
+    Outputs:
+    filename   File in the binary format
+
+    Properties Used:
+    N/A
+    """
+
+    with open(filename,'wb') as f:
+        writer = Binary_Writer(f)
+
+        # Create a dictionary structure with the results, writing the arrays on the way
+        res_dict = OrderedDict()
+        for k in data.keys():
+            res_dict[k] = writer.build_dict_r(data[k])
+
+        writer.close(res_dict)
+
+## @ingroup Input_Output-SUAVE
+class Binary_Writer(object):
+    """Writes the arrays of a data structure to an open binary file and builds the index of the file.
+
+    Assumptions:
+    The file is opened for writing in binary, the offsets in the index are counted from where the writer starts
+
+    Source:
+    N/A
+    """
+
+    def __init__(self,f):
+        """Starts a binary file.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        f          open file
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        self.file   = f
+        self.offset = 0
+        self.write(binary_magic)
+
+    def write(self,data):
+        """Writes bytes at the end of the file.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        data       bytes or buffer
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        self.file.write(data)
+        self.offset += memoryview(data).nbytes
+
+    def write_array(self,array):
+        """Writes an array aligned in the file.
+
+        Assumptions:
+        The array does not hold python objects
+
+        Source:
+        N/A
+
+        Inputs:
+        array      numpy array
+
+        Outputs:
+        entry      place of the array in the file, for the index
+
+        Properties Used:
+        N/A
+        """
+        if array.dtype.hasobject:
+            raise TypeError('Unexpected data type in SUAVE data structure')
+
+        padding = -self.offset % binary_alignment
+        self.write(b'\0'*padding)
+
+        entry = OrderedDict()
+        entry['offset'] = self.offset
+        entry['dtype']  = array.dtype.str
+        entry['shape']  = list(array.shape)
+
+        self.write(np.ascontiguousarray(array).reshape(-1).view(np.uint8))
+
+        return OrderedDict([(array_marker,entry)])
+
+    def build_dict_r(self,v):
+        """Builds the index of a SUAVE data structure, writing its arrays. This the recursive step.
+
+        Assumptions:
+        Data must be numpy arrays, strings, booleans, floats, ints, or lists.
+        Functions are ignored and all other data raises an error.
+
+        Source:
+        N/A
+
+        Inputs:
+        v       value in a data structure
+
+        Outputs:
+        ret     value based on type of v
+
+        Properties Used:
+        N/A
+        """
+        tv = type(v) # Get value type
+
+        # Transform to basic python data type as appropriate
+        if tv == np.ndarray:
+            ret = self.write_array(v)
+        elif tv == np.float64:
+            ret = v.tolist()
+        elif (tv == str) or (tv == bool):
+            ret = v
+        elif tv == type(None):
+            ret = None
+        elif (tv == float) or (tv == int):
+            ret = v
+        elif tv == types.FunctionType: # Functions cannot be stored
+            ret = None
+        elif tv == list:
+            ret = v
+
+        else:
+            # Assume other data types are SUAVE data types and check
+            try:
+                keys = v.keys()
+            except:
+                if callable(tv):
+                    return None
+                else:
+                    raise TypeError('Unexpected data type in SUAVE data structure')
+            # Recursively assign values
+            ret = OrderedDict()
+            for k in keys:
+                ret[k] = self.build_dict_r(v[k])
+
+        return ret
+
+    def close(self,res_dict):
+        """Writes the index and the trailer of the file.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        res_dict   index of the data structure
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        index  = json.dumps(res_dict).encode('utf-8')
+        offset = self.offset
+        index += b' '*(-(offset + len(index) + binary_trailer.size) % binary_alignment)
+        self.write(index)
+        self.write(binary_trailer.pack(offset,len(index),binary_magic))
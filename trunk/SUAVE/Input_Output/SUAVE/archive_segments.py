@@ -0,0 +1,293 @@
+## @ingroup Input_Output-SUAVE
+# archive_segments.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+import numpy as np
+import json
+import os
+from collections import OrderedDict
+
+from .archive_binary import Binary_Writer, binary_magic, binary_trailer
+from .load_binary    import build_binary_data_r
+
+# ----------------------------------------------------------------------
+#  Segment_Archive
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+class Segment_Archive(Data):
+    """Writes the results of each segment of a mission to a file as soon as the segment is finalized.
+    Every segment is appended as a file of archive_binary, load_segments reads them back one at a time.
+    The archive is the step after finalize in the process of each segment, the finalize the mission
+    runs again on every segment once they are all done does not write them again. The first segment of
+    the mission starts the file over, so the file always holds the last run of the mission.
+
+    Assumptions:
+    The segment states hold numpy arrays, strings, booleans, floats, ints, or lists.
+
+    Source:
+    N/A
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+        """
+        self.filename = None
+        self.keys     = ['conditions']
+
+    def attach(self,mission):
+        """Adds the archive as the step after finalize of every segment of a mission, sub segments included.
+        The step of the first segment starts the file over.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        mission    [Segment()]
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+
+        segments = leaf_segments(mission)
+        for segment in segments:
+            segment.process.archive = self
+
+        if len(segments):
+            segments[0].process.archive = self.start
+
+    def clear(self):
+        """Starts the file over without any segments.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        self.filename
+        """
+
+        check_filename(self)
+
+        open(self.filename,'wb').close()
+
+    def start(self,segment):
+        """Starts the file over with a segment, the step of the first segment of a mission.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        segment    [Segment()]
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+
+        self.clear()
+        self.evaluate(segment)
+
+    def evaluate(self,segment):
+        """Appends the tag and the state of a segment to the file, the process step.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        segment    [Segment()]
+
+        Outputs:
+        None
+
+        Properties Used:
+        self.
+          filename
+          keys       parts of the segment state written
+        """
+
+        check_filename(self)
+
+        state = segment.state
+
+        with open(self.filename,'ab') as f:
+            writer = Binary_Writer(f)
+
+            res_dict = OrderedDict()
+            res_dict['tag'] = segment.tag
+            for k in self.keys:
+                res_dict[k] = writer.build_dict_r(state[k])
+
+            writer.close(res_dict)
+
+    def __call__(self,segment):
+        """This is used to set the class' call behavior to evaluate, so it can be a process step.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        segment    [Segment()]
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        return self.evaluate(segment)
+
+def leaf_segments(mission):
+    """Lists the segments of a mission that have no sub segments, in the order they are flown.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission    [Segment()]
+
+    Outputs:
+    segments   [list]
+
+    Properties Used:
+    N/A
+    """
+
+    segments = []
+    for segment in mission.segments.values():
+        if len(segment.get('segments',{})):
+            segments.extend(leaf_segments(segment))
+        else:
+            segments.append(segment)
+
+    return segments
+
+def check_filename(archive):
+    """Raises an error when the file of a Segment_Archive has not been set.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    archive    [Segment_Archive()]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    if archive.filename is None:
+        raise ValueError('Segment_Archive.filename has to be set before any segment is written')
+
+## @ingroup Input_Output-SUAVE
+def load_segments(filename,mmap_mode='r'):
+    """Reads the segments of a Segment_Archive file one at a time, in the order they were written.
+
+    Assumptions:
+    The file was written by Segment_Archive.
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string> - file to be loaded
+    mmap_mode  see load_binary, with None each segment is read when it is reached
+
+    Outputs:
+    segments   generator of SUAVE data structures, one per segment
+
+    Properties Used:
+    N/A
+    """
+
+    # every segment ends with the length of its index, so the segments are found from the end of the file
+    size    = os.path.getsize(filename)
+    records = []
+    with open(filename,'rb') as f:
+        stop = size
+        while stop > 0:
+            f.seek(stop - binary_trailer.size)
+            offset, length, magic = binary_trailer.unpack(f.read(binary_trailer.size))
+            start = stop - (offset + length + binary_trailer.size)
+            f.seek(max(start,0))
+            if magic != binary_magic or start < 0 or f.read(len(binary_magic)) != binary_magic:
+                raise ValueError(filename + ' is not a complete SUAVE segment file')
+            records.append((start,offset,length))
+            stop = start
+    records.reverse()
+
+    if mmap_mode is not None and size:
+        mapped = np.memmap(filename,dtype=np.uint8,mode=mmap_mode,shape=(size,))
+
+    for start, offset, length in records:
+        with open(filename,'rb') as f:
+            f.seek(start + offset)
+            index = f.read(length)
+        res_dict = json.loads(index.decode('utf-8'),object_pairs_hook=OrderedDict)
+
+        if mmap_mode is None:
+            buffer = np.fromfile(filename,dtype=np.uint8,count=offset,offset=start)
+        else:
+            buffer = mapped[start:start+offset]
+
+        # Convert to SUAVE data structure
+        SUAVE_data = Data()
+        for k in res_dict.keys():
+            SUAVE_data[str(k)] = build_binary_data_r(res_dict[k],buffer)
+
+        yield SUAVE_data
@@ -0,0 +1,177 @@
+## @ingroup Input_Output-SUAVE
+# load_binary.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import json
+from SUAVE.Core import Data, DataOrdered
+import numpy as np
+from collections import OrderedDict
+
+from .archive_binary import binary_magic, binary_trailer, array_marker
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+def load_binary(filename,mmap_mode='r'):
+    """Converts a binary file of archive_binary into a SUAVE data structure. The file is memory mapped
+    once and every array is a view of it, so an array is only read from the disk when it is used.
+
+    Assumptions:
+    Binary file was a previously saved SUAVE data structure.
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string> - file to be loaded
+    mmap_mode  'r' read only arrays, 'c' arrays that can be changed in memory only, None reads the file
+
+    Outputs:
+    data       SUAVE data structure
+
+    Properties Used:
+    N/A
+    """
+
+    res_dict, buffer = read_binary_index(filename,mmap_mode)
+
+    # Convert to SUAVE data structure
+    SUAVE_data = Data()
+    for k in res_dict.keys():
+        SUAVE_data[str(k)] = build_binary_data_r(res_dict[k],buffer)
+
+    return SUAVE_data
+
+## @ingroup Input_Output-SUAVE
+def load_binary_value(filename,key,mmap_mode='r'):
+    """Loads one value of a binary file of archive_binary without building the rest of the data structure.
+
+    Assumptions:
+    Binary file was a previously saved SUAVE data structure.
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string> - file to be loaded
+    key        <string> - keys to the value joined by dots, like segments.cruise.conditions
+    mmap_mode  see load_binary
+
+    Outputs:
+    value      value converted to needed format
+
+    Properties Used:
+    N/A
+    """
+
+    res_dict, buffer = read_binary_index(filename,mmap_mode)
+
+    v = res_dict
+    for k in key.split('.'):
+        v = v[k]
+
+    return build_binary_data_r(v,buffer)
+
+## @ingroup Input_Output-SUAVE
+def read_binary_index(filename,mmap_mode='r'):
+    """Reads the index of a binary file of archive_binary and maps the file.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string> - file to be loaded
+    mmap_mode  see load_binary
+
+    Outputs:
+    res_dict   index of the data structure
+    buffer     contents of the file
+
+    Properties Used:
+    N/A
+    """
+
+    with open(filename,'rb') as f:
+        if f.read(len(binary_magic)) != binary_magic:
+            raise ValueError(filename + ' is not a SUAVE binary file')
+        f.seek(-binary_trailer.size,2)
+        offset, length, magic = binary_trailer.unpack(f.read(binary_trailer.size))
+        if magic != binary_magic:
+            raise ValueError(filename + ' is not a complete SUAVE binary file')
+        f.seek(offset)
+        index = f.read(length)
+
+    # Convert to dictionary
+    res_dict = json.loads(index.decode('utf-8'),object_pairs_hook=OrderedDict)
+
+    if mmap_mode is None:
+        buffer = np.fromfile(filename,dtype=np.uint8,count=offset)
+    elif offset > len(binary_magic):
+        buffer = np.memmap(filename,dtype=np.uint8,mode=mmap_mode,shape=(offset,))
+    else:
+        # there are no arrays to map
+        buffer = np.zeros(offset,dtype=np.uint8)
+
+    return res_dict, buffer
+
+## @ingroup Input_Output-SUAVE
+def build_binary_data_r(v,buffer):
+    """Builds a SUAVE data structure based on the index of a binary file. This is recursive step.
+
+    Assumptions:
+    Dictionary was created based on a previously saved SUAVE data structure.
+
+    Source:
+    N/A
+
+    Inputs:
+    v       generic value
+    buffer  contents of the file
+
+    Outputs:
+    ret     value converted to needed format
+
+    Properties Used:
+    N/A
+    """
+    tv = type(v) # Get value type
+
+    # Transform to SUAVE data structure with appropriate types
+    if tv == OrderedDict and len(v) == 1 and array_marker in v:
+        entry  = v[array_marker]
+        dtype  = np.dtype(entry['dtype'])
+        shape  = tuple(entry['shape'])
+        start  = entry['offset']
+        stop   = start + dtype.itemsize*int(np.prod(shape))
+        ret    = np.ndarray(shape,dtype,buffer=buffer[start:stop])
+    elif tv == OrderedDict:
+        keys = v.keys()
+        # Recursively assign values
+        ret = DataOrdered()
+        for k in keys:
+            k = str(k)
+            ret[k] = build_binary_data_r(v[k],buffer)
+    elif tv == list:
+        ret = np.array(v)
+    elif (tv == str):
+        ret = str(v)
+    elif (tv == bool):
+        ret = v
+    elif tv == type(None):
+        ret = None
+    elif (tv == float) or (tv == int):
+        ret = v
+    else:
+        raise TypeError('Data type not expected in SUAVE binary structure')
+
+    return ret
@@ -3,6 +3,7 @@
 # 
 # Created:  May 2019, M. Clarke
 #           Jul 2020, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,9 +12,10 @@
 # package imports
 import SUAVE
 import numpy as np
+from scipy.linalg import lu_factor, lu_solve
 from SUAVE.Core import Units
-from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_induced_velocity_matrix import compute_induced_velocity_matrix
-from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_vortex_distribution     import compute_vortex_distribution
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_induced_velocity_matrix import compute_induced_velocity_matrix, compute_condition_chunks
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_vortex_distribution     import update_vortex_distribution
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_RHS_matrix              import compute_RHS_matrix
 # ----------------------------------------------------------------------
 #  Vortex Lattice
@@ -24,7 +26,9 @@ def VLM(conditions,settings,geometry):
     """Uses the vortex lattice method to compute the lift, induced drag and moment coefficients  
 
     Assumptions:
-    None
+    Conditions with the same Mach number and wake angle share one LU factorization of their
+    influence matrix. With a chord aligned wake the wake angle is zero, so every angle of attack 
+    at a Mach number does.
 
     Source:
     1. Aerodynamics for Engineers, Sixth Edition by John Bertin & Russel Cummings 
@@ -69,6 +73,9 @@ def VLM(conditions,settings,geometry):
        settings.number_panels_chordwise        [Unitless]
        settings.use_surrogate                  [Unitless]
        settings.include_slipstream_effect      [Unitless]
+       settings.floating_point_precision       [numpy dtype], optional, float64 by default
+       settings.memory_limit                   [bytes], optional, influence matrices of 1 GB by default
+       settings.chord_aligned_wake             [Boolean], optional, wake follows the freestream by default
        conditions.aerodynamics.angle_of_attack [radians]
        conditions.freestream.mach_number       [Unitless]
        
@@ -83,11 +90,14 @@ def VLM(conditions,settings,geometry):
     """ 
    
     # unpack settings
-    n_sw       = settings.number_panels_spanwise    
-    n_cw       = settings.number_panels_chordwise   
-    sur_flag   = settings.use_surrogate
-    slipstream = settings.include_slipstream_effect
-    Sref       = geometry.reference_area
+    n_sw         = settings.number_panels_spanwise    
+    n_cw         = settings.number_panels_chordwise   
+    sur_flag     = settings.use_surrogate
+    slipstream   = settings.include_slipstream_effect
+    precision    = settings.get('floating_point_precision',np.float64)
+    chord_wake   = settings.get('chord_aligned_wake',False)
+    memory_limit = settings.get('memory_limit',2**30)
+    Sref         = geometry.reference_area
     
     
     # define point about which moment coefficient is computed
@@ -113,12 +123,11 @@ def VLM(conditions,settings,geometry):
     mach = conditions.freestream.mach_number         # mach number
     ones = np.atleast_2d(np.ones_like(aoa)) 
    
-    # generate vortex distribution
-    VD = compute_vortex_distribution(geometry,settings)  
+    # generate vortex distribution, unless the geometry is unchanged
+    VD = update_vortex_distribution(geometry,settings)  
     
-    # Build induced velocity matrix, C_mn
-    C_mn, DW_mn  = compute_induced_velocity_matrix(VD,n_sw,n_cw,aoa,mach)
-    MCM = VD.MCM 
+    # the influence matrices move Mach 1 away from the singularity
+    mach[mach==1] = 1.001
     
     # Compute flow tangency conditions   
     inv_root_beta = np.zeros_like(mach)
@@ -131,28 +140,60 @@ def VLM(conditions,settings,geometry):
     
     phi   = np.arctan((VD.ZBC - VD.ZAC)/(VD.YBC - VD.YAC))*ones          # dihedral angle 
     delta = np.arctan((VD.ZC - VD.ZCH)/((VD.XC - VD.XCH)*inv_root_beta)) # mean camber surface angle 
-   
-    # Build Aerodynamic Influence Coefficient Matrix
-    A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-        + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-        - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # valdiated from book eqn 7.42 
-    
-    B =   np.multiply(DW_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-        + np.multiply(DW_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-        - np.multiply(DW_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # valdiated from book eqn 7.42     
-   
-   
+    
     # Build the vector
     RHS = compute_RHS_matrix(n_sw,n_cw,delta,phi,conditions,geometry,sur_flag,slipstream)
-
-    # Compute vortex strength  
+    
+    # Directions of the flow tangency condition
+    n_x =  np.atleast_3d(np.sin(delta)*np.cos(phi)).astype(precision)
+    n_y =  np.atleast_3d(np.cos(delta)*np.sin(phi)).astype(precision)
+    n_z =  np.atleast_3d(np.cos(phi)*np.cos(delta)).astype(precision)
+    
+    # wake model, the semi infinite legs follow the freestream or the body x axis
+    if chord_wake:
+        theta_w = np.zeros_like(ones)
+    else:
+        theta_w = np.atleast_2d(aoa)
+    
+    # conditions with the same Mach number and wake angle share their influence matrices
+    cases, first, index, counts = np.unique(np.hstack([mach,theta_w]),axis=0,return_index=True,return_inverse=True,return_counts=True)
+    groups = np.split(np.argsort(index,kind='stable'),np.cumsum(counts)[:-1])
+    
+    # Compute vortex strengths and induced velocities, for as many cases at once as the memory limit allows
     n_cp  = VD.n_cp  
-    gamma = np.linalg.solve(A,RHS)
-    gamma_3d = np.repeat(np.atleast_3d(gamma), n_cp ,axis = 2 )
-    u = np.sum(C_mn[:,:,:,0]*MCM[:,:,:,0]*gamma_3d, axis = 2) 
-    v = np.sum(C_mn[:,:,:,1]*MCM[:,:,:,1]*gamma_3d, axis = 2) 
-    w = np.sum(C_mn[:,:,:,2]*MCM[:,:,:,2]*gamma_3d, axis = 2) 
-    w_ind = -np.sum(B*MCM[:,:,:,2]*gamma_3d, axis = 2) 
+    gamma = np.zeros_like(RHS)
+    u     = np.zeros_like(RHS)
+    v     = np.zeros_like(RHS)
+    w     = np.zeros_like(RHS)
+    w_ind = np.zeros_like(RHS)
+    
+    for chunk in compute_condition_chunks(len(cases),n_cp,precision,memory_limit):
+        
+        # Build induced velocity matrix, C_mn
+        C_mn, DW_mn  = compute_induced_velocity_matrix(VD,n_sw,n_cw,cases[chunk,1:2],cases[chunk,0:1],precision=precision,memory_limit=memory_limit)
+        
+        # Build Aerodynamic Influence Coefficient Matrix
+        rows = first[chunk]
+        A =   np.multiply(C_mn[:,:,:,0],n_x[rows]) \
+            + np.multiply(C_mn[:,:,:,1],n_y[rows]) \
+            - np.multiply(C_mn[:,:,:,2],n_z[rows])   # valdiated from book eqn 7.42 
+        
+        B =   np.multiply(DW_mn[:,:,:,0],n_x[rows]) \
+            + np.multiply(DW_mn[:,:,:,1],n_y[rows]) \
+            - np.multiply(DW_mn[:,:,:,2],n_z[rows])   # valdiated from book eqn 7.42     
+        del DW_mn
+    
+        # Compute vortex strength, factoring each matrix once for all the conditions that share it  
+        for i, rows in enumerate(groups[chunk]):
+            LU          = lu_factor(A[i],overwrite_a=True,check_finite=False)
+            gamma[rows] = lu_solve(LU,RHS[rows].T.astype(precision),check_finite=False).T
+            
+            gamma_3d     = np.atleast_3d(gamma[rows]).astype(precision)
+            u[rows]      = np.sum(C_mn[i,:,:,0]*gamma_3d, axis = 2) 
+            v[rows]      = np.sum(C_mn[i,:,:,1]*gamma_3d, axis = 2) 
+            w[rows]      = np.sum(C_mn[i,:,:,2]*gamma_3d, axis = 2) 
+            w_ind[rows]  = -np.sum(B[i]*gamma_3d, axis = 2) 
+        del A, B, C_mn
      
     # ---------------------------------------------------------------------------------------
     # STEP 10: Compute aerodynamic coefficients 
@@ -228,7 +269,4 @@ def VLM(conditions,settings,geometry):
     # moment coefficient
     CM          = np.atleast_2d(np.sum(np.multiply((X_M - VD.XCH*ones),Del_Y*gamma),axis=1)/(Sref*c_bar)).T     
     
-    # delete MCM from VD data structure since it consumes memory
-    delattr(VD, 'MCM') 
-
     return CL, CDi, CM, CL_wing, CDi_wing, cl_y , cdi_y , CP 
\ No newline at end of file
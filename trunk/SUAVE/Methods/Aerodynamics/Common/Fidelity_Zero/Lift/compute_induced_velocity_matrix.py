@@ -4,6 +4,7 @@
 # Created:  May 2018, M. Clarke
 #           Apr 2020, M. Clarke
 #           Jun 2020, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,24 +12,33 @@
 
 # package imports 
 import numpy as np 
+from SUAVE.Core import Data
 
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
-def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach):
+def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach,cache_size=2**28,precision=np.float64,memory_limit=2**30):
     """ This computes the induced velocitys are each control point 
     of the vehicle vortex lattice 
 
     Assumptions: 
     Trailing vortex legs infinity are alligned to freestream
+    The influence of the bound vortices and of the trailing legs on the wing only 
+    depends on the geometry and the Mach number. It is computed once per Mach number
+    and kept on the vortex distribution, up to cache_size bytes, for later calls.
+    The outputs take n_conditions*n_cp*n_cp*3 values each, use compute_condition_chunks
+    to evaluate many conditions within a memory limit.
 
     Source:  
     None
 
     Inputs: 
-    VD       - vehicle vortex distribution      [Unitless] 
-    n_sw     - number_panels_spanwise           [Unitless]
-    n_cw     - number_panels_chordwise          [Unitless] 
-    mach                                        [Unitless] 
-    theta_w  - freestream wake angle            [radians]
+    VD           - vehicle vortex distribution    [Unitless] 
+    n_sw         - number_panels_spanwise         [Unitless]
+    n_cw         - number_panels_chordwise        [Unitless] 
+    mach                                          [Unitless] 
+    theta_w      - freestream wake angle          [radians]
+    cache_size   - memory kept per distribution   [bytes]
+    precision    - floating point type            [numpy dtype]
+    memory_limit - memory used to compute new Mach numbers [bytes]
     
     Outputs:                                
     C_mn     - total induced velocity matrix    [Unitless] 
@@ -38,7 +48,7 @@ def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach):
     N/A
     """
     # unpack  
-    ones     = np.atleast_3d(np.ones_like(theta_w))
+    ones     = np.atleast_3d(np.ones_like(theta_w,dtype=precision))
  
     # Prandtl Glauret Transformation for subsonic
     inv_root_beta = np.zeros_like(mach)
@@ -48,42 +58,188 @@ def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach):
 
     if np.any(mach==1):
         raise('Mach of 1 cannot be used in building compressibiliy corrections.')
-    inv_root_beta = np.atleast_3d(inv_root_beta)
-     
-    XAH   = np.atleast_3d(VD.XAH*inv_root_beta) 
-    YAH   = np.atleast_3d(VD.YAH*ones) 
-    ZAH   = np.atleast_3d(VD.ZAH*ones) 
-    XBH   = np.atleast_3d(VD.XBH*inv_root_beta) 
-    YBH   = np.atleast_3d(VD.YBH*ones) 
-    ZBH   = np.atleast_3d(VD.ZBH*ones) 
-
-    XA1   = np.atleast_3d(VD.XA1*inv_root_beta)
-    YA1   = np.atleast_3d(VD.YA1*ones)
-    ZA1   = np.atleast_3d(VD.ZA1*ones)
-    XA2   = np.atleast_3d(VD.XA2*inv_root_beta)
-    YA2   = np.atleast_3d(VD.YA2*ones)
-    ZA2   = np.atleast_3d(VD.ZA2*ones)
-
-    XB1   = np.atleast_3d(VD.XB1*inv_root_beta)
-    YB1   = np.atleast_3d(VD.YB1*ones)
-    ZB1   = np.atleast_3d(VD.ZB1*ones)
-    XB2   = np.atleast_3d(VD.XB2*inv_root_beta)
-    YB2   = np.atleast_3d(VD.YB2*ones)
-    ZB2   = np.atleast_3d(VD.ZB2*ones) 
+    inv_root_beta = np.atleast_3d(inv_root_beta).astype(precision)
     
-    XA_TE   = np.atleast_3d(VD.XA_TE*inv_root_beta)
-    YA_TE   = np.atleast_3d(VD.YA_TE*ones)
-    ZA_TE   = np.atleast_3d(VD.ZA_TE*ones)
-    XB_TE   = np.atleast_3d(VD.XB_TE*inv_root_beta)
-    YB_TE   = np.atleast_3d(VD.YB_TE*ones)
-    ZB_TE   = np.atleast_3d(VD.ZB_TE*ones) 
+    # influence of everything but the semi infinite legs, for each Mach number 
+    C_mn, C_AB_ll_tot, C_AB_rl_tot = compute_wing_influence(VD,n_sw,n_cw,inv_root_beta,cache_size,memory_limit)
     
-    XC    = np.atleast_3d(VD.XC*inv_root_beta)
-    YC    = np.atleast_3d(VD.YC*ones) 
-    ZC    = np.atleast_3d(VD.ZC*ones)  
-    n_w   = VD.n_w
+    XA_TE   = np.atleast_3d(VD.XA_TE.astype(precision)*inv_root_beta)
+    YA_TE   = np.atleast_3d(VD.YA_TE.astype(precision)*ones)
+    ZA_TE   = np.atleast_3d(VD.ZA_TE.astype(precision)*ones)
+    XB_TE   = np.atleast_3d(VD.XB_TE.astype(precision)*inv_root_beta)
+    YB_TE   = np.atleast_3d(VD.YB_TE.astype(precision)*ones)
+    ZB_TE   = np.atleast_3d(VD.ZB_TE.astype(precision)*ones) 
+    YBH     = np.atleast_3d(VD.YBH.astype(precision)*ones) 
+    
+    XC    = np.atleast_3d(VD.XC.astype(precision)*inv_root_beta)
+    YC    = np.atleast_3d(VD.YC.astype(precision)*ones) 
+    ZC    = np.atleast_3d(VD.ZC.astype(precision)*ones)  
 
-    theta_w = np.atleast_3d(theta_w)   # wake model, use theta_w if setting to freestream, use 0 if setting to airfoil chord like
+    theta_w = np.atleast_3d(theta_w).astype(precision)   # wake model, use theta_w if setting to freestream, use 0 if setting to airfoil chord like
+    
+    # -------------------------------------------------------------------------------------------
+    # Compute velocity induced by the semi infinite trailing legs on every control point by every panel
+    # ------------------------------------------------------------------------------------------- 
+    ## If YBH is negative, flip A and B, ie negative side of the airplane. Vortex order flips
+    boolean = YBH<0.
+    XA_TE[boolean], XB_TE[boolean] = XB_TE[boolean], XA_TE[boolean]
+    YA_TE[boolean], YB_TE[boolean] = YB_TE[boolean], YA_TE[boolean]
+    ZA_TE[boolean], ZB_TE[boolean] = ZB_TE[boolean], ZA_TE[boolean]
+
+    # Transpose thing
+    XC = np.swapaxes(XC,1,2) 
+    YC = np.swapaxes(YC,1,2) 
+    ZC = np.swapaxes(ZC,1,2)  
+
+    # velocity induced by left leg of vortex (A to inf)
+    C_AB_ll_tot += np.transpose(vortex_leg_from_A_to_inf(XC, YC, ZC, XA_TE, YA_TE, ZA_TE,theta_w),axes=[1,2,3,0])
+
+    # velocity induced by right leg of vortex (B to inf)
+    C_AB_rl_tot += np.transpose(vortex_leg_from_B_to_inf(XC, YC, ZC, XB_TE, YB_TE, ZB_TE,theta_w),axes=[1,2,3,0])
+
+    # Add all the influences together, in place to keep the number of n_cp x n_cp arrays down
+    C_mn += C_AB_ll_tot  # verified from book using example 7.4 pg 399-404
+    C_mn += C_AB_rl_tot  # verified from book using example 7.4 pg 399-404
+    
+    DW_mn  = C_AB_ll_tot # summation of trailing vortices for semi infinite
+    DW_mn += C_AB_rl_tot
+    DW_mn *= 2
+    
+    return C_mn, DW_mn 
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def compute_condition_chunks(n_conditions,n_cp,precision=np.float64,memory_limit=2**30):
+    """ Splits the conditions into chunks that can be run through the VLM together, 
+    so the influence matrices of a chunk take about memory_limit bytes at most
+
+    Assumptions: 
+    About twelve n_cp x n_cp x 3 arrays are alive per condition while the influence matrices 
+    are built and solved. At least one condition is in each chunk, whatever the limit.
+
+    Source:  
+    None
+
+    Inputs: 
+    n_conditions                                  [Unitless] 
+    n_cp         - number of panels               [Unitless]
+    precision    - floating point type            [numpy dtype]
+    memory_limit                                  [bytes]
+    
+    Outputs:                                
+    chunks       - list of slices                 [Unitless] 
+
+    Properties Used:
+    N/A
+    """
+    
+    condition_size = 12*3*n_cp*n_cp*np.dtype(precision).itemsize
+    chunk_size     = int(max(1,min(n_conditions,memory_limit//condition_size)))
+    
+    return [slice(start,min(start+chunk_size,n_conditions)) for start in range(0,n_conditions,chunk_size)]
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def compute_wing_influence(VD,n_sw,n_cw,inv_root_beta,cache_size=2**28,memory_limit=2**30):
+    """ This computes the velocities induced at each control point by the bound vortices 
+    and by the trailing legs that are on the wing, which don't depend on the wake angle. 
+    They are computed once for each distinct Mach number and kept on the vortex distribution.
+
+    Assumptions: 
+    The oldest Mach numbers are dropped from VD.wing_influence once it holds more than
+    cache_size bytes, a new vortex distribution starts without any.
+    The outputs are new arrays, in the floating point type of inv_root_beta.
+
+    Source:  
+    None
+
+    Inputs: 
+    VD            - vehicle vortex distribution          [Unitless] 
+    n_sw          - number_panels_spanwise               [Unitless]
+    n_cw          - number_panels_chordwise              [Unitless] 
+    inv_root_beta - Prandtl Glauert factor, (n,1,1)      [Unitless] 
+    cache_size    - memory kept per distribution         [bytes]
+    memory_limit  - memory used to compute new ones      [bytes]
+    
+    Outputs:                                
+    C_AB_bv       - bound vortices                       [Unitless] 
+    C_AB_ll_wing  - left legs on the wing                [Unitless] 
+    C_AB_rl_wing  - right legs on the wing               [Unitless] 
+
+    Properties Used:
+    N/A
+    """
+    
+    if 'wing_influence' not in VD:
+        VD.wing_influence = Data()
+    cache = VD.wing_influence
+    
+    dtype        = inv_root_beta.dtype
+    betas, index = np.unique(inv_root_beta[:,0,0],return_inverse=True)
+    keys         = [dtype.str + repr(float(beta)) for beta in betas]
+    
+    # compute the Mach numbers that aren't cached yet, as many at once as the memory limit allows
+    missing = [i for i, key in enumerate(keys) if key not in cache]
+    if len(missing) > 0:
+        n_cp = len(VD.XC)
+        for rows in compute_condition_chunks(len(missing),n_cp,dtype,memory_limit):
+            chunk      = missing[rows]
+            influences = compute_bound_influence(VD,n_sw,n_cw,betas[chunk][:,None,None])
+            for j, i in enumerate(chunk):
+                cache[keys[i]] = [influence[j].copy() for influence in influences]
+            del influences
+    
+    # spread them over the conditions
+    shape   = (len(index),) + cache[keys[0]][0].shape
+    outputs = [np.empty(shape,dtype=dtype) for i in range(3)]
+    for i, key in enumerate(keys):
+        rows = index == i
+        for output, influence in zip(outputs,cache[key]):
+            output[rows] = influence
+    
+    # keep the most recent Mach numbers
+    used = set(keys)
+    size = sum([sum([a.nbytes for a in influence]) for influence in cache.values()])
+    for key in list(cache.keys()):
+        if size <= cache_size:
+            break
+        if key not in used:
+            size -= sum([a.nbytes for a in cache[key]])
+            del cache[key]
+    
+    C_AB_bv, C_AB_ll_wing, C_AB_rl_wing = outputs
+    
+    return C_AB_bv, C_AB_ll_wing, C_AB_rl_wing
+
+def compute_bound_influence(VD,n_sw,n_cw,inv_root_beta):
+    """ Computes the bound vortex and on wing trailing leg influences for each Prandtl Glauert factor,
+    see compute_wing_influence """
+    
+    precision = inv_root_beta.dtype
+    ones      = np.ones_like(inv_root_beta)
+ 
+    XAH   = np.atleast_3d(VD.XAH.astype(precision)*inv_root_beta) 
+    YAH   = np.atleast_3d(VD.YAH.astype(precision)*ones) 
+    ZAH   = np.atleast_3d(VD.ZAH.astype(precision)*ones) 
+    XBH   = np.atleast_3d(VD.XBH.astype(precision)*inv_root_beta) 
+    YBH   = np.atleast_3d(VD.YBH.astype(precision)*ones) 
+    ZBH   = np.atleast_3d(VD.ZBH.astype(precision)*ones) 
+
+    XA1   = np.atleast_3d(VD.XA1.astype(precision)*inv_root_beta)
+    YA1   = np.atleast_3d(VD.YA1.astype(precision)*ones)
+    ZA1   = np.atleast_3d(VD.ZA1.astype(precision)*ones)
+    XA2   = np.atleast_3d(VD.XA2.astype(precision)*inv_root_beta)
+    YA2   = np.atleast_3d(VD.YA2.astype(precision)*ones)
+    ZA2   = np.atleast_3d(VD.ZA2.astype(precision)*ones)
+
+    XB1   = np.atleast_3d(VD.XB1.astype(precision)*inv_root_beta)
+    YB1   = np.atleast_3d(VD.YB1.astype(precision)*ones)
+    ZB1   = np.atleast_3d(VD.ZB1.astype(precision)*ones)
+    XB2   = np.atleast_3d(VD.XB2.astype(precision)*inv_root_beta)
+    YB2   = np.atleast_3d(VD.YB2.astype(precision)*ones)
+    ZB2   = np.atleast_3d(VD.ZB2.astype(precision)*ones) 
+    
+    XC    = np.atleast_3d(VD.XC.astype(precision)*inv_root_beta)
+    YC    = np.atleast_3d(VD.YC.astype(precision)*ones) 
+    ZC    = np.atleast_3d(VD.ZC.astype(precision)*ones)  
     
     # -------------------------------------------------------------------------------------------
     # Compute velocity induced by horseshoe vortex segments on every control point by every panel
@@ -100,10 +256,6 @@ def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach):
     YAH[boolean], YBH[boolean] = YBH[boolean], YAH[boolean] 
     ZAH[boolean], ZBH[boolean] = ZBH[boolean], ZAH[boolean]
 
-    XA_TE[boolean], XB_TE[boolean] = XB_TE[boolean], XA_TE[boolean]
-    YA_TE[boolean], YB_TE[boolean] = YB_TE[boolean], YA_TE[boolean]
-    ZA_TE[boolean], ZB_TE[boolean] = ZB_TE[boolean], ZA_TE[boolean]
-
     # Transpose thing
     XC = np.swapaxes(XC,1,2) 
     YC = np.swapaxes(YC,1,2) 
@@ -112,60 +264,34 @@ def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach):
     # compute influence of bound vortices 
     C_AB_bv = np.transpose(vortex(XC, YC, ZC, XAH, YAH, ZAH, XBH, YBH, ZBH),axes=[1,2,3,0])
     
+    # compute influence of whole panel left legs, and add up all the trailing legs 
+    # of the vortices which are on the wing for the downwind panels
+    C_AB_ll_wing = sum_legs_on_wing(np.transpose(vortex(XC, YC, ZC, XA2, YA2, ZA2, XA1, YA1, ZA1),axes=[1,2,3,0]),n_cw)
+
     # compute influence of 3/4 left legs 
-    C_AB_34_ll = np.transpose(vortex(XC, YC, ZC, XA2, YA2, ZA2, XAH, YAH, ZAH),axes=[1,2,3,0]) # original
+    C_AB_ll_wing += np.transpose(vortex(XC, YC, ZC, XA2, YA2, ZA2, XAH, YAH, ZAH),axes=[1,2,3,0]) 
 
-    # compute influence of whole panel left legs  
-    C_AB_ll   =  np.transpose(vortex(XC, YC, ZC, XA2, YA2, ZA2, XA1, YA1, ZA1),axes=[1,2,3,0]) # original
+    # compute influence of whole right legs, and add up the ones on the wing   
+    C_AB_rl_wing = sum_legs_on_wing(np.transpose(vortex(XC, YC, ZC, XB1, YB1, ZB1, XB2, YB2, ZB2),axes=[1,2,3,0]),n_cw)
 
     # compute influence of 3/4 right legs  
-    C_AB_34_rl = np.transpose(vortex(XC, YC, ZC, XBH, YBH, ZBH, XB2, YB2, ZB2),axes=[1,2,3,0]) # original 
-
-    # compute influence of whole right legs   
-    C_AB_rl = np.transpose(vortex(XC, YC, ZC, XB1, YB1, ZB1, XB2, YB2, ZB2),axes=[1,2,3,0]) # original 
-
-    # velocity induced by left leg of vortex (A to inf)
-    C_Ainf  = np.transpose(vortex_leg_from_A_to_inf(XC, YC, ZC, XA_TE, YA_TE, ZA_TE,theta_w),axes=[1,2,3,0])
-
-    # velocity induced by right leg of vortex (B to inf)
-    C_Binf  = np.transpose(vortex_leg_from_B_to_inf(XC, YC, ZC, XB_TE, YB_TE, ZB_TE,theta_w),axes=[1,2,3,0])
-
-    # compute Mach Cone Matrix
-    MCM      = np.ones_like(C_AB_bv)
-    #MCM      = compute_mach_cone_matrix(XC,YC,ZC,MCM,mach)
-    VD.MCM = MCM 
-    n_cp     = n_w*n_cw*n_sw 
-
-    # multiply by mach cone 
-    C_AB_bv     = C_AB_bv    * MCM
-    C_AB_34_ll  = C_AB_34_ll * MCM
-    C_AB_ll     = C_AB_ll    * MCM
-    C_AB_34_rl  = C_AB_34_rl * MCM
-    C_AB_rl     = C_AB_rl    * MCM
-    C_Ainf      = C_Ainf     * MCM
-    C_Binf      = C_Binf     * MCM  
+    C_AB_rl_wing += np.transpose(vortex(XC, YC, ZC, XBH, YBH, ZBH, XB2, YB2, ZB2),axes=[1,2,3,0]) 
     
-    # the follow block of text adds up all the trailing legs of the vortices which are on the wing for the downwind panels   
-    C_AB_ll_on_wing = np.zeros_like(C_AB_ll)
-    C_AB_rl_on_wing = np.zeros_like(C_AB_ll)
+    return C_AB_bv, C_AB_ll_wing, C_AB_rl_wing
+
+def sum_legs_on_wing(C_AB_legs,n_cw):
+    """ Sums the influence of the whole panel legs downwind of each panel along its chordwise strip, 
+    as a cumulative sum running from the trailing edge. The leg of the last panel of a strip isn't 
+    part of any sum, it trails into the semi infinite legs. """
     
-    # original 
-    for n in range(n_cp):
-        n_te_p = (n_cw-(n+1)%n_cw)
-        if (n+1)%n_cw != 0:
-            start = n+1
-            end   = n+n_te_p
-            C_AB_ll_on_wing[:,:,n,:] = np.sum(C_AB_ll[:,:,start:end,:],axis=2) 
-            C_AB_rl_on_wing[:,:,n,:] = np.sum(C_AB_rl[:,:,start:end,:],axis=2)                
-
-    # Add all the influences together
-    C_AB_ll_tot = C_AB_ll_on_wing + C_AB_34_ll + C_Ainf  # verified from book using example 7.4 pg 399-404
-    C_AB_rl_tot = C_AB_rl_on_wing + C_AB_34_rl + C_Binf  # verified from book using example 7.4 pg 399-404
-    C_mn        = C_AB_bv +  C_AB_ll_tot  + C_AB_rl_tot  # verified from book using example 7.4 pg 399-404
+    n_c, n_m, n_p, n_d = C_AB_legs.shape
+    strips = C_AB_legs.reshape((n_c,n_m,n_p//n_cw,n_cw,n_d))
     
-    DW_mn = 2*(C_AB_ll_tot + C_AB_rl_tot) # summation of trailing vortices for semi infinite
+    on_wing = np.zeros_like(strips)
+    if n_cw > 2:
+        on_wing[:,:,:,:n_cw-2] = np.cumsum(strips[:,:,:,n_cw-2:0:-1],axis=3)[:,:,:,::-1]
     
-    return C_mn, DW_mn 
+    return on_wing.reshape(C_AB_legs.shape)
 
 # -------------------------------------------------------------------------------
 # vortex strength computation
@@ -3,6 +3,7 @@
 # 
 # Created:  May 2018, M. Clarke
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,6 +12,7 @@
 # package imports
 import SUAVE
 import numpy as np
+import hashlib
 from SUAVE.Core import Units , Data
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.import_airfoil_geometry\
      import import_airfoil_geometry
@@ -1049,6 +1051,7 @@ def compute_vortex_distribution(geometry,settings):
     VD.n_cp       = n_cp    
     VD.wing_areas = wing_areas     
     VD.Stot       = sum(wing_areas)
+    VD.geometry_key = compute_geometry_key(geometry,settings)
 
     geometry.vortex_distribution = VD
 
@@ -1063,4 +1066,108 @@ def compute_panel_area(VD):
     P2P3 = np.array([VD.XA2 - VD.XB1,VD.YA2 - VD.YB1,VD.ZA2 - VD.ZB1]).T
     P2P4 = np.array([VD.XB2 - VD.XB1,VD.YB2 - VD.YB1,VD.ZB2 - VD.ZB1]).T   
     A_panel = 0.5*(np.linalg.norm(np.cross(P1P2,P1P3)) + np.linalg.norm(np.cross(P2P3, P2P4)))
-    return A_panel
\ No newline at end of file
+    return A_panel
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def update_vortex_distribution(geometry,settings):
+    """ Returns the vortex distribution stored in the settings, recomputing it only 
+    if the wings, the fuselages or the number of panels changed since it was computed.
+
+    Assumptions: 
+    Only the wings and fuselages of the geometry, and the number of panels in the 
+    settings, change the vortex distribution. Values that aren't numbers, strings, 
+    arrays or containers of them are only compared by type.
+    
+    Source:  
+    None
+
+    Inputs:
+    geometry.wings                                [Unitless]  
+    geometry.fuselages                            [Unitless]  
+    settings.vortex_distribution                  [Unitless]  
+    settings.number_panels_spanwise               [Unitless]  
+    settings.number_panels_chordwise              [Unitless]  
+       
+    Outputs:                                   
+    VD - vehicle vortex distribution              [Unitless] 
+
+    Properties Used:
+    N/A 
+    """
+    
+    VD = settings.get('vortex_distribution',None)
+    
+    if (VD is None) or (VD.get('geometry_key',None) != compute_geometry_key(geometry,settings)):
+        VD = compute_vortex_distribution(geometry,settings)
+        settings.vortex_distribution = VD
+        
+    geometry.vortex_distribution = VD
+    
+    return VD
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def compute_geometry_key(geometry,settings):
+    """ Computes a hash of everything the vortex distribution is built from
+
+    Assumptions: 
+    See update_vortex_distribution
+    
+    Source:  
+    None
+
+    Inputs:
+    geometry.wings                                [Unitless]  
+    geometry.fuselages                            [Unitless]  
+    settings.number_panels_spanwise               [Unitless]  
+    settings.number_panels_chordwise              [Unitless]  
+       
+    Outputs:                                   
+    key                                           [string] 
+
+    Properties Used:
+    N/A 
+    """
+    
+    key = hashlib.sha1()
+    
+    hash_value(key,settings.number_panels_spanwise ,set())
+    hash_value(key,settings.number_panels_chordwise,set())
+    hash_value(key,geometry.wings                  ,set())
+    hash_value(key,geometry.fuselages              ,set())
+    
+    return key.hexdigest()
+
+def hash_value(key,value,visited):
+    """ Adds a value, and everything in it, to a hash """
+    
+    if isinstance(value,(str,bool,int,float,complex,np.generic)) or value is None:
+        key.update(repr(value).encode())
+        
+    elif isinstance(value,np.ndarray):
+        key.update(repr((value.dtype.str,value.shape)).encode())
+        if value.dtype == object:
+            hash_value(key,value.tolist(),visited)
+        else:
+            key.update(np.ascontiguousarray(value).tobytes())
+            
+    elif isinstance(value,(dict,list,tuple)):
+        # guard against references back up the tree
+        if id(value) in visited:
+            return
+        visited.add(id(value))
+        key.update(type(value).__name__.encode())
+        if isinstance(value,dict):
+            for k, v in value.items():
+                if k == 'vortex_distribution':
+                    continue
+                key.update(repr(k).encode())
+                hash_value(key,v,visited)
+        else:
+            for v in value:
+                hash_value(key,v,visited)
+        key.update(b'/')
+        
+    else:
+        key.update(type(value).__name__.encode())
+        
+    return
@@ -2,6 +2,7 @@
 # OpenVSP_surrogate.py
 #
 # Created:  June 2019, B. Dalman
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -139,9 +140,8 @@ class OpenVSP_surrogate(Aerodynamics):
         
         # Inviscid lift
         data_len = len(AoA)
-        inviscid_lift = np.zeros([data_len,1])
-        for ii,_ in enumerate(AoA):
-            inviscid_lift[ii] = lift_model.predict([np.array([AoA[ii][0],mach[ii][0]])]) #sklearn fix
+        points   = np.hstack([np.reshape(AoA,(-1,1)),np.reshape(mach,(-1,1))])
+        inviscid_lift = np.reshape(lift_model.predict(points),(-1,1)) # all of the control points at once
             
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift       = Data()
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift.total = inviscid_lift
@@ -293,13 +293,10 @@ class OpenVSP_surrogate(Aerodynamics):
         
         AoA_mesh,mach_mesh = np.meshgrid(AoA_points,mach_points)
         
-        CL_sur = np.zeros(np.shape(AoA_mesh))
-        CD_sur = np.zeros(np.shape(AoA_mesh))        
+        mesh_points = np.vstack([AoA_mesh.flatten(),mach_mesh.flatten()]).T
         
-        for jj in range(len(AoA_points)):
-            for ii in range(len(mach_points)):
-                CL_sur[ii,jj] = cl_surrogate.predict([np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]])])
-                CD_sur[ii,jj] = cd_surrogate.predict([np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]])])  #sklearn fix        
+        CL_sur = np.reshape(cl_surrogate.predict(mesh_points),np.shape(AoA_mesh))
+        CD_sur = np.reshape(cd_surrogate.predict(mesh_points),np.shape(AoA_mesh))
 
         fig = plt.figure('Coefficient of Lift Surrogate Plot')    
         plt_handle = plt.contourf(AoA_mesh/Units.deg,mach_mesh,CL_sur,levels=None)
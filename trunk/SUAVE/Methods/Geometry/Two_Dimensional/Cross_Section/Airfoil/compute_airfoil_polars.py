@@ -1,59 +1,192 @@
 ## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
 # compute_airfoil_polars.py
-# 
+#
 # Created:  Mar 2019, M. Clarke
 #           Mar 2020, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 from SUAVE.Core               import Data , Units
-from .import_airfoil_geometry import import_airfoil_geometry 
+from .import_airfoil_geometry import import_airfoil_geometry
 from .import_airfoil_polars   import import_airfoil_polars
 import numpy as np
+import hashlib
+import os
+
+# tables already built in this process, by airfoil files and aspect ratio
+_airfoil_polar_tables = {}
 
 ## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
-def compute_airfoil_polars(propeller,a_geo,a_polar):
+def compute_airfoil_polars(propeller,a_geo,a_polar,cache_directory=None):
     """This computes the lift and drag coefficients of an airfoil in stall regimes using pre-stall
-    characterstics and AERODAS formation for post stall characteristics. This is useful for 
-    obtaining a more accurate prediction of wing and blade loading. Pre stall characteristics 
+    characterstics and AERODAS formation for post stall characteristics. This is useful for
+    obtaining a more accurate prediction of wing and blade loading. Pre stall characteristics
     are obtained in the from of a text file of airfoil polar data obtained from airfoiltools.com
-    
+
     Assumptions:
-    Uses AERODAS forumatuon for post stall characteristics 
+    Uses AERODAS forumatuon for post stall characteristics. The polars are only built the first
+    time a set of airfoil files is used with an aspect ratio, see airfoil_polar_table.
 
     Source:
     Models of Lift and Drag Coefficients of Stalled and Unstalled Airfoils in Wind Turbines and Wind Tunnels
     by D Spera, 2008
 
     Inputs:
-    propeller. 
+    propeller.
         hub_radius         [m]
         tip_radius         [m]
         chord_distribution [unitless]
     airfoils                <string>
-           
+    cache_directory         <string> (optional)
+
 
     Outputs:
     airfoil_data.
         cl_polars          [unitless]
-        cd_polars          [unitless]      
+        cd_polars          [unitless]
         aoa_sweep          [unitless]
-    
+
     Properties Used:
     N/A
-    """  
-    
-    num_airfoils = len(a_polar)
-    # unpack 
+    """
+
+    # unpack
     Rh = propeller.hub_radius
     Rt = propeller.tip_radius
     n = len(propeller.chord_distribution)
-    cm = propeller.chord_distribution[round(n*0.5)] 
+    cm = propeller.chord_distribution[round(n*0.5)]
+
+    AR = 2*(Rt - Rh)/cm
+
+    return airfoil_polar_table(a_geo,a_polar,AR,cache_directory)
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def airfoil_polar_table(a_geo,a_polar,AR,cache_directory=None):
+    """Returns the AERODAS polars of a set of airfoils for an aspect ratio. A table is built once per
+    geometry files, polar files and aspect ratio in a process, and is kept in cache_directory when
+    one is given so later processes only read it back.
+
+    Assumptions:
+    The airfoil files are not changed while a process runs. The files kept on disk are named after
+    the contents of the airfoil files and the aspect ratio. The same table is returned to every
+    caller, its coefficients are read only.
+
+    Source:
+    N/A
+
+    Inputs:
+    a_geo                   airfoil geometry files        <list of strings>
+    a_polar                 airfoil polar files           <list of strings>
+    AR                      aspect ratio                  [unitless]
+    cache_directory         <string> (optional)
+
+    Outputs:
+    airfoil_data.           see compute_airfoil_polars
+
+    Properties Used:
+    N/A
+    """
+
+    key = (tuple(map(os.path.abspath,a_geo)),tuple(map(os.path.abspath,a_polar)),float(AR))
+
+    airfoil_data = _airfoil_polar_tables.get(key)
+    if airfoil_data is None:
+        airfoil_data = build_airfoil_polar_table(a_geo,a_polar,AR,cache_directory)
+        _airfoil_polar_tables[key] = airfoil_data
+
+    return airfoil_data
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def build_airfoil_polar_table(a_geo,a_polar,AR,cache_directory=None):
+    """Reads the airfoil files and builds their AERODAS polars, or reads the polars back from
+    cache_directory when they were kept there before.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    see airfoil_polar_table
+
+    Outputs:
+    airfoil_data.           see compute_airfoil_polars
 
-    # read airfoil geometry  
+    Properties Used:
+    N/A
+    """
+
+    # read airfoil geometry
     airfoil_data = import_airfoil_geometry(a_geo)
 
-    AR = 2*(Rt - Rh)/cm
+    filename = None
+    if cache_directory is not None:
+        digest = hashlib.sha1(repr(float(AR)).encode())
+        for path in list(a_geo) + list(a_polar):
+            with open(path,'rb') as f:
+                digest.update(f.read())
+        filename = os.path.join(cache_directory,'airfoil_polars_' + digest.hexdigest() + '.npz')
+
+    if filename is not None and os.path.isfile(filename):
+        with np.load(filename) as kept:
+            CL        = kept['lift_coefficients']
+            CD        = kept['drag_coefficients']
+            AoA_sweep = kept['angle_of_attacks']
+    else:
+        # read airfoil polars
+        airfoil_polar_data = import_airfoil_polars(a_polar)
+        CL, CD, AoA_sweep  = compute_aerodas_polars(airfoil_data,airfoil_polar_data,AR)
+
+        # written next to the final file and renamed, so other processes never read part of it
+        if filename is not None:
+            os.makedirs(cache_directory,exist_ok=True)
+            partial = filename + '.%d.tmp' % os.getpid()
+            with open(partial,'wb') as f:
+                np.savez(f,lift_coefficients=CL,drag_coefficients=CD,angle_of_attacks=AoA_sweep)
+            os.replace(partial,filename)
+
+    CL.flags.writeable = False
+    CD.flags.writeable = False
+
+    airfoil_data.lift_coefficients  = CL
+    airfoil_data.drag_coefficients  = CD
+    airfoil_data.angle_of_attacks   = AoA_sweep*Units.degrees
+
+    return airfoil_data
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def compute_aerodas_polars(airfoil_data,airfoil_polar_data,AR):
+    """Extends the pre-stall polars of each airfoil over -20 to 90 degrees with the AERODAS model,
+    for all angles of attack at once.
+
+    Assumptions:
+    Uses AERODAS forumatuon for post stall characteristics
+
+    Source:
+    Models of Lift and Drag Coefficients of Stalled and Unstalled Airfoils in Wind Turbines and Wind Tunnels
+    by D Spera, 2008
+
+    Inputs:
+    airfoil_data.
+        thickness_to_chord [unitless]
+    airfoil_polar_data.
+        lift_coefficients  [unitless]
+        drag_coefficients  [unitless]
+        angle_of_attacks   [degrees]
+    AR                     [unitless]
+
+    Outputs:
+    CL                     [unitless]
+    CD                     [unitless]
+    AoA_sweep              [degrees]
+
+    Properties Used:
+    N/A
+    """
+
+    num_airfoils = len(airfoil_polar_data.lift_coefficients)
 
     # Get all of the coefficients for AERODAS wings
     AoA_sweep = np.linspace(-20,90,111)
@@ -61,12 +194,11 @@ def compute_airfoil_polars(propeller,a_geo,a_polar):
     CD = np.zeros((num_airfoils,len(AoA_sweep)))
 
     # AERODAS
-    for i in range(num_airfoils):           
-        # read airfoil polars 
-        airfoil_polar_data =  import_airfoil_polars(a_polar)
-        airfoil_cl  = airfoil_polar_data.lift_coefficients[i] 
-        airfoil_cd  = airfoil_polar_data.drag_coefficients[i] 
-        airfoil_aoa = airfoil_polar_data.angle_of_attacks[i]   
+    for i in range(num_airfoils):
+        airfoil_cl  = airfoil_polar_data.lift_coefficients[i]
+        airfoil_cd  = airfoil_polar_data.drag_coefficients[i]
+        airfoil_aoa = airfoil_polar_data.angle_of_attacks[i]
+        t_c         = airfoil_data.thickness_to_chord[i]
 
         # computing approximate zero lift aoa
         airfoil_cl_plus = airfoil_cl[airfoil_cl>0]
@@ -76,123 +208,107 @@ def compute_airfoil_polars(propeller,a_geo,a_polar):
         # computing approximate lift curve slope
         cl_range = airfoil_aoa[idx_zero_lift:idx_zero_lift+50]
         aoa_range = airfoil_cl[idx_zero_lift:idx_zero_lift+50]
-        S1 = np.mean(np.diff(cl_range)/np.diff(aoa_range))  
+        S1 = np.mean(np.diff(cl_range)/np.diff(aoa_range))
 
         # max lift coefficent and associated aoa
-        CL1max  = np.max(airfoil_cl) 
+        CL1max  = np.max(airfoil_cl)
         idx_aoa_max_prestall_cl = np.where(airfoil_cl == CL1max)[0][0]
         ACL1  = airfoil_aoa[idx_aoa_max_prestall_cl]
 
         # max drag coefficent and associated aoa
-        CD1max  = np.max(airfoil_cd) 
+        CD1max  = np.max(airfoil_cd)
         idx_aoa_max_prestall_cd = np.where(airfoil_cd == CD1max)[0][0]
-        ACD1   = airfoil_aoa[idx_aoa_max_prestall_cd]          
+        ACD1   = airfoil_aoa[idx_aoa_max_prestall_cd]
 
-        CD0     = airfoil_cd[idx_zero_lift]       
+        CD0     = airfoil_cd[idx_zero_lift]
         CL1maxp = CL1max
         ACL1p   = ACL1
         ACD1p   = ACD1
         CD1maxp = CD1max
         S1p     = S1
 
-        for j in range(len(AoA_sweep)):
-            alpha  = AoA_sweep[j] 
-            t_c = airfoil_data.thickness_to_chord[i]
-
-            # Equation 5a
-            ACL1   = ACL1p + 18.2*CL1maxp*(AR**(-0.9)) 
-
-            # From McCormick
-            S1 = S1p*AR/(2+np.sqrt(4+AR**2)) 
-
-            # Equation 5c
-            ACD1   =  ACD1p + 18.2*CL1maxp*(AR**(-0.9)) 
-
-            # Equation 5d
-            CD1max = CD1maxp + 0.280*(CL1maxp*CL1maxp)*(AR**(-0.9))
-
-            # Equation 5e
-            CL1max = CL1maxp*(0.67+0.33*np.exp(-(4.0/AR)**2.))
-
-            # ------------------------------------------------------
-            # Equations for coefficients in pre-stall regime 
-            # ------------------------------------------------------
-            # Equation 6c
-            RCL1   = S1*(ACL1-A0)-CL1max
-
-            # Equation 6d
-            N1     = 1 + CL1max/RCL1
-
-            # Equation 6a or 6b depending on the alpha                  
-            if alpha == A0:
-                CL[i,j] = 0.0        
-            elif alpha > A0: 
-                CL[i,j] = S1*(alpha - A0)-RCL1*((alpha-A0)/(ACL1-A0))**N1        
-            else:
-                CL[i,j] = S1*(alpha - A0)+RCL1 *((A0-alpha )/(ACL1 -A0))**N1 
-
-            # Equation 7a or 7b depending on alpha
-            M    = 2.0  
-            con  = np.logical_and((2*A0-ACD1)<=alpha,alpha<=ACD1)
-            if con == True:
-                CD[i,j] = CD0  + (CD1max -CD0)*((alpha  -A0)/(ACD1 -A0))**M   
-            else:
-                CD[i,j] = 0.  
-            # ------------------------------------------------------
-            # Equations for coefficients in post-stall regime 
-            # ------------------------------------------------------               
-            # Equation 9a and b
-            F1        = 1.190*(1.0-(t_c**2))
-            F2        = 0.65 + 0.35*np.exp(-(9.0/AR)**2.3)
-
-            # Equation 10b and c
-            G1        = 2.3*np.exp(-(0.65*t_c)**0.9)
-            G2        = 0.52 + 0.48*np.exp(-(6.5/AR)**1.1)
-
-            # Equation 8a and b
-            CL2max    = F1*F2
-            CD2max    = G1*G2
-
-            # Equation 11d
-            RCL2      = 1.632-CL2max
-
-            # Equation 11e
-            N2        = 1 + CL2max/RCL2
-
-            # LIFT COEFFICIENT
-            # Equation 11a,b,c
-            if alpha > ACL1:
-                con2      = np.logical_and(ACL1<=alpha,alpha<=(92.0))
-                con3      = [alpha>=(92.0)]                   
-                if con2 == True:
-                    CL[i,j] = -0.032*(alpha-92.0) - RCL2*((92.-alpha)/(51.0))**N2
-                elif con3 == True:
-                    CL[i,j] = -0.032*(alpha-92.0) + RCL2*((alpha-92.)/(51.0))**N2
-
-            # If alpha is negative flip things for lift
-            elif alpha < 0.:  
-                alphan    = - alpha+2*A0
-                con2      = np.logical_and(ACL1<=alpha, alpha<=(92.0))
-                con3      = alpha>=(92.0)                    
-                if con2 == True:
-                    CL[i,j] = 0.032*(alphan-92.0) + RCL2*((92.-alpha)/(51.0))**N2
-                elif con3 == True:
-                    CL[i,j] = 0.032*(alphan-92.0) - RCL2*((alphan-92.)/(51.0))**N2
-
-            # DRAG COEFFICIENT
-            # Equation 12a 
-            if  alpha > ACD1:
-                CD[i,j]  = CD1max + (CD2max - CD1max) * np.sin(((alpha-ACD1)/(90.-ACD1))*90.*Units.degrees)
-
-            # If alpha is negative flip things for drag
-            elif alpha < 0.:
-                alphan    = -alpha + 2*A0
-                if alphan>=ACD1:
-                    CD[i,j]  = CD1max + (CD2max - CD1max) * np.sin(((alphan-ACD1)/(90.-ACD1))*Units.degrees)     
-
-
-    airfoil_data.lift_coefficients  = CL
-    airfoil_data.drag_coefficients  = CD
-    airfoil_data.angle_of_attacks   = AoA_sweep*Units.degrees 
-
-    return airfoil_data   
+        # Equation 5a
+        ACL1   = ACL1p + 18.2*CL1maxp*(AR**(-0.9))
+
+        # From McCormick
+        S1 = S1p*AR/(2+np.sqrt(4+AR**2))
+
+        # Equation 5c
+        ACD1   =  ACD1p + 18.2*CL1maxp*(AR**(-0.9))
+
+        # Equation 5d
+        CD1max = CD1maxp + 0.280*(CL1maxp*CL1maxp)*(AR**(-0.9))
+
+        # Equation 5e
+        CL1max = CL1maxp*(0.67+0.33*np.exp(-(4.0/AR)**2.))
+
+        # ------------------------------------------------------
+        # Equations for coefficients in pre-stall regime
+        # ------------------------------------------------------
+        # Equation 6c
+        RCL1   = S1*(ACL1-A0)-CL1max
+
+        # Equation 6d
+        N1     = 1 + CL1max/RCL1
+
+        # Equation 6a or 6b depending on the alpha, zero at A0
+        alpha  = AoA_sweep[AoA_sweep > A0]
+        CL[i,AoA_sweep > A0] = S1*(alpha - A0)-RCL1*((alpha-A0)/(ACL1-A0))**N1
+        alpha  = AoA_sweep[AoA_sweep < A0]
+        CL[i,AoA_sweep < A0] = S1*(alpha - A0)+RCL1 *((A0-alpha )/(ACL1 -A0))**N1
+
+        # Equation 7a or 7b depending on alpha
+        M      = 2.0
+        con    = np.logical_and((2*A0-ACD1)<=AoA_sweep,AoA_sweep<=ACD1)
+        alpha  = AoA_sweep[con]
+        CD[i,con] = CD0  + (CD1max -CD0)*((alpha  -A0)/(ACD1 -A0))**M
+
+        # ------------------------------------------------------
+        # Equations for coefficients in post-stall regime
+        # ------------------------------------------------------
+        # Equation 9a and b
+        F1        = 1.190*(1.0-(t_c**2))
+        F2        = 0.65 + 0.35*np.exp(-(9.0/AR)**2.3)
+
+        # Equation 10b and c
+        G1        = 2.3*np.exp(-(0.65*t_c)**0.9)
+        G2        = 0.52 + 0.48*np.exp(-(6.5/AR)**1.1)
+
+        # Equation 8a and b
+        CL2max    = F1*F2
+        CD2max    = G1*G2
+
+        # Equation 11d
+        RCL2      = 1.632-CL2max
+
+        # Equation 11e
+        N2        = 1 + CL2max/RCL2
+
+        # LIFT COEFFICIENT
+        # Equation 11a,b,c
+        con2      = np.logical_and(ACL1<AoA_sweep,AoA_sweep<=92.0)
+        con3      = np.logical_and(ACL1<AoA_sweep,AoA_sweep>92.0)
+        alpha     = AoA_sweep[con2]
+        CL[i,con2] = -0.032*(alpha-92.0) - RCL2*((92.-alpha)/(51.0))**N2
+        alpha     = AoA_sweep[con3]
+        CL[i,con3] = -0.032*(alpha-92.0) + RCL2*((alpha-92.)/(51.0))**N2
+
+        # If alpha is negative flip things for lift
+        con2      = (AoA_sweep<=ACL1) & (AoA_sweep<0.) & (ACL1<=AoA_sweep)
+        alpha     = AoA_sweep[con2]
+        alphan    = - alpha+2*A0
+        CL[i,con2] = 0.032*(alphan-92.0) + RCL2*((92.-alpha)/(51.0))**N2
+
+        # DRAG COEFFICIENT
+        # Equation 12a
+        con       = AoA_sweep > ACD1
+        alpha     = AoA_sweep[con]
+        CD[i,con] = CD1max + (CD2max - CD1max) * np.sin(((alpha-ACD1)/(90.-ACD1))*90.*Units.degrees)
+
+        # If alpha is negative flip things for drag
+        alphan    = -AoA_sweep + 2*A0
+        con       = (AoA_sweep<=ACD1) & (AoA_sweep<0.) & (alphan>=ACD1)
+        alphan    = alphan[con]
+        CD[i,con] = CD1max + (CD2max - CD1max) * np.sin(((alphan-ACD1)/(90.-ACD1))*Units.degrees)
+
+    return CL, CD, AoA_sweep
@@ -0,0 +1,556 @@
+## @ingroup Methods-Missions-Segments-Common
+# Batch.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Analyses import Process
+from SUAVE.Analyses.Mission.Segments.Conditions import State, Conditions, Numerics
+
+# ----------------------------------------------------------------------
+#  Initialize Variants
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def initialize_variants(segment):
+    """ Runs the initialize process of every variant in a batch
+
+        Assumptions:
+        Every variant is a complete segment that can be initialized on its own
+
+        Inputs:
+            segment.segments [Process]
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+
+    """
+
+    for tag,variant in segment.segments.items():
+
+        if Process.verbose:
+            print('variant start :' , tag)
+
+        variant.initialize()
+
+        if Process.verbose:
+            print('variant end :' , tag)
+
+
+# ----------------------------------------------------------------------
+#  Stack Variant States
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def stack_variant_states(segment):
+    """ Stacks the states of all variants along the control point rows
+
+        Assumptions:
+        Every variant has the same iterate process and the same unknowns and residuals.
+        Unknowns and residuals are 2D arrays with one row per control point.
+        Steps listed in segment.pointwise_steps only act row by row on the conditions, so they
+        can be evaluated once on the stacked state. Every other step is evaluated variant by variant.
+        Scalar attributes of the variants that differ between variants are handed to the
+        pointwise steps as columns with one row per stacked control point.
+
+        Inputs:
+            segment.segments               [Process]
+            segment.pointwise_steps        [list of functions]
+            variant.state.unknowns         [Data]
+            variant.state.conditions       [Data]
+            variant.state.residuals        [Data]
+            variant.state.numerics         [Data]
+
+        Outputs:
+            segment.state.unknowns         [Data]
+            segment.state.conditions       [Data]
+            segment.state.residuals        [Data]
+            segment.state.numerics         [Data]
+            segment.stacked.rows           [list of slices]
+            segment.stacked.steps          [list]
+            segment.stacked.segment        [Data]
+
+        Properties Used:
+        N/A
+
+    """
+
+    variants = list(segment.segments.values())
+    if not variants:
+        raise ValueError('A batch needs at least one variant')
+
+    # rows of each variant in the stacked state
+    rows  = []
+    start = 0
+    for variant in variants:
+        n_cp = variant.state.numerics.number_control_points
+        rows.append(slice(start,start+n_cp))
+        start = start + n_cp
+    size = start
+
+    # stack the states
+    state = State()
+    state._size = size
+    for key in ['unknowns','conditions','residuals']:
+        state[key] = stack_data([variant.state[key] for variant in variants],rows,size)
+
+    for key in ['unknowns','residuals']:
+        for path, value in array_items(state[key]):
+            if isinstance(value,str):
+                continue
+            if np.ndim(value) != 2 or value.shape[0] != size:
+                raise ValueError('Batched segments need 2D ' + key + ' with one row per control point, ' \
+                                 + '.'.join(path) + ' is not')
+
+    # the stacked solve uses the first variant's solver settings with a block diagonal jacobian
+    first    = variants[0].state.numerics
+    numerics = Numerics()
+    for key in ['tolerance_solution','max_evaluations','solver_broyden','solver_warm_start','jacobian_step']:
+        numerics[key] = first[key]
+    if first.solver_jacobian == 'complex_step':
+        numerics.solver_jacobian = 'complex_step'
+    else:
+        numerics.solver_jacobian = 'finite_difference'
+    numerics.number_control_points = size
+
+    unknown_ids  = variant_ids(state.unknowns,rows).pack_array()
+    residual_ids = variant_ids(state.residuals,rows).pack_array()
+    numerics.jacobian_sparsity = residual_ids[:,None] == unknown_ids[None,:]
+
+    # keep what a previous solve of this batch left for warm starts
+    previous = segment.state.numerics
+    for key in ['converged_unknowns','jacobian']:
+        if key in previous:
+            numerics[key] = previous[key]
+
+    for key in ['unknowns','conditions','residuals']:
+        segment.state[key] = state[key]
+    segment.state._size    = size
+    segment.state.numerics = numerics
+
+    # sort the iterate steps into pointwise steps and per variant steps
+    steps = flatten_process(variants[0].process.iterate)
+    for variant in variants[1:]:
+        other = flatten_process(variant.process.iterate)
+        if [getattr(step,'__func__',step) for path,step in other] != [getattr(step,'__func__',step) for path,step in steps]:
+            raise ValueError('All variants in a batch need the same iterate process')
+
+    pointwise = segment.pointwise_steps
+    groups    = []
+    for path, step in steps:
+        is_pointwise = any([step is function for function in pointwise])
+        if groups and groups[-1][0] == is_pointwise:
+            groups[-1][1].append(step)
+        else:
+            groups.append((is_pointwise,[step]))
+
+    segment.stacked = Data()
+    segment.stacked.rows    = rows
+    segment.stacked.steps   = groups
+    segment.stacked.segment = stack_segment(segment,variants,rows)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Iterate Variants
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def iterate_variants(segment):
+    """ Runs one iteration of every variant on the stacked state
+
+        Assumptions:
+        stack_variant_states has been run
+
+        Inputs:
+            segment.state        [Data]
+            segment.stacked      [Data]
+
+        Outputs:
+            segment.state        [Data]
+
+        Properties Used:
+        N/A
+
+    """
+
+    stacked  = segment.stacked
+    variants = list(segment.segments.values())
+
+    for pointwise, steps in stacked.steps:
+        if pointwise:
+            for step in steps:
+                evaluate_step(step,stacked.segment)
+        else:
+            scatter_variants(segment)
+            for variant in variants:
+                for step in steps:
+                    evaluate_step(step,variant)
+            gather_variants(segment)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Finalize Variants
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def finalize_variants(segment):
+    """ Hands the converged stacked state back to the variants and finalizes them
+
+        Assumptions:
+        N/A
+
+        Inputs:
+            segment.state        [Data]
+
+        Outputs:
+            variant.state        [Data]
+
+        Properties Used:
+        N/A
+
+    """
+
+    scatter_variants(segment)
+
+    converged = segment.state.numerics.converged
+    for tag,variant in segment.segments.items():
+        variant.state.numerics.converged = converged
+        variant.finalize()
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Scatter and Gather
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def scatter_variants(segment):
+    """ Points the variant states at their rows of the stacked state
+
+        Assumptions:
+        The variant arrays are views, so in place updates reach the stacked state directly
+
+        Inputs:
+            segment.state        [Data]
+
+        Outputs:
+            variant.state        [Data]
+
+        Properties Used:
+        N/A
+
+    """
+
+    rows = segment.stacked.rows
+    size = segment.state._size
+
+    for variant, row in zip(segment.segments.values(),rows):
+        for key in ['unknowns','conditions','residuals']:
+            for path, value in array_items(segment.state[key]):
+                if np.ndim(value) >= 2 and value.shape[0] == size:
+                    set_path(variant.state[key],path,value[row])
+
+    return
+
+
+## @ingroup Methods-Missions-Segments-Common
+def gather_variants(segment):
+    """ Copies the variant states back into their rows of the stacked state
+
+        Assumptions:
+        Arrays added by the variants are stacked, arrays that changed width are restacked
+
+        Inputs:
+            variant.state        [Data]
+
+        Outputs:
+            segment.state        [Data]
+
+        Properties Used:
+        N/A
+
+    """
+
+    rows     = segment.stacked.rows
+    size     = segment.state._size
+    variants = list(segment.segments.values())
+
+    for key in ['unknowns','conditions','residuals']:
+        for path, value in array_items(variants[0].state[key]):
+            values = [get_path(variant.state[key],path) for variant in variants]
+            if not all([np.ndim(v) >= 2 and v.shape[0] == row.stop - row.start for v,row in zip(values,rows)]):
+                continue
+
+            target = get_path(segment.state[key],path)
+            if np.ndim(target) >= 2 and target.shape == (size,) + value.shape[1:]:
+                for v, row in zip(values,rows):
+                    # views handed out by scatter_variants are already up to date
+                    if v.base is not target:
+                        target[row] = v
+            else:
+                set_path(segment.state[key],path,np.vstack(values))
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def stack_data(datas,rows,size):
+    """ Stacks the row arrays of several data structures with the same layout
+
+        Assumptions:
+        Anything that isn't a 2D or higher array with one row per control point is taken from the first structure
+
+        Inputs:
+            datas [list of Data]
+            rows  [list of slices]
+            size  [int]
+
+        Outputs:
+            stacked [Data]
+
+        Properties Used:
+        N/A
+
+    """
+
+    first = datas[0]
+    out   = first.__class__()
+    if isinstance(out,Conditions):
+        out._size = size
+
+    for key, value in first.items():
+        if isinstance(value,Data):
+            out[key] = stack_data([data[key] for data in datas],rows,size)
+        elif np.ndim(value) >= 2 and value.shape[0] == rows[0].stop - rows[0].start:
+            out[key] = np.vstack([data[key] for data in datas])
+        else:
+            out[key] = value
+
+    return out
+
+
+## @ingroup Methods-Missions-Segments-Common
+def stack_segment(segment,variants,rows):
+    """ Builds the segment that the pointwise steps are evaluated on
+
+        Assumptions:
+        The variants share their analyses
+
+        Inputs:
+            segment.state  [Data]
+            variants       [list of Segments]
+            rows           [list of slices]
+
+        Outputs:
+            stacked        [Data]
+
+        Properties Used:
+        N/A
+
+    """
+
+    first   = variants[0]
+    stacked = Data()
+
+    skip = ['state','conditions','analyses','process','settings','segments','tag']
+    for key, value in first.items():
+        if key in skip:
+            continue
+        values = [variant.get(key) for variant in variants]
+        if isinstance(value,(int,float)) and not isinstance(value,bool) \
+           and all([isinstance(v,(int,float)) for v in values]) and len(set(values)) > 1:
+            column = np.zeros([segment.state._size,1])
+            for v, row in zip(values,rows):
+                column[row] = v
+            stacked[key] = column
+        else:
+            stacked[key] = value
+
+    stacked.state      = segment.state
+    stacked.conditions = segment.state.conditions
+    stacked.analyses   = first.analyses
+    stacked.settings   = first.settings
+    stacked.tag        = segment.tag
+
+    return stacked
+
+
+## @ingroup Methods-Missions-Segments-Common
+def variant_ids(data,rows):
+    """ Builds a copy of the unknowns or residuals that holds the variant index of every entry
+
+        Assumptions:
+        N/A
+
+        Inputs:
+            data  [Data]
+            rows  [list of slices]
+
+        Outputs:
+            ids   [Data]
+
+        Properties Used:
+        N/A
+
+    """
+
+    ids = Data()
+    for key, value in data.items():
+        if isinstance(value,Data):
+            ids[key] = variant_ids(value,rows)
+        elif np.ndim(value) == 2:
+            index = np.zeros_like(value,dtype=float)
+            for i, row in enumerate(rows):
+                index[row] = i
+            ids[key] = index
+
+    return ids
+
+
+## @ingroup Methods-Missions-Segments-Common
+def flatten_process(process,path=()):
+    """ Lists the callable steps of a process and its sub processes in evaluation order
+
+        Assumptions:
+        N/A
+
+        Inputs:
+            process [Process]
+
+        Outputs:
+            steps   [list of (path, step)]
+
+        Properties Used:
+        N/A
+
+    """
+
+    steps = []
+    for tag, step in process.items():
+        if isinstance(step,Process):
+            steps.extend(flatten_process(step,path + (tag,)))
+        elif callable(step):
+            steps.append((path + (tag,),step))
+
+    return steps
+
+
+## @ingroup Methods-Missions-Segments-Common
+def evaluate_step(step,segment):
+    """ Evaluates a single process step the same way Process does
+
+        Assumptions:
+        N/A
+
+        Inputs:
+            step    [function]
+            segment [Segment]
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+
+    """
+    if hasattr(step,'evaluate'):
+        step.evaluate(segment)
+    else:
+        step(segment)
+
+
+## @ingroup Methods-Missions-Segments-Common
+def array_items(data,path=()):
+    """ Lists every non Data value in a nested data structure with its key path
+
+        Assumptions:
+        N/A
+
+        Inputs:
+            data    [Data]
+
+        Outputs:
+            items   [list of (path, value)]
+
+        Properties Used:
+        N/A
+
+    """
+
+    items = []
+    for key, value in data.items():
+        if isinstance(value,Data):
+            items.extend(array_items(value,path + (key,)))
+        else:
+            items.append((path + (key,),value))
+
+    return items
+
+
+## @ingroup Methods-Missions-Segments-Common
+def get_path(data,path):
+    """ Gets a value from a nested data structure, None if it isn't there
+
+        Assumptions:
+        N/A
+
+        Inputs:
+            data    [Data]
+            path    [tuple of strings]
+
+        Outputs:
+            value
+
+        Properties Used:
+        N/A
+
+    """
+    for key in path:
+        if not isinstance(data,Data) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+
+## @ingroup Methods-Missions-Segments-Common
+def set_path(data,path,value):
+    """ Sets a value in a nested data structure, adding any missing levels
+
+        Assumptions:
+        N/A
+
+        Inputs:
+            data    [Data]
+            path    [tuple of strings]
+            value
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+
+    """
+    for key in path[:-1]:
+        if key not in data or not isinstance(data[key],Data):
+            data[key] = Conditions()
+        data = data[key]
+    data[path[-1]] = value
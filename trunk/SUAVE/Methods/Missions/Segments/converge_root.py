@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -31,28 +32,47 @@ def converge_root(segment):
     segment                            [Data]
     segment.settings.root_finder       [Data]
     state.numerics.tolerance_solution  [Unitless]
+    state.numerics.solver_jacobian     [String]
+    state.numerics.solver_broyden      [Boolean]
+    state.numerics.solver_warm_start   [Boolean]
 
     Outputs:
     state.unknowns                     [Any]
     segment.state.numerics.converged   [Unitless]
+    state.numerics.converged_unknowns  [array]
 
     Properties Used:
     N/A
     """       
     
+    numerics = segment.state.numerics
     unknowns = segment.state.unknowns.pack_array()
     
+    # start from the last converged solve of this segment
+    last = numerics.converged_unknowns
+    if numerics.solver_warm_start and isinstance(last,array_type) and last.shape == unknowns.shape:
+        unknowns = last.copy()
+    
     try:
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
     
-    unknowns,infodict,ier,msg = root_finder( iterate,
-                                         unknowns,
-                                         args = segment,
-                                         xtol = segment.state.numerics.tolerance_solution,
-                                         maxfev = segment.state.numerics.max_evaluations,
-                                         full_output = 1)
+    # a sparsity pattern kept from an earlier solve misses the entries that were zero wherever it was
+    # found, so a failed solve on it finds the pattern again and starts over
+    reused = uses_sparsity(segment) and isinstance(numerics.jacobian_sparsity,array_type)
+    start  = np.array(unknowns)
+    
+    unknowns,infodict,ier,msg = solve(segment,root_finder,unknowns)
+    
+    if ier!=1 and reused:
+        numerics.jacobian_sparsity = None
+        numerics.jacobian          = None
+        unknowns,infodict,ier,msg  = solve(segment,root_finder,start)
+    
+    # keep the broyden updated jacobian for the next solve
+    if numerics.solver_broyden:
+        numerics.jacobian = final_jacobian(infodict) if ier==1 else None
     
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
@@ -62,6 +82,7 @@ def converge_root(segment):
     else:
         segment.state.numerics.converged = True
         segment.converged = True
+        numerics.converged_unknowns = np.array(unknowns)
                             
     return
     
@@ -69,6 +90,47 @@ def converge_root(segment):
 #  Helper Functions
 # ----------------------------------------------------------------------
 
+## @ingroup Methods-Missions-Segments
+def solve(segment, root_finder, unknowns):
+    """Hands the residuals, and the jacobian if one was asked for, to the root finder.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                           [array]
+    root_finder                        [function]
+    state.numerics.tolerance_solution  [Unitless]
+    state.numerics.max_evaluations     [Unitless]
+    state.numerics.solver_broyden      [Boolean]
+
+    Outputs:
+    unknowns, infodict, ier, msg       see scipy.optimize.fsolve
+
+    Properties Used:
+    N/A
+    """       
+    
+    numerics = segment.state.numerics
+    
+    options = dict( args        = segment,
+                    xtol        = numerics.tolerance_solution,
+                    maxfev      = numerics.max_evaluations,
+                    full_output = 1 )
+    
+    # only hand a jacobian to the root finder if one was asked for
+    residuals = iterate
+    jacobian  = get_jacobian(segment)
+    if numerics.solver_broyden:
+        residuals, jacobian = reuse_jacobian(segment,unknowns,jacobian or finite_difference_jacobian)
+    if jacobian is not None:
+        options['fprime'] = remember_jacobian(jacobian)
+    
+    return root_finder( residuals, unknowns, **options)
+
 ## @ingroup Methods-Missions-Segments
 def iterate(unknowns, segment):
     
@@ -99,4 +161,438 @@ def iterate(unknowns, segment):
     
     residuals = segment.state.residuals.pack_array()
         
-    return residuals 
\ No newline at end of file
+    return residuals 
+
+## @ingroup Methods-Missions-Segments
+def get_jacobian(segment):
+    """Selects the jacobian of the residuals that is handed to the root finder.
+
+    Assumptions:
+    'none' leaves the root finder to build its own jacobian.
+
+    Source:
+    N/A
+
+    Inputs:
+    state.numerics.solver_jacobian    [String]
+      'none'                - root finder default (dense finite differencing)
+      'function'            - state.numerics.jacobian_function(unknowns,segment)
+      'finite_difference'   - column coloured finite differences
+      'complex_step'        - column coloured complex step
+    state.numerics.jacobian_function  [function]
+
+    Outputs:
+    jacobian                          [function or None]
+
+    Properties Used:
+    N/A
+    """       
+    
+    numerics = segment.state.numerics
+    method   = numerics.solver_jacobian
+    
+    if method is None or method == 'none':
+        jacobian = None
+    elif method == 'function':
+        jacobian = numerics.jacobian_function
+        if not callable(jacobian):
+            raise ValueError('solver_jacobian is "function" but state.numerics.jacobian_function is not callable')
+    elif method == 'finite_difference':
+        jacobian = finite_difference_jacobian
+    elif method == 'complex_step':
+        jacobian = complex_step_jacobian
+    else:
+        raise ValueError('unknown solver_jacobian "%s"' % method)
+    
+    return jacobian
+
+## @ingroup Methods-Missions-Segments
+def uses_sparsity(segment):
+    """Checks whether the jacobian handed to the root finder is built on the sparsity pattern.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    state.numerics.solver_jacobian    [String]
+    state.numerics.solver_broyden     [Boolean]
+
+    Outputs:
+    uses_sparsity                     [Boolean]
+
+    Properties Used:
+    N/A
+    """       
+    
+    jacobian = get_jacobian(segment)
+    if segment.state.numerics.solver_broyden:
+        jacobian = jacobian or finite_difference_jacobian
+    
+    return jacobian in (finite_difference_jacobian, complex_step_jacobian)
+
+## @ingroup Methods-Missions-Segments
+def finite_difference_jacobian(unknowns, segment):
+    """Finite difference jacobian of the residuals. Columns that never share a nonzero
+    row are perturbed together, so the cost per jacobian is one residual evaluation per
+    column colour rather than one per unknown.
+
+    Assumptions:
+    The sparsity pattern is found from dense jacobians the first time through unless
+    one is supplied, see coloured_jacobian. It is kept in state.numerics.jacobian_sparsity
+    and reused on later solves of the segment.
+
+    Source:
+    Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of Sparse
+    Jacobian Matrices", IMA Journal of Applied Mathematics, 1974.
+
+    Inputs:
+    unknowns                          [array]
+    state.numerics.jacobian_step      [Unitless]
+    state.numerics.jacobian_sparsity  [array]
+
+    Outputs:
+    jacobian                          [array]
+
+    Properties Used:
+    N/A
+    """       
+    
+    # relative step on each unknown
+    step = segment.state.numerics.jacobian_step * np.maximum(np.abs(unknowns),1.)
+    
+    def perturb(x,columns):
+        x = x.copy()
+        x[columns] = x[columns] + step[columns]
+        return x
+    
+    def derivative(residuals,residuals_0,columns):
+        return (residuals - residuals_0)[:,None] / step[columns]
+    
+    def reference(x):
+        return iterate(x,segment)
+    
+    jacobian = coloured_jacobian(unknowns,segment,reference,perturb,derivative)
+    
+    return jacobian
+
+## @ingroup Methods-Missions-Segments
+def complex_step_jacobian(unknowns, segment):
+    """Complex step jacobian of the residuals, using the same column colouring as
+    finite_difference_jacobian. The result is exact to machine precision.
+
+    Assumptions:
+    Every analysis in segment.process.iterate must carry complex numbers through. An
+    analysis that writes into a preallocated real array drops the perturbation and the
+    matching jacobian entries are lost.
+    The state is cast back to real once the jacobian is built.
+
+    Source:
+    Martins, J. R. R. A., Sturdza, P., and Alonso, J. J., "The Complex-Step Derivative
+    Approximation", ACM Transactions on Mathematical Software, 2003.
+
+    Inputs:
+    unknowns                          [array]
+    state.numerics.jacobian_sparsity  [array]
+
+    Outputs:
+    jacobian                          [array]
+
+    Properties Used:
+    N/A
+    """       
+    
+    h     = 1e-30
+    state = segment.state
+    
+    def perturb(x,columns):
+        x = x.astype(complex)
+        x[columns] = x[columns] + 1j*h
+        return x
+    
+    def derivative(residuals,residuals_0,columns):
+        return np.imag(residuals)[:,None] / h * np.ones(len(columns))
+    
+    def reference(x):
+        return np.zeros(len(state.residuals.pack_array()))
+    
+    cast_arrays(state.unknowns,complex)
+    try:
+        jacobian = coloured_jacobian(unknowns,segment,reference,perturb,derivative)
+    finally:
+        # the real parts are still the unperturbed state
+        for key in ['unknowns','conditions','residuals']:
+            cast_arrays(state[key],float)
+    
+    return jacobian
+
+## @ingroup Methods-Missions-Segments
+def coloured_jacobian(unknowns, segment, reference, perturb, derivative):
+    """Builds a jacobian one column colour at a time.
+
+    Assumptions:
+    With no usable sparsity pattern every column is perturbed on its own and the
+    pattern is stored from the result. An entry can be zero at one point only, such as
+    a product with a factor that is zero there or a residual that is flat or clipped
+    there, so the pattern also takes the nonzero entries of a second dense jacobian at
+    unknowns shifted by jacobian_sparsity_shift.
+    The pattern is only ever checked, not proven. A perturbation that changes a row
+    outside the pattern of its colour shows the pattern is missing entries, the dense
+    passes are then run again and their pattern added to the stored one. A missing entry
+    in a row that another column of its colour has is not seen, converge_root finds the
+    pattern again if a solve on a stored pattern fails. Set the pattern to None when
+    the segment changes enough for that to matter.
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                                [array]
+    reference(x)                            [function] residuals the derivatives are taken from
+    perturb(x,columns)                      [function]
+    derivative(r,r_0,columns)               [function]
+    state.numerics.jacobian_sparsity        [array]
+    state.numerics.jacobian_sparsity_shift  [Unitless]
+
+    Outputs:
+    jacobian                                [array]
+    state.numerics.jacobian_sparsity        [array]
+
+    Properties Used:
+    N/A
+    """      
+    
+    numerics    = segment.state.numerics
+    residuals_0 = reference(unknowns)
+    n_res       = len(residuals_0)
+    n_unk       = len(unknowns)
+    sparsity    = numerics.jacobian_sparsity
+    
+    def dense_jacobian(x,residuals_0):
+        jacobian = np.zeros([n_res,n_unk])
+        for j in range(n_unk):
+            residuals = iterate(perturb(x,[j]),segment)
+            jacobian[:,j] = derivative(residuals,residuals_0,[j])[:,0]
+        return jacobian
+    
+    # dense passes to find the pattern
+    if not isinstance(sparsity,array_type) or sparsity.shape != (n_res,n_unk):
+        shift    = numerics.jacobian_sparsity_shift * np.maximum(np.abs(unknowns),1.)
+        shift    = shift * np.random.RandomState(0).uniform(0.5,1.,n_unk)
+        shifted  = np.real(unknowns) + shift
+        pattern  = dense_jacobian(shifted,reference(shifted)) != 0.
+        jacobian = dense_jacobian(unknowns,residuals_0)
+        numerics.jacobian_sparsity = pattern | (jacobian != 0.)
+        return jacobian
+    
+    jacobian = np.zeros([n_res,n_unk])
+    for columns in colour_columns(sparsity):
+        residuals = iterate(perturb(unknowns,columns),segment)
+        change    = derivative(residuals,residuals_0,columns)
+        rows      = sparsity[:,columns]
+        
+        # a change outside the rows of the colour is an entry the pattern is missing
+        if np.any(change[~np.any(rows,axis=1)] != 0.):
+            numerics.jacobian_sparsity = None
+            jacobian = coloured_jacobian(unknowns,segment,reference,perturb,derivative)
+            numerics.jacobian_sparsity = numerics.jacobian_sparsity | sparsity
+            return jacobian
+        
+        jacobian[:,columns] = np.where(rows,change,0.)
+        
+    return jacobian
+
+## @ingroup Methods-Missions-Segments
+def colour_columns(sparsity):
+    """Greedy grouping of jacobian columns so that no two columns in a group share a
+    nonzero row.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    sparsity  [array of booleans]
+
+    Outputs:
+    colours   [list of column index arrays]
+
+    Properties Used:
+    N/A
+    """       
+    
+    sparsity = np.asarray(sparsity,dtype=bool)
+    colours  = []
+    occupied = []
+    
+    # densest columns first gives fewer colours
+    for j in np.argsort(-np.sum(sparsity,axis=0),kind='stable'):
+        column = sparsity[:,j]
+        for c in range(len(colours)):
+            if not np.any(occupied[c] & column):
+                colours[c].append(j)
+                occupied[c] |= column
+                break
+        else:
+            colours.append([j])
+            occupied.append(column.copy())
+    
+    return [np.sort(np.array(c)) for c in colours]
+
+## @ingroup Methods-Missions-Segments
+def cast_arrays(data, dtype):
+    """Casts every array in a data structure in place, used to move the state between
+    real and complex arithmetic.
+
+    Assumptions:
+    Only floating point arrays are touched. Casting to a real type drops the imaginary
+    part.
+
+    Source:
+    N/A
+
+    Inputs:
+    data   [Data]
+    dtype  [type]
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """       
+    
+    for k,v in data.items():
+        if isinstance(v,dict):
+            cast_arrays(v,dtype)
+        elif isinstance(v,array_type) and np.issubdtype(v.dtype,np.inexact) and v.dtype != dtype:
+            data[k] = np.real(v).astype(dtype) if np.iscomplexobj(v) else v.astype(dtype)
+    
+    return
+
+
+## @ingroup Methods-Missions-Segments
+def reuse_jacobian(segment, unknowns, build_jacobian):
+    """Wraps the residuals and a jacobian so the root finder starts from a stored jacobian.
+    The root finder corrects its jacobian with Broyden rank one updates between evaluations,
+    so with a good starting jacobian none has to be built at all.
+
+    Assumptions:
+    The stored jacobian is the one left by the last converged solve of this segment or, if
+    jacobian_from_previous_segment is set and the sizes agree, the one left by the previous
+    segment. A jacobian from a different kind of segment can be a poor start, so that is off
+    by default. Any further jacobian the root finder asks for, because the updates stopped
+    making progress, is built fresh.
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                                      [array]
+    build_jacobian                                [function]
+    state.numerics.jacobian                       [array]
+    state.numerics.jacobian_from_previous_segment [Boolean]
+    state.initials.numerics.jacobian              [array]
+
+    Outputs:
+    residuals                                     [function]
+    jacobian                                      [function]
+
+    Properties Used:
+    N/A
+    """     
+    
+    n_unk  = len(unknowns)
+    start  = np.array(unknowns)
+    stored = None
+    
+    numerics   = segment.state.numerics
+    candidates = [numerics.jacobian]
+    if numerics.jacobian_from_previous_segment and isinstance(segment.state.initials.get('numerics'),dict):
+        candidates.append(segment.state.initials.numerics.jacobian)
+    for candidate in candidates:
+        if isinstance(candidate,array_type) and candidate.shape == (n_unk,n_unk):
+            stored = candidate
+            break
+    
+    # the stored jacobian is good until the root finder has moved away from the start
+    moved = [False]
+    
+    def residuals(unknowns, segment):
+        if not moved[0] and not np.array_equal(unknowns,start):
+            moved[0] = True
+        return iterate(unknowns, segment)
+    
+    def jacobian(unknowns, segment):
+        if stored is not None and not moved[0]:
+            return stored.copy()
+        return build_jacobian(unknowns, segment)
+    
+    return residuals, jacobian
+
+## @ingroup Methods-Missions-Segments
+def remember_jacobian(build_jacobian):
+    """Wraps a jacobian so asking twice at the same unknowns only builds it once.
+    fsolve checks fprime at the starting point before handing it to the solver, which
+    asks for it there again.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    build_jacobian                                [function]
+
+    Outputs:
+    jacobian                                      [function]
+
+    Properties Used:
+    N/A
+    """     
+    
+    last = [None, None]
+    
+    def jacobian(unknowns, segment):
+        if last[0] is None or not np.array_equal(unknowns,last[0]):
+            last[0] = np.array(unknowns)
+            last[1] = build_jacobian(unknowns, segment)
+        return last[1].copy()
+    
+    return jacobian
+
+## @ingroup Methods-Missions-Segments
+def final_jacobian(infodict):
+    """Rebuilds the root finder's last jacobian from its QR factors.
+
+    Assumptions:
+    MINPACK style output, infodict['fjac'] holds Q transposed and infodict['r'] the packed
+    upper triangle of R. Returns None for root finders that give neither.
+
+    Source:
+    N/A
+
+    Inputs:
+    infodict  [dict]
+
+    Outputs:
+    jacobian  [array]
+
+    Properties Used:
+    N/A
+    """       
+    
+    if not ('fjac' in infodict and 'r' in infodict):
+        return None
+    
+    Q = infodict['fjac']
+    n = Q.shape[0]
+    R = np.zeros((n,n))
+    R[np.triu_indices(n)] = infodict['r']
+    
+    return np.dot(Q.T,R)
@@ -2,7 +2,7 @@
 # Fidelity One level noise calculations for the airframe components
 # @ingroup Methods-Noise-Fidelity_One
 
-from .noise_airframe_Fink import noise_airframe_Fink
+from .noise_airframe_Fink import noise_airframe_Fink, noise_airframe_Fink_source, noise_airframe_Fink_spectra
 from .noise_clean_wing import noise_clean_wing
 from . import noise_landing_gear
 from . import noise_leading_edge_slat
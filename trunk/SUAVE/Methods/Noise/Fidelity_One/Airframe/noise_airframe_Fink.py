@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, Carlos Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -83,44 +84,14 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
                 Correlation based."""
 
 
-    # ==============================================
-        # Unpack
-    # ==============================================
-    wing     = config.wings
-    flap     = wing.main_wing.control_surfaces.flap
-    
-    Sw       = wing.main_wing.areas.reference  / (Units.ft)**2              #wing area, sq.ft
-    bw       = wing.main_wing.spans.projected / Units.ft                    #wing span, ft
-    Sht      = wing.horizontal_stabilizer.areas.reference / (Units.ft)**2   #horizontal tail area, sq.ft
-    bht      = wing.horizontal_stabilizer.spans.projected / Units.ft        #horizontal tail span, ft
-    Svt      = wing.vertical_stabilizer.areas.reference / (Units.ft)**2     #vertical tail area, sq.ft
-    bvt      = wing.vertical_stabilizer.spans.projected  / Units.ft         #vertical tail span, ft
-    deltaf   = flap.deflection                                              #flap delection, rad
-    Sf       = flap.area  / (Units.ft)**2                                   #flap area, sq.ft        
-    cf       = flap.chord_dimensional  / Units.ft                           #flap chord, ft
-    Dp       = config.landing_gear.main_tire_diameter  / Units.ft           #MLG tyre diameter, ft
-    Hp       = config.landing_gear.nose_tire_diameter  / Units.ft           #MLG strut length, ft
-    Dn       = config.landing_gear.main_strut_length   / Units.ft           #NLG tyre diameter, ft
-    Hn       = config.landing_gear.nose_strut_length   / Units.ft           #NLG strut length, ft
-    gear     = config.landing_gear.gear_condition                           #Gear up or gear down
-    
-    nose_wheels    =   config.landing_gear.nose_wheels                           #Number of wheels   
-    main_wheels    =   config.landing_gear.main_wheels                           #Number of wheels   
-    main_units     =   config.landing_gear.main_units                            #Number of main units   
-    velocity       =   np.float(noise_segment.conditions.freestream.velocity[0,0]) #aircraft velocity 
-    altitude       =   noise_segment.conditions.freestream.altitude[:,0]           #aircraft altitude
-    time           =   noise_segment.conditions.frames.inertial.time[:,0]          #time discretization
-
-    noise_time = np.arange(0.,time[-1],.5)  
-    altitude = np.interp(noise_time,time,altitude)
+    #Geometry and flow conditions along the path, these do not depend on the microphone
+    source = noise_airframe_Fink_source(config,noise_segment,analyses)
 
-    # determining flap slot number
-    if wing.main_wing.control_surfaces.flap.configuration_type   == 'single_slotted':
-        slots = 1
-    elif wing.main_wing.control_surfaces.flap.configuration_type == 'double_slotted':
-        slots = 2
-    elif wing.main_wing.control_surfaces.flap.configuration_type == 'triple_slotted':
-        slots = 3  
+    velocity    = source.velocity
+    altitude    = source.altitude
+    M           = source.M
+    time        = noise_segment.conditions.frames.inertial.time[:,0]          #time discretization
+    noise_time  = source.time
 
     # Geometric information from the source to observer position
     distance_vector = noise_segment.dist    
@@ -133,157 +104,42 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
         
     # Number of points on the discretize segment   
     nsteps=len(noise_time)
-    
-    # Preparing matrix for noise calculation
-    sound_speed = np.zeros(nsteps)
-    density     = np.zeros(nsteps)
-    viscosity   = np.zeros(nsteps)
-    temperature = np.zeros(nsteps)
-    M           = np.zeros(nsteps)
-    deltaw      = np.zeros(nsteps)
-    
-    # ==============================================
-    #         Computing atmospheric conditions
-    # ==============================================
-    
-    for id in range (0,nsteps):
-        atmo_data = analyses.atmosphere.compute_values(altitude[id])
-        
-        #unpack    
-        sound_speed[id] =    np.float(atmo_data.speed_of_sound)
-        density[id]     =    np.float(atmo_data.density)
-        viscosity[id]   =    np.float(atmo_data.dynamic_viscosity*10.7639) #units converstion - m2 to ft2
-        temperature[id] =    np.float(atmo_data.temperature)
-        
-        #Mach number
-        M[id] = velocity/np.sqrt(1.4*287*temperature[id])
-    
-        #Wing Turbulent Boundary Layer thickness, ft
-        deltaw[id] = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity[id]))**(-0.2)
-    
-
-    #Units conversion - knots to ft/s
-    kt2fts = 1.6878098571 
 
     #Generate array with the One Third Octave Band Center Frequencies
     frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
             2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
-
-
-    # Velocity in fts
-    velocity_fst = velocity * Units.knot
     
     #number of positions of the aircraft to calculate the noise
     nrange = len(angle) 
-    i=0
-    SPL_wing_history = np.zeros((nrange,24))
-    SPLht_history    = np.zeros((nrange,24))
-    SPLvt_history    = np.zeros((nrange,24))
-    SPL_flap_history = np.zeros((nrange,24))
-    SPL_slat_history = np.zeros((nrange,24))
-    SPL_main_landing_gear_history = np.zeros((nrange,24))
-    SPL_nose_landing_gear_history = np.zeros((nrange,24))
-    SPL_total_history = np.zeros((nrange,24))
-    
-    #Noise history in dBA
-    SPLt_dBA_history = np.zeros((nrange,24))  
-    SPLt_dBA_max = np.zeros(nrange)    
+
+    #Sound pressure level of each airframe component at the microphone
+    spectra = noise_airframe_Fink_spectra(source,distance_vector[None,:],angle[None,:],phi[None,:])
+
+    SPL_total_history = spectra.total[0]
+    SPL_wing_history  = spectra.wing[0]
+    SPLvt_history     = spectra.vertical_tail[0]
+    SPLht_history     = spectra.horizontal_tail[0]
+    SPL_flap_history  = spectra.flap[0]
+    SPL_slat_history  = spectra.slat[0]
+    SPL_nose_landing_gear_history = spectra.nose_landing_gear[0]
+    SPL_main_landing_gear_history = spectra.main_landing_gear[0]
     
-    #START LOOP FOR EACH POSITION OF AIRCRAFT   
-    for i in range(0,nrange-1):
-        #Emission angle theta   
-        theta = angle[i] 
-        #Distance from airplane to observer, evaluated at retarded time
-        distance = distance_vector[i]    
-       
-         #Atmospheric attenuation
-        delta_atmo=atmospheric_attenuation(distance)
-
-        #Call each noise source model
-        SPL_wing = noise_clean_wing(Sw,bw,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency) - delta_atmo    #Wing Noise
-        SPLht    = noise_clean_wing(Sht,bht,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
-        SPLvt    = noise_clean_wing(Svt,bvt,0,0,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
- 
-        SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,deltaw[i],viscosity[i],M[i],phi[i],theta,distance,frequency) -delta_atmo        #Slat leading edge
- 
-        if (deltaf==0):
-            SPL_flap = np.zeros(24)
-        else:
-            SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M[i],phi[i],theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
- 
-        if gear=='up': #0
-            SPL_main_landing_gear = np.zeros(24)
-            SPL_nose_landing_gear = np.zeros(24)
-        else:
-            SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
-            SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
-        if main_units>1: #Incoherent summation of each main landing gear unit
-            SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
- 
- 
-         #Total Airframe Noise
-        SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
-             10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear))
-            
-        SPL_total_history[i][:] = SPL_total[:]
-        SPL_wing_history[i][:]  = SPL_wing[:]
-        SPLvt_history[i][:]     = SPLvt[:]
-        SPLht_history[i][:]     = SPLht[:]
-        SPL_flap_history[i][:]  = SPL_flap[:]
-        SPL_slat_history[i][:]  = SPL_slat[:]
-        SPL_nose_landing_gear_history[i][:] = SPL_nose_landing_gear[:]
-        SPL_main_landing_gear_history[i][:] = SPL_main_landing_gear[:]
-        
-        
-        #Calculation of dBA based on the sound pressure time history
-        SPLt_dBA = dbA_noise(SPL_total)
-        SPLt_dBA_history[i][:] = SPLt_dBA[:]
-        SPLt_dBA_max[i] = max(SPLt_dBA)        
-       
+    #Calculation of dBA based on the sound pressure time history
+    SPLt_dBA_history = spectra.dBA[0]
+    SPLt_dBA_max     = np.max(SPLt_dBA_history,axis=1)
        
    #Calculation of dBA based on the sound pressure time history
     dbA_total               =       np.max(SPLt_dBA_history)    #(Not used to certification point)
           
-   #Calculation of the Perceived Noise Level EPNL based on the sound time history
-    PNL_total               =       pnl_noise(SPL_total_history)
-    PNL_wing                =       pnl_noise(SPL_wing_history)
-    PNL_ht                  =       pnl_noise(SPLht_history)
-    PNL_vt                  =       pnl_noise(SPLvt_history)
-    PNL_nose_landing_gear   =       pnl_noise(SPL_nose_landing_gear_history)
-    PNL_main_landing_gear   =       pnl_noise(SPL_main_landing_gear_history)
-    PNL_slat                =       pnl_noise(SPL_slat_history)
-    PNL_flap                =       pnl_noise(SPL_flap_history)
-    
+   #Calculation of the Perceived Noise Level with the tone corrections for the total and each component at once
+    SPL_components = np.array([SPL_total_history,SPL_wing_history,SPLht_history,SPLvt_history,SPL_nose_landing_gear_history, \
+                               SPL_main_landing_gear_history,SPL_slat_history,SPL_flap_history])
+    PNLT_components = pnl_noise(SPL_components)+noise_tone_correction(SPL_components)
     
-   #Calculation of the tones corrections on the SPL for each component and total
-    tone_correction_total = noise_tone_correction(SPL_total_history) 
-    tone_correction_wing  = noise_tone_correction(SPL_wing_history)
-    tone_correction_ht    = noise_tone_correction(SPLht_history)
-    tone_correction_vt    = noise_tone_correction(SPLvt_history)
-    tone_correction_flap  = noise_tone_correction(SPL_flap_history)
-    tone_correction_slat  = noise_tone_correction(SPL_slat_history)
-    tone_correction_nose_landing_gear = noise_tone_correction(SPL_nose_landing_gear_history)
-    tone_correction_main_landing_gear = noise_tone_correction(SPL_main_landing_gear_history)
-    
-    #Calculation of the PLNT for each component and total
-    PNLT_total = PNL_total+tone_correction_total
-    PNLT_wing  = PNL_wing+tone_correction_wing
-    PNLT_ht    = PNL_ht+tone_correction_ht
-    PNLT_vt    = PNL_vt+tone_correction_vt
-    PNLT_nose_landing_gear = PNL_nose_landing_gear+tone_correction_nose_landing_gear
-    PNLT_main_landing_gear = PNL_main_landing_gear+tone_correction_main_landing_gear
-    PNLT_slat = PNL_slat+tone_correction_slat
-    PNLT_flap = PNL_flap+tone_correction_flap
+    PNLT_total, PNLT_wing, PNLT_ht, PNLT_vt, PNLT_nose_landing_gear, PNLT_main_landing_gear, PNLT_slat, PNLT_flap = PNLT_components
     
     #Calculation of the EPNL for each component and total
-    EPNL_total = epnl_noise(PNLT_total)
-    EPNL_wing  = epnl_noise(PNLT_wing)
-    EPNL_ht    = epnl_noise(PNLT_ht)
-    EPNL_vt    = epnl_noise(PNLT_vt)    
-    EPNL_nose_landing_gear = epnl_noise(PNLT_nose_landing_gear)
-    EPNL_main_landing_gear = epnl_noise(PNLT_main_landing_gear)
-    EPNL_slat = epnl_noise(PNLT_slat)
-    EPNL_flap = epnl_noise(PNLT_flap)
+    EPNL_total, EPNL_wing, EPNL_ht, EPNL_vt, EPNL_nose_landing_gear, EPNL_main_landing_gear, EPNL_slat, EPNL_flap = epnl_noise(PNLT_components)
     
     #Calculation of the SENEL total
     SENEL_total = senel_noise(SPLt_dBA_max)
@@ -343,7 +199,7 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
         fid.write('\n')
         fid.write('SENEL = ')
         fid.write(str('%2.2f' % SENEL_total)+'        ')       
-        fid.close 
+        fid.close()
         
         
     
@@ -369,6 +225,241 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
             fid.write(str('%3.2f' % (np.max(SPLt_dBA_history[nid][:])))+'  dB')
             fid.write('\n')
     
-        fid.close
+        fid.close()
     
     return (EPNL_total,SPL_total_history,SENEL_total)
+
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+def noise_airframe_Fink_source(config,noise_segment,analyses):
+    """This method computes the part of the Fink airframe noise that does not depend on the observer: the
+    geometry of the airframe and the flow conditions at every position of the aircraft, resampled every half
+    second.
+
+            Inputs:
+                config                         - SUAVE type vehicle, see noise_airframe_Fink
+                noise_segment                  - SUAVE type segment
+                analyses                       - with the atmosphere
+
+            Outputs:
+                source                         - Data with the airframe geometry in ft and the conditions at
+                                                 each position
+
+            Assumptions:
+                Correlation based."""
+
+    # ==============================================
+        # Unpack
+    # ==============================================
+    wing     = config.wings
+    flap     = wing.main_wing.control_surfaces.flap
+    
+    Sw       = wing.main_wing.areas.reference  / (Units.ft)**2              #wing area, sq.ft
+    bw       = wing.main_wing.spans.projected / Units.ft                    #wing span, ft
+    Sht      = wing.horizontal_stabilizer.areas.reference / (Units.ft)**2   #horizontal tail area, sq.ft
+    bht      = wing.horizontal_stabilizer.spans.projected / Units.ft        #horizontal tail span, ft
+    Svt      = wing.vertical_stabilizer.areas.reference / (Units.ft)**2     #vertical tail area, sq.ft
+    bvt      = wing.vertical_stabilizer.spans.projected  / Units.ft         #vertical tail span, ft
+    deltaf   = flap.deflection                                              #flap delection, rad
+    Sf       = flap.area  / (Units.ft)**2                                   #flap area, sq.ft        
+    cf       = flap.chord_dimensional  / Units.ft                           #flap chord, ft
+    Dp       = config.landing_gear.main_tire_diameter  / Units.ft           #MLG tyre diameter, ft
+    Hp       = config.landing_gear.nose_tire_diameter  / Units.ft           #MLG strut length, ft
+    Dn       = config.landing_gear.main_strut_length   / Units.ft           #NLG tyre diameter, ft
+    Hn       = config.landing_gear.nose_strut_length   / Units.ft           #NLG strut length, ft
+    gear     = config.landing_gear.gear_condition                           #Gear up or gear down
+    
+    nose_wheels    =   config.landing_gear.nose_wheels                           #Number of wheels   
+    main_wheels    =   config.landing_gear.main_wheels                           #Number of wheels   
+    main_units     =   config.landing_gear.main_units                            #Number of main units   
+    velocity       =   np.float(noise_segment.conditions.freestream.velocity[0,0]) #aircraft velocity 
+    altitude       =   noise_segment.conditions.freestream.altitude[:,0]           #aircraft altitude
+    time           =   noise_segment.conditions.frames.inertial.time[:,0]          #time discretization
+
+    noise_time = np.arange(0.,time[-1],.5)  
+    altitude = np.interp(noise_time,time,altitude)
+
+    # determining flap slot number
+    if wing.main_wing.control_surfaces.flap.configuration_type   == 'single_slotted':
+        slots = 1
+    elif wing.main_wing.control_surfaces.flap.configuration_type == 'double_slotted':
+        slots = 2
+    elif wing.main_wing.control_surfaces.flap.configuration_type == 'triple_slotted':
+        slots = 3  
+    
+    # ==============================================
+    #         Computing atmospheric conditions
+    # ==============================================
+    
+    atmo_data = analyses.atmosphere.compute_values(altitude)
+    
+    #unpack    
+    viscosity   =    atmo_data.dynamic_viscosity[:,0]*10.7639 #units converstion - m2 to ft2
+    temperature =    atmo_data.temperature[:,0]
+    
+    #Mach number
+    M = velocity/np.sqrt(1.4*287*temperature)
+
+    #Wing Turbulent Boundary Layer thickness, ft
+    deltaw = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity))**(-0.2)
+
+    #Pack the results
+    source = Data()
+    source.time        = noise_time
+    source.altitude    = altitude
+    source.velocity    = velocity
+    source.M           = M
+    source.viscosity   = viscosity
+    source.deltaw      = deltaw
+    source.Sw          = Sw
+    source.bw          = bw
+    source.Sht         = Sht
+    source.bht         = bht
+    source.Svt         = Svt
+    source.bvt         = bvt
+    source.deltaf      = deltaf
+    source.Sf          = Sf
+    source.cf          = cf
+    source.slots       = slots
+    source.Dp          = Dp
+    source.Hp          = Hp
+    source.Dn          = Dn
+    source.Hn          = Hn
+    source.gear        = gear
+    source.nose_wheels = nose_wheels
+    source.main_wheels = main_wheels
+    source.main_units  = main_units
+
+    return source
+
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+def noise_airframe_Fink_spectra(source,distance_vector,angle,phi):
+    """This method propagates the Fink airframe noise of noise_airframe_Fink_source to observers, all the
+    observers, positions and frequency bands at once.
+
+            Inputs:
+                source                         - Data of noise_airframe_Fink_source
+                distance_vector                - distance from the source location to observers [observers, positions]
+                angle                          - polar angle from the source to the observers [observers, positions]
+                phi                            - azimuthal angle from the source to the observers [observers, positions]
+
+            Outputs: One Third Octave Band SPL [dB], [observers, positions, bands]
+                wing                           - Sound Pressure Level of the clean wing
+                horizontal_tail                - Sound Pressure Level of the horizontal tail
+                vertical_tail                  - Sound Pressure Level of the vertical tail
+                flap                           - Sound Pressure Level of the flaps trailing edge
+                slat                           - Sound Pressure Level of the slat leading edge
+                main_landing_gear              - Sound Pressure Level og the main landing gear
+                nose_landing_gear              - Sound Pressure Level of the nose landing gear
+                total                          - Sound Pressure Level of the total airframe noise
+                dBA                            - A-weighted Sound Pressure Level of the total airframe noise
+
+            Assumptions:
+                Correlation based. The last position is left out, its levels are zero."""
+
+    #unpack
+    velocity    = source.velocity
+    M           = source.M
+    viscosity   = source.viscosity
+    deltaw      = source.deltaw
+    Sw          = source.Sw
+    bw          = source.bw
+    Sht         = source.Sht
+    bht         = source.bht
+    Svt         = source.Svt
+    bvt         = source.bvt
+    deltaf      = source.deltaf
+    Sf          = source.Sf
+    cf          = source.cf
+    slots       = source.slots
+    Dp          = source.Dp
+    Hp          = source.Hp
+    Dn          = source.Dn
+    Hn          = source.Hn
+    gear        = source.gear
+    nose_wheels = source.nose_wheels
+    main_wheels = source.main_wheels
+    main_units  = source.main_units
+
+    #Generate array with the One Third Octave Band Center Frequencies
+    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
+            2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
+    
+    #number of positions of the aircraft to calculate the noise
+    nobservers, nrange = np.shape(angle)
+    SPL_wing_history = np.zeros((nobservers,nrange,24))
+    SPLht_history    = np.zeros((nobservers,nrange,24))
+    SPLvt_history    = np.zeros((nobservers,nrange,24))
+    SPL_flap_history = np.zeros((nobservers,nrange,24))
+    SPL_slat_history = np.zeros((nobservers,nrange,24))
+    SPL_main_landing_gear_history = np.zeros((nobservers,nrange,24))
+    SPL_nose_landing_gear_history = np.zeros((nobservers,nrange,24))
+    SPL_total_history = np.zeros((nobservers,nrange,24))
+    
+    #Noise history in dBA
+    SPLt_dBA_history = np.zeros((nobservers,nrange,24))  
+    
+    #All the observers and positions of the aircraft are computed at once, each observer is a block of
+    #positions by frequency bands. The last position is left out of the histories
+    i = slice(0,nrange-1)
+    
+    #Emission angle theta   
+    theta = angle[:,i,None] 
+    #Distance from airplane to observer, evaluated at retarded time
+    distance = distance_vector[:,i,None]    
+    #Azimuthal angle
+    phi = phi[:,i,None]
+   
+     #Atmospheric attenuation
+    delta_atmo=atmospheric_attenuation(distance)
+
+    #Call each noise source model
+    SPL_wing = noise_clean_wing(Sw,bw,0,1,deltaw[i,None],velocity,viscosity[i,None],M[i,None],phi,theta,distance,frequency) - delta_atmo    #Wing Noise
+    SPLht    = noise_clean_wing(Sht,bht,0,1,deltaw[i,None],velocity,viscosity[i,None],M[i,None],phi,theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
+    SPLvt    = noise_clean_wing(Svt,bvt,0,0,deltaw[i,None],velocity,viscosity[i,None],M[i,None],phi,theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
+
+    SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,deltaw[i,None],viscosity[i,None],M[i,None],phi,theta,distance,frequency) -delta_atmo        #Slat leading edge
+
+    if (deltaf==0):
+        SPL_flap = np.zeros_like(SPL_wing)
+    else:
+        SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M[i,None],phi,theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
+
+    if gear=='up': #0
+        SPL_main_landing_gear = np.zeros_like(SPL_wing)
+        SPL_nose_landing_gear = np.zeros_like(SPL_wing)
+    else:
+        SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,M[i,None],velocity,phi,theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
+        SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,M[i,None],velocity,phi,theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
+    if main_units>1: #Incoherent summation of each main landing gear unit
+        SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
+
+
+     #Total Airframe Noise
+    SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
+         10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear))
+        
+    SPL_total_history[:,i] = SPL_total
+    SPL_wing_history[:,i]  = SPL_wing
+    SPLvt_history[:,i]     = SPLvt
+    SPLht_history[:,i]     = SPLht
+    SPL_flap_history[:,i]  = SPL_flap
+    SPL_slat_history[:,i]  = SPL_slat
+    SPL_nose_landing_gear_history[:,i] = SPL_nose_landing_gear
+    SPL_main_landing_gear_history[:,i] = SPL_main_landing_gear
+    
+    #Calculation of dBA based on the sound pressure time history
+    SPLt_dBA_history[:,i] = dbA_noise(SPL_total)
+
+    #Pack the results
+    spectra = Data()
+    spectra.wing              = SPL_wing_history
+    spectra.horizontal_tail   = SPLht_history
+    spectra.vertical_tail     = SPLvt_history
+    spectra.flap              = SPL_flap_history
+    spectra.slat              = SPL_slat_history
+    spectra.main_landing_gear = SPL_main_landing_gear_history
+    spectra.nose_landing_gear = SPL_nose_landing_gear_history
+    spectra.total             = SPL_total_history
+    spectra.dBA               = SPLt_dBA_history
+
+    return spectra
@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -45,7 +46,7 @@ def noise_clean_wing(S,b,ND,IsHorz,deltaw,velocity,viscosity,M,phi,theta,distanc
                 OASPL                            - Overall Sound Pressure Level of the clean wing [dB]
 
             Assumptions:
-                Correlation based."""
+                Correlation based. The frequency bands are the last axis, the aircraft positions can be given as columns."""
 
     #Unit conversion required for the method
     kt2fts = 1.6878098571
@@ -57,17 +58,16 @@ def noise_clean_wing(S,b,ND,IsHorz,deltaw,velocity,viscosity,M,phi,theta,distanc
     elif IsHorz==0:
         DIR = np.sin(phi)
 
+    fmax  = 0.1*(velocity/Units.ft)/(delta*(1-M*np.cos(theta)))
+    fmaxw = 0.1*(velocity/Units.ft)/deltaw
 
-    if DIR==0:
-        SPL = np.zeros(24)
-    else:
+    # no noise is radiated where the directivity is zero
+    radiated = DIR!=0
 
-        fmax  = 0.1*(velocity/Units.ft)/(delta*(1-M*np.cos(theta)))
-        fmaxw = 0.1*(velocity/Units.ft)/deltaw
+    OASPL = 50*np.log10((velocity/Units.kts)/100.0)+10*np.log10(delta*b/(distance**2.0))+8*ND+ \
+        20*np.log10(np.where(radiated,DIR,1.)*np.sin(theta)*np.cos(theta/2.0))+104.3
 
-        OASPL = 50*np.log10((velocity/Units.kts)/100.0)+10*np.log10(delta*b/(distance**2.0))+8*ND+ \
-            20*np.log10(DIR*np.sin(theta)*np.cos(theta/2.0))+104.3
-
-        SPL   = OASPL+10.0*np.log10(0.613*(frequency/fmax)**4*((frequency/fmax)**1.5+0.5)**(-4))-0.03*np.abs(((frequency/fmaxw)-1))**1.5
+    SPL   = OASPL+10.0*np.log10(0.613*(frequency/fmax)**4*((frequency/fmax)**1.5+0.5)**(-4))-0.03*np.abs(((frequency/fmaxw)-1))**1.5
+    SPL   = np.where(radiated,SPL,0.)
 
     return(SPL);
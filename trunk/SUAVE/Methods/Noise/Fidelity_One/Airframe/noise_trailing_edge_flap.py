@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -36,38 +37,29 @@ def noise_trailing_edge_flap (Sf,cf,deltaf,slots,velocity,M,phi,theta,distance,f
                 SPL                              - Sound Pressure Level of the flap trailing edge [dB]
 
             Assumptions:
-                Correlation based."""
+                Correlation based. The frequency bands are the last axis, the aircraft positions can be given as columns."""
 
     #Process
-    G      = np.zeros(24)
     kt2fts = 1.6878098571
 
     test   = frequency*cf/(velocity/Units.ft*(1-M*np.cos(theta)))
+    G      = np.zeros_like(test)
 
     if (slots==1 or slots==2):
-        for i in range (0,24):
-            if (test[i]<2):
-                G[i] = 99+10*np.log10(test[i])
-            elif (test[i]<20):
-                G[i] = 103.82-6*np.log10(test[i])
-            else:
-                G[i] = 135.04-30*np.log10(test[i])
+        G = np.select([test<2, test<20],
+                      [99+10*np.log10(test), 103.82-6*np.log10(test)],
+                      135.04-30*np.log10(test))
 
     elif slots==3:
-        for i in range(0,24):
-            if(test[i]<2):
-                G[i] = 99+10*np.log10(test[i])
-            elif (test[i]<75):
-                G[i] = 102.61-2*np.log10(test[i])
-            else:
-                G[i] = 158.11-30*np.log10(test[i])
+        G = np.select([test<2, test<75],
+                      [99+10*np.log10(test), 102.61-2*np.log10(test)],
+                      158.11-30*np.log10(test))
 
-    G = np.transpose(G)
-    
-    if theta+deltaf>=np.pi:
-        directivity = 0.0
-    else:     
-        directivity = 20.0*np.log10(np.sin(theta)* (np.cos(phi))**2 * np.sin(theta+deltaf))
+    # no directivity once the flap is turned past the observer
+    theta, phi  = np.broadcast_arrays(theta, phi)
+    directivity = np.zeros_like(theta,dtype=float)
+    forward     = theta+deltaf<np.pi
+    directivity[forward] = 20.0*np.log10(np.sin(theta[forward])* (np.cos(phi[forward]))**2 * np.sin(theta[forward]+deltaf))
 
     SPL = G+10*np.log10(Sf*(np.sin(deltaf))**2/(distance**2))+ \
         60*np.log10((velocity/Units.kts)/100.0)+directivity
@@ -2,4 +2,4 @@
 # Fidelity One level noise calculations for the engine
 # @ingroup Methods-Noise-Fidelity_One
 
-from .noise_SAE import noise_SAE
\ No newline at end of file
+from .noise_SAE import noise_SAE, noise_SAE_source, noise_SAE_spectra
\ No newline at end of file
@@ -4,13 +4,14 @@
 # Created:  May 2015, C. Ilario
 # Modified: Nov 2015, C. Ilario
 #           Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
 # ----------------------------------------------------------------------    
 
 import numpy as np
-from SUAVE.Core            import Units
+from SUAVE.Core            import Units, Data
 
 from .angle_of_attack_effect import angle_of_attack_effect
 from .external_plug_effect import external_plug_effect
@@ -83,39 +84,11 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
                     ."""
 
 
-    #unpack
-    
-    Velocity_primary_1      =       np.float(turbofan.core_nozzle.noise_speed * 0.92*(turbofan.design_thrust/52700.))   
-    Temperature_primary     =       noise_segment.conditions.propulsion.acoustic_outputs.core.exit_stagnation_temperature[:,0] 
-    Pressure_primary        =       noise_segment.conditions.propulsion.acoustic_outputs.core.exit_stagnation_pressure[:,0] 
-    
-    Velocity_secondary_1    =       np.float(turbofan.fan_nozzle.noise_speed * (turbofan.design_thrust/52700.)) 
-    Temperature_secondary   =       noise_segment.conditions.propulsion.acoustic_outputs.fan.exit_stagnation_temperature[:,0] 
-    Pressure_secondary      =       noise_segment.conditions.propulsion.acoustic_outputs.fan.exit_stagnation_pressure[:,0] 
-    
-    N1                      =       np.float(turbofan.fan.rotation * 0.92*(turbofan.design_thrust/52700.))
-    Diameter_primary        =       turbofan.core_nozzle_diameter
-    Diameter_secondary      =       turbofan.fan_nozzle_diameter
-    engine_height           =       turbofan.engine_height
-    EXA                     =       turbofan.exa
-    Plug_diameter           =       turbofan.plug_diameter 
-    Xe                      =       turbofan.geometry_xe
-    Ye                      =       turbofan.geometry_ye
-    Ce                      =       turbofan.geometry_Ce
+    #Jet flow and ambient conditions along the path, these do not depend on the microphone
+    source = noise_SAE_source(turbofan,noise_segment,analyses)
     
-    Velocity_aircraft       =       np.float(noise_segment.conditions.freestream.velocity[0,0]) 
-    Altitude                =       noise_segment.conditions.freestream.altitude[:,0] 
-    AOA                     =       np.mean(noise_segment.conditions.aerodynamics.angle_of_attack / Units.deg)
-    
-    time                    =       noise_segment.conditions.frames.inertial.time[:,0]  
-    
-    noise_time = np.arange(0.,time[-1],.5)
-    
-    Temperature_primary   = np.interp(noise_time,time,Temperature_primary)
-    Pressure_primary      = np.interp(noise_time,time,Pressure_primary)
-    Temperature_secondary = np.interp(noise_time,time,Temperature_secondary)
-    Pressure_secondary    = np.interp(noise_time,time,Pressure_secondary)
-    Altitude              = np.interp(noise_time,time,Altitude)
+    time       = noise_segment.conditions.frames.inertial.time[:,0]  
+    noise_time = source.time
     
     # Calls the function noise_geometric to calculate all the distance and emission angles
    # geometric = noise_counterplot(noise_segment,analyses,config) #noise_geometric(noise_segment,analyses,config)
@@ -131,86 +104,16 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
     
     nsteps = len(noise_time)        
     
-    #Preparing matrix for noise calculation
-    sound_ambient       = np.zeros(nsteps)
-    density_ambient     = np.zeros(nsteps)
-    viscosity           = np.zeros(nsteps)
-    temperature_ambient = np.zeros(nsteps)
-    pressure_amb        = np.zeros(nsteps)
-    Mach_aircraft       = np.zeros(nsteps)
-    
-    Velocity_primary = np.ones(nsteps)*Velocity_primary_1
-    Velocity_secondary = np.ones(nsteps)*Velocity_secondary_1
-
-    # ==============================================
-    # Computing atmospheric conditions
-    # ==============================================
-    
-    for id in range (0,nsteps):
-        atmo_data = analyses.atmosphere.compute_values(Altitude[id])        
-    
-        sound_ambient[id]       =   np.float(atmo_data.speed_of_sound)
-        density_ambient[id]     =   np.float(atmo_data.density)
-        viscosity[id]           =   np.float(atmo_data.dynamic_viscosity)
-        temperature_ambient[id] =   np.float(atmo_data.temperature)
-        pressure_amb[id]        =   np.float(atmo_data.pressure)
-    
-    #Base parameters necessary input for the noise code
-    pressure_isa = 101325 #[Pa]
-    R_gas        = 287.1  #[J/kg K]
-    gama_primary = 1.37   #Corretion for the primary jet
-    gama         = 1.4
-
-    #Calculation of nozzle areas
-    Area_primary   = np.pi*(Diameter_primary/2)**2 
-    Area_secondary =  np.pi*(Diameter_secondary/2)**2 
-
-    Xo=0 #Acoustic center of reference [m] - Used for wind tunnel acoustic data
-
-    #Flags for definition of near-fiel or wind-tunnel data
-    near_field = 0
-    tunnel     = 0
-
-    """Starting the main program"""
-
-    #Arrays for the calculation of atmospheric attenuation
-    Acq = np.array((0, 0, 0, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.9, 1.2, 1.5, 1.9, 2.5, 2.9, 3.6, 4.9, 6.8))
-    Acf = np.array((0, 0, 0, 0, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2, 0.3, 0.4, 0.5, 0.6, 0.8, 1.0, 1.3, 1.8, 2.5, 3.0, 4.2, 6.1, 9.0))
+    Velocity_primary   = source.Velocity_primary[:,0]
+    Velocity_secondary = source.Velocity_secondary[:,0]
+    Velocity_aircraft  = source.Velocity_aircraft
+    Mach_aircraft      = source.Mach_aircraft
+    Altitude           = source.altitude
 
     #Desired frequency range for noise evaluation
     frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
             2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
 
-
-#Defining each array before the main loop
-    B       = np.zeros(24)
-    theta_p = np.ones(24)*np.pi/2
-    theta_s = np.ones(24)*np.pi/2
-    theta_m = np.ones(24)*np.pi/2
-    EX_p    = np.zeros(24)
-    EX_s    = np.zeros(24)
-    EX_m    = np.zeros(24)
-    exc     = np.zeros(24)
-    SPL_p   = np.zeros(24)
-    SPL_s   = np.zeros(24)
-    SPL_m   = np.zeros(24)
-    PG_p    = np.zeros(24)
-    PG_s    = np.zeros(24)
-    PG_m    = np.zeros(24)
-    
-    dspl_attenuation_p = np.zeros(24)
-    dspl_attenuation_s = np.zeros(24)
-    dspl_attenuation_m = np.zeros(24)
-    
-    SPL_total_history     = np.zeros((nsteps,24))
-    SPL_primary_history   = np.zeros((nsteps,24))
-    SPL_secondary_history = np.zeros((nsteps,24))
-    SPL_mixed_history     = np.zeros((nsteps,24))
-    
-    #Noise history in dBA
-    SPLt_dBA_history = np.zeros((nsteps,24))  
-    SPLt_dBA_max = np.zeros(nsteps)     
-
     # Open output file to print the results
     if ioprint:
         if not filename:
@@ -218,214 +121,27 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
             
         fid      = open(filename,'w')
     
- #START LOOP FOR EACH POSITION OF AIRCRAFT   
-    for id in range(0,nsteps):
-
-        # Jet Flow Parameters
-    
-        #Primary and Secondary jets
-        Cpp = R_gas/(1-1/gama_primary)
-        Cp  = R_gas/(1-1/gama)
-        
-        density_primary   = Pressure_primary[id]/(R_gas*Temperature_primary[id]-(0.5*R_gas*Velocity_primary[id]**2/Cpp))
-        density_secondary = Pressure_secondary[id]/(R_gas*Temperature_secondary[id]-(0.5*R_gas*Velocity_secondary[id]**2/Cp))
-    
-        mass_flow_primary   = Area_primary*Velocity_primary[id]*density_primary
-        mass_flow_secondary = Area_secondary*Velocity_secondary[id]*density_secondary
-    
-        #Mach number of the external flow - based on the aircraft velocity
-        Mach_aircraft[id] = Velocity_aircraft/sound_ambient[id]
-    
-        #Calculation Procedure for the Mixed Jet Flow Parameters
-        Velocity_mixed = (mass_flow_primary*Velocity_primary[id]+mass_flow_secondary*Velocity_secondary[id])/ \
-                (mass_flow_primary+mass_flow_secondary)
-        Temperature_mixed =(mass_flow_primary*Temperature_primary[id]+mass_flow_secondary*Temperature_secondary[id])/ \
-                (mass_flow_primary+mass_flow_secondary)
-        density_mixed = pressure_amb[id]/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
-        Area_mixed = Area_primary*density_primary*Velocity_primary[id]*(1+(mass_flow_secondary/mass_flow_primary))/ \
-                (density_mixed*Velocity_mixed)
-        Diameter_mixed = (4*Area_mixed/np.pi)**0.5
-    
-        #**********************************************
-        # START OF THE NOISE PROCEDURE CALCULATIONS
-        #**********************************************
-    
-        XBPR = mass_flow_secondary/mass_flow_primary - 5.5
-        if XBPR<0:
-                XBPR=0
-        elif XBPR>4:
-                XBPR=4
-    
-        #Auxiliary parameter defined as DVPS
-        DVPS = np.abs((Velocity_primary[id] - (Velocity_secondary[id]*Area_secondary+Velocity_aircraft*Area_primary)/(Area_secondary+Area_primary)))
-        if DVPS<0.3:
-            DVPS=0.3
-    
-        # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
-        Str_p = frequency*Diameter_primary/(DVPS)  #Primary jet
-        Str_s = frequency*Diameter_mixed/(Velocity_secondary[id]-Velocity_aircraft) #Secondary jet
-        Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft) #Mixed jet
-    
-        #Calculation of the Excitation adjustment parameter
-        #Excitation Strouhal Number
-        excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
-        if (excitation_Strouhal > 0.25 and excitation_Strouhal < 0.5):
-            SX = 0.0
-        else:
-            SX = 50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5)
-    
-        #Effectiveness
-        exps = np.exp(-SX)
-    
-        #Spectral Shape Factor
-        exs = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
-    
-        #Fan Duct Lenght Factor
-        exd = np.exp(0.6-(EXA)**0.5)
-    
-        #Excitation source location factor (zk)
-        zk = 1-0.4*(exd)*(exps)    
-
-        #Main loop for the desired polar angles
-
-        theta = angles[id]
-    
-      #Call function noise source location for the calculation of theta
-        thetaj = noise_source_location(B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone[id],Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary[id],Velocity_secondary[id],Velocity_mixed,Velocity_aircraft,sound_ambient[id],Str_m,Str_s)
-    
-      # Loop for the frequency array range
-        for i in range(0,24):
-               #Calculation of the Directivity Factor
-                if (theta_m[i] <=1.4):
-                    exc[i] = sound_ambient[id]/Velocity_mixed
-                elif (theta_m[i]>1.4):
-                    exc[i] =(sound_ambient[id]/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m[i]-1.4))
-    
-                #Acoustic excitation adjustment (EX)
-                EX_m[i] = exd*exs[i]*exc[i]   #mixed component - dependant of the frequency
-        
-        EX_p = +5*exd*exps   #primary component - no frequency dependance
-        EX_s = 2*sound_ambient[id]/(Velocity_secondary[id]*(zk)) #secondary component - no frequency dependance    
-    
-        distance_primary   = distance_microphone[id] 
-        distance_secondary = distance_microphone[id] 
-        distance_mixed     = distance_microphone[id]
-    
-        #Noise attenuation due to Ambient Pressure
-        dspl_ambient_pressure = 20*np.log10(pressure_amb[id]/pressure_isa)
-    
-        #Noise attenuation due to Density Gradientes
-        dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient[id]))
-        dspl_density_s = 20*np.log10((density_secondary+density_ambient[id])/(2*density_ambient[id]))
-        dspl_density_m = 20*np.log10((density_mixed+density_ambient[id])/(2*density_ambient[id]))
+    #Sound pressure level of each jet component at the microphone
+    spectra = noise_SAE_spectra(source,distance_microphone[None,:],angles[None,:])
     
-        #Noise attenuation due to Spherical divergence
-        dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
-        dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
-        dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed)
+ #Store the SPL history     
+    SPL_total_history     = spectra.total[0]
+    SPL_primary_history   = spectra.primary[0]
+    SPL_secondary_history = spectra.secondary[0]
+    SPL_mixed_history     = spectra.mixed[0]
     
-       #Noise attenuation due to Geometric Near-Field
-        if near_field ==0:
-                dspl_geometric_p = 0.0
-                dspl_geometric_s = 0.0
-                dspl_geometric_m = 0.0
-        elif near_field ==1:
-                dspl_geometric_p = -10*np.log10(1+(2*Diameter_primary+(Diameter_primary*sound_ambient[id]/frequency))/distance_primary)
-                dspl_geometric_s = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient[id]/frequency))/distance_secondary)
-                dspl_geometric_m = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient[id]/frequency))/distance_mixed)
+    #Calculation of dBA based on the sound pressure time history
+    SPLt_dBA_history = spectra.dBA[0]
+    SPLt_dBA_max     = np.max(SPLt_dBA_history,axis=1)
+ 
+    #Calculation of the Perceived Noise Level with the tone corrections for the total and each component at once
+    SPL_components = np.array([SPL_total_history,SPL_primary_history,SPL_secondary_history,SPL_mixed_history])
+    PNLT_components = pnl_noise(SPL_components)+noise_tone_correction(SPL_components)
     
-       #Noise attenuation due to Acoustic Near-Field
-        if near_field ==0:
-                dspl_acoustic_p = 0.0;
-                dspl_acoustic_s = 0.0;
-                dspl_acoustic_m = 0.0;
-        elif near_field ==1:
-                dspl_acoustic_p = 10*np.log10(1+0.13*(sound_ambient[id]/(distance_primary*frequency))**2)
-                dspl_acoustic_s = 10*np.log10(1+0.13*(sound_ambient[id]/(distance_secondary*frequency))**2)
-                dspl_acoustic_m = 10*np.log10(1+0.13*(sound_ambient[id]/(distance_mixed*frequency))**2)
-    
-        #Atmospheric attenuation coefficient
-        if tunnel==0:
-                f_primary   = frequency/(1-Mach_aircraft[id]*np.cos(theta_p))
-                f_secondary = frequency/(1-Mach_aircraft[id]*np.cos(theta_s))
-                f_mixed     = frequency/(1-Mach_aircraft[id]*np.cos(theta_m))
-                Aci         = Acf + ((temperature_ambient[id]-0)-15)/10*(Acq-Acf)    
-                
-                Ac_primary   = np.interp(f_primary,frequency,Aci)
-                Ac_secondary = np.interp(f_secondary,frequency,Aci)
-                Ac_mixed     = np.interp(f_mixed,frequency,Aci)
-                
-                 #Atmospheric attenuation
-                delta_atmo = atmospheric_attenuation(distance_primary)
-                
-                dspl_attenuation_p = -delta_atmo 
-                dspl_attenuation_s = -delta_atmo 
-                dspl_attenuation_m = -delta_atmo 
-    
-        elif tunnel==1: #These corrections are not applicable for jet rigs or static conditions
-                dspl_attenuation_p = np.zeros(24)
-                dspl_attenuation_s = np.zeros(24)
-                dspl_attenuation_m = np.zeros(24)
-                EX_m = np.zeros(24)
-                EX_p = 0
-                EX_s = 0
-    
-       #Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
-        DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_geometric_p+dspl_acoustic_p+dspl_attenuation_p+dspl_spherical_p
-        DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_geometric_s+dspl_acoustic_s+dspl_attenuation_s+dspl_spherical_s
-        DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_geometric_m+dspl_acoustic_m+dspl_attenuation_m+dspl_spherical_m
-    
-    
-      #Calculation of interference effects on jet noise
-        ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft[id],theta_m)
-        INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
-        Plug    = external_plug_effect(Velocity_primary[id],Velocity_secondary[id], Velocity_mixed, Diameter_primary,Diameter_secondary,Diameter_mixed, Plug_diameter, sound_ambient[id], theta_p,theta_s,theta_m)
-        GPROX_m = ground_proximity_effect(Velocity_mixed,sound_ambient[id],theta_m,engine_height,Diameter_mixed,frequency)
-    
-      #Calculation of the sound pressure level for each jet component
-        SPL_p = primary_noise_component(SPL_p,Velocity_primary[id],Temperature_primary[id],R_gas,theta_p,DVPS,sound_ambient[id],Velocity_secondary[id],Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug[0]
-        
-        SPL_s = secondary_noise_component(SPL_s,Velocity_primary[id],theta_s,sound_ambient[id],Velocity_secondary[id],Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug[1] + INST_s
-        
-        SPL_m = mixed_noise_component(SPL_m,Velocity_primary[id],theta_m,sound_ambient[id],Velocity_secondary[id],Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + Plug[2] + ATK_m + GPROX_m
-    
-     #Sum of the Total Noise
-        SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
-        
-     #Store the SPL history     
-        SPL_total_history[id][:]     = SPL_total[:]
-        SPL_primary_history[id][:]   = SPL_p[:]
-        SPL_secondary_history[id][:] = SPL_s[:]
-        SPL_mixed_history[id][:]     = SPL_m[:]
-        
-        #Calculation of dBA based on the sound pressure time history
-        SPLt_dBA = dbA_noise(SPL_total)
-        SPLt_dBA_history[i][:] = SPLt_dBA[:]
-        SPLt_dBA_max[i] = max(SPLt_dBA)          
-     
-    #Calculation of the Perceived Noise Level EPNL based on the sound time history
-    PNL_total               =  pnl_noise(SPL_total_history)    
-    PNL_primary             =  pnl_noise(SPL_primary_history)  
-    PNL_secondary           =  pnl_noise(SPL_secondary_history)  
-    PNL_mixed               =  pnl_noise(SPL_mixed_history)  
-    
-   #Calculation of the tones corrections on the SPL for each component and total
-    tone_correction_total     = noise_tone_correction(SPL_total_history) 
-    tone_correction_primary   = noise_tone_correction(SPL_primary_history) 
-    tone_correction_secondary = noise_tone_correction(SPL_secondary_history) 
-    tone_correction_mixed     = noise_tone_correction(SPL_mixed_history) 
-    
-    #Calculation of the PLNT for each component and total
-    PNLT_total     = PNL_total+tone_correction_total
-    PNLT_primary   = PNL_primary+tone_correction_primary
-    PNLT_secondary = PNL_secondary+tone_correction_secondary
-    PNLT_mixed     = PNL_mixed+tone_correction_mixed
+    PNLT_total, PNLT_primary, PNLT_secondary, PNLT_mixed = PNLT_components
     
     #Calculation of the EPNL for each component and total
-    EPNL_total     = epnl_noise(PNLT_total)
-    EPNL_primary   = epnl_noise(PNLT_primary)
-    EPNL_secondary = epnl_noise(PNLT_secondary)
-    EPNL_mixed     = epnl_noise(PNLT_mixed)
+    EPNL_total, EPNL_primary, EPNL_secondary, EPNL_mixed = epnl_noise(PNLT_components)
 
     #Calculation of the SENEL total
     SENEL_total = senel_noise(SPLt_dBA_max)
@@ -451,7 +167,7 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
         for id in range (0,nsteps):
             fid.write(str('%2.2f' % time[id])+'        ')
             fid.write(str('%2.2f' % Altitude[id])+'        ')
-            fid.write(str('%2.2f' % Mach_aircraft[id])+'        ')
+            fid.write(str('%2.2f' % Mach_aircraft[id,0])+'        ')
             fid.write(str('%3.3f' % Velocity_primary[id])+'        ')
             fid.write(str('%3.3f' % Velocity_secondary[id])+'        ')
             fid.write(str('%2.2f' % (angles[id]*180/np.pi))+'        ')
@@ -501,6 +217,369 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
                     fid.write(str('%3.2f' % SPL_total_history[id][ijd]) + '       ')
                     fid.write('\n')
               
-        fid.close
+        fid.close()
     
-    return(EPNL_total,SPL_total_history,SENEL_total)
\ No newline at end of file
+    return(EPNL_total,SPL_total_history,SENEL_total)
+
+## @ingroupMethods-Noise-Fidelity_One-Engine
+def noise_SAE_source(turbofan,noise_segment,analyses):
+    """This method computes the part of the SAE jet noise that does not depend on the observer: the jet flow
+    parameters, the ambient conditions and the spectral factors at every position of the aircraft, resampled
+    every half second.
+
+        Inputs:
+                    turbofan                   - SUAVE type turbofan, see noise_SAE
+                    noise_segment              - SUAVE type segment with the acoustic outputs of the engine
+                    analyses                   - with the atmosphere
+
+                Outputs:
+                    source                     - Data with the conditions at each position as columns and
+                                                 the frequency dependent factors as [positions, bands]
+
+                Assumptions:
+                    ."""
+
+    #unpack
+    
+    Velocity_primary_1      =       np.float(turbofan.core_nozzle.noise_speed * 0.92*(turbofan.design_thrust/52700.))   
+    Temperature_primary     =       noise_segment.conditions.propulsion.acoustic_outputs.core.exit_stagnation_temperature[:,0] 
+    Pressure_primary        =       noise_segment.conditions.propulsion.acoustic_outputs.core.exit_stagnation_pressure[:,0] 
+    
+    Velocity_secondary_1    =       np.float(turbofan.fan_nozzle.noise_speed * (turbofan.design_thrust/52700.)) 
+    Temperature_secondary   =       noise_segment.conditions.propulsion.acoustic_outputs.fan.exit_stagnation_temperature[:,0] 
+    Pressure_secondary      =       noise_segment.conditions.propulsion.acoustic_outputs.fan.exit_stagnation_pressure[:,0] 
+    
+    N1                      =       np.float(turbofan.fan.rotation * 0.92*(turbofan.design_thrust/52700.))
+    Diameter_primary        =       turbofan.core_nozzle_diameter
+    Diameter_secondary      =       turbofan.fan_nozzle_diameter
+    EXA                     =       turbofan.exa
+    
+    Velocity_aircraft       =       np.float(noise_segment.conditions.freestream.velocity[0,0]) 
+    Altitude                =       noise_segment.conditions.freestream.altitude[:,0] 
+    AOA                     =       np.mean(noise_segment.conditions.aerodynamics.angle_of_attack / Units.deg)
+    
+    time                    =       noise_segment.conditions.frames.inertial.time[:,0]  
+    
+    noise_time = np.arange(0.,time[-1],.5)
+    
+    Temperature_primary   = np.interp(noise_time,time,Temperature_primary)
+    Pressure_primary      = np.interp(noise_time,time,Pressure_primary)
+    Temperature_secondary = np.interp(noise_time,time,Temperature_secondary)
+    Pressure_secondary    = np.interp(noise_time,time,Pressure_secondary)
+    Altitude              = np.interp(noise_time,time,Altitude)
+    
+    nsteps = len(noise_time)        
+    
+    Velocity_primary   = np.ones(nsteps)*Velocity_primary_1
+    Velocity_secondary = np.ones(nsteps)*Velocity_secondary_1
+
+    # ==============================================
+    # Computing atmospheric conditions
+    # ==============================================
+    
+    atmo_data = analyses.atmosphere.compute_values(Altitude)
+
+    sound_ambient       = atmo_data.speed_of_sound
+    density_ambient     = atmo_data.density
+    pressure_amb        = atmo_data.pressure
+    
+    #Base parameters necessary input for the noise code
+    R_gas        = 287.1  #[J/kg K]
+    gama_primary = 1.37   #Corretion for the primary jet
+    gama         = 1.4
+
+    #Calculation of nozzle areas
+    Area_primary   = np.pi*(Diameter_primary/2)**2 
+    Area_secondary =  np.pi*(Diameter_secondary/2)**2 
+
+    #Desired frequency range for noise evaluation
+    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
+            2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
+
+    # All the aircraft positions are computed at once, each row is a position and each column a frequency band
+    Vp = Velocity_primary[:,None]
+    Vs = Velocity_secondary[:,None]
+    Tp = Temperature_primary[:,None]
+    Ts = Temperature_secondary[:,None]
+
+    # Jet Flow Parameters
+
+    #Primary and Secondary jets
+    Cpp = R_gas/(1-1/gama_primary)
+    Cp  = R_gas/(1-1/gama)
+    
+    density_primary   = Pressure_primary[:,None]/(R_gas*Tp-(0.5*R_gas*Vp**2/Cpp))
+    density_secondary = Pressure_secondary[:,None]/(R_gas*Ts-(0.5*R_gas*Vs**2/Cp))
+
+    mass_flow_primary   = Area_primary*Vp*density_primary
+    mass_flow_secondary = Area_secondary*Vs*density_secondary
+
+    #Mach number of the external flow - based on the aircraft velocity
+    Mach_aircraft = Velocity_aircraft/sound_ambient
+
+    #Calculation Procedure for the Mixed Jet Flow Parameters
+    Velocity_mixed = (mass_flow_primary*Vp+mass_flow_secondary*Vs)/ \
+            (mass_flow_primary+mass_flow_secondary)
+    Temperature_mixed =(mass_flow_primary*Tp+mass_flow_secondary*Ts)/ \
+            (mass_flow_primary+mass_flow_secondary)
+    density_mixed = pressure_amb/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
+    Area_mixed = Area_primary*density_primary*Vp*(1+(mass_flow_secondary/mass_flow_primary))/ \
+            (density_mixed*Velocity_mixed)
+    Diameter_mixed = (4*Area_mixed/np.pi)**0.5
+
+    #**********************************************
+    # START OF THE NOISE PROCEDURE CALCULATIONS
+    #**********************************************
+
+    XBPR = np.clip(mass_flow_secondary/mass_flow_primary - 5.5,0,4)
+
+    #Auxiliary parameter defined as DVPS
+    DVPS = np.maximum(np.abs((Vp - (Vs*Area_secondary+Velocity_aircraft*Area_primary)/(Area_secondary+Area_primary))),0.3)
+
+    # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
+    Str_p = frequency*Diameter_primary/(DVPS)  #Primary jet
+    Str_s = frequency*Diameter_mixed/(Vs-Velocity_aircraft) #Secondary jet
+    Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft) #Mixed jet
+
+    #Calculation of the Excitation adjustment parameter
+    #Excitation Strouhal Number
+    excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
+    SX = np.where((excitation_Strouhal > 0.25) & (excitation_Strouhal < 0.5), 0.0, \
+                  50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5))
+
+    #Effectiveness
+    exps = np.exp(-SX)
+
+    #Spectral Shape Factor
+    exs = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
+
+    #Fan Duct Lenght Factor
+    exd = np.exp(0.6-(EXA)**0.5)
+
+    #Excitation source location factor (zk)
+    zk = 1-0.4*(exd)*(exps)    
+
+    #Pack the results
+    source = Data()
+    source.time                = noise_time
+    source.altitude            = Altitude
+    source.Velocity_aircraft   = Velocity_aircraft
+    source.AOA                 = AOA
+    source.Mach_aircraft       = Mach_aircraft
+    source.sound_ambient       = sound_ambient
+    source.density_ambient     = density_ambient
+    source.pressure_amb        = pressure_amb
+    source.R_gas               = R_gas
+    source.Velocity_primary    = Vp
+    source.Velocity_secondary  = Vs
+    source.Temperature_primary = Tp
+    source.Diameter_primary    = Diameter_primary
+    source.Diameter_secondary  = Diameter_secondary
+    source.Area_primary        = Area_primary
+    source.Area_secondary      = Area_secondary
+    source.density_primary     = density_primary
+    source.density_secondary   = density_secondary
+    source.density_mixed       = density_mixed
+    source.Velocity_mixed      = Velocity_mixed
+    source.Diameter_mixed      = Diameter_mixed
+    source.XBPR                = XBPR
+    source.DVPS                = DVPS
+    source.Str_p               = Str_p
+    source.Str_s               = Str_s
+    source.Str_m               = Str_m
+    source.exps                = exps
+    source.exs                 = exs
+    source.exd                 = exd
+    source.zk                  = zk
+    source.engine_height       = turbofan.engine_height
+    source.Plug_diameter       = turbofan.plug_diameter
+    source.Xe                  = turbofan.geometry_xe
+    source.Ye                  = turbofan.geometry_ye
+    source.Ce                  = turbofan.geometry_Ce
+
+    return source
+
+## @ingroupMethods-Noise-Fidelity_One-Engine
+def noise_SAE_spectra(source,distance_microphone,angles):
+    """This method propagates the SAE jet noise of noise_SAE_source to observers, all the observers, positions
+    and frequency bands at once.
+
+        Inputs:
+                    source                     - Data of noise_SAE_source
+                    distance_microphone        - Distance from the nozzle exhaust to the microphones [observers, positions]
+                    angles                     - Polar angle from the aircraft to the microphones [observers, positions]
+
+                Outputs: One Third Octave Band SPL [dB], [observers, positions, bands]
+                    primary                    - Sound Pressure Level of the primary jet
+                    secondary                  - Sound Pressure Level of the secondary jet
+                    mixed                      - Sound Pressure Level of the mixed jet
+                    total                      - Sound Pressure Level of the total jet noise
+                    dBA                        - A-weighted Sound Pressure Level of the total jet noise
+
+                Assumptions:
+                    The source location of each position is iterated from the one of the position before, for
+                    every observer at once."""
+
+    #unpack
+    Velocity_aircraft  = source.Velocity_aircraft
+    AOA                = source.AOA
+    Mach_aircraft      = source.Mach_aircraft
+    sound_ambient      = source.sound_ambient
+    density_ambient    = source.density_ambient
+    pressure_amb       = source.pressure_amb
+    R_gas              = source.R_gas
+    Vp                 = source.Velocity_primary
+    Vs                 = source.Velocity_secondary
+    Tp                 = source.Temperature_primary
+    Diameter_primary   = source.Diameter_primary
+    Diameter_secondary = source.Diameter_secondary
+    Area_primary       = source.Area_primary
+    Area_secondary     = source.Area_secondary
+    density_primary    = source.density_primary
+    density_secondary  = source.density_secondary
+    density_mixed      = source.density_mixed
+    Velocity_mixed     = source.Velocity_mixed
+    Diameter_mixed     = source.Diameter_mixed
+    XBPR               = source.XBPR
+    DVPS               = source.DVPS
+    Str_p              = source.Str_p
+    Str_s              = source.Str_s
+    Str_m              = source.Str_m
+    exps               = source.exps
+    exs                = source.exs
+    exd                = source.exd
+    zk                 = source.zk
+    engine_height      = source.engine_height
+    Plug_diameter      = source.Plug_diameter
+    Xe                 = source.Xe
+    Ye                 = source.Ye
+    Ce                 = source.Ce
+    
+    nobservers, nsteps = np.shape(distance_microphone)
+
+    pressure_isa = 101325 #[Pa]
+
+    Xo=0 #Acoustic center of reference [m] - Used for wind tunnel acoustic data
+
+    #Flags for definition of near-fiel or wind-tunnel data
+    near_field = 0
+    tunnel     = 0
+
+    #Desired frequency range for noise evaluation
+    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
+            2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
+
+    # Each observer is a block of positions by frequency bands
+    distance = distance_microphone[:,:,None]
+
+    #Call function noise source location for the calculation of theta. The iteration of each position
+    #starts from the angles of the position before, so the positions are found one after the other
+    B       = np.zeros((nobservers,24))
+    theta_p = np.ones((nobservers,nsteps,24))*np.pi/2
+    theta_s = np.ones((nobservers,nsteps,24))*np.pi/2
+    theta_m = np.ones((nobservers,nsteps,24))*np.pi/2
+    
+    for id in range(0,nsteps):
+        if id > 0:
+            theta_p[:,id] = theta_p[:,id-1]
+            theta_s[:,id] = theta_s[:,id-1]
+            theta_m[:,id] = theta_m[:,id-1]
+        noise_source_location(B,Xo,zk[id,0],Diameter_primary,theta_p[:,id],Area_primary,Area_secondary,distance[:,id],Diameter_secondary,angles[:,id,None],theta_s[:,id],theta_m[:,id],Diameter_mixed[id,0],Vp[id,0],Vs[id,0],Velocity_mixed[id,0],Velocity_aircraft,sound_ambient[id,0],Str_m[id],Str_s[id])
+
+    #Calculation of the Directivity Factor
+    exc = np.where(theta_m <= 1.4, sound_ambient/Velocity_mixed, (sound_ambient/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m-1.4)))
+
+    #Acoustic excitation adjustment (EX)
+    EX_m = exd*exs*exc   #mixed component - dependant of the frequency
+    EX_p = +5*exd*exps   #primary component - no frequency dependance
+    EX_s = 2*sound_ambient/(Vs*(zk)) #secondary component - no frequency dependance    
+
+    distance_primary   = distance 
+    distance_secondary = distance 
+    distance_mixed     = distance
+
+    #Noise attenuation due to Ambient Pressure
+    dspl_ambient_pressure = 20*np.log10(pressure_amb/pressure_isa)
+
+    #Noise attenuation due to Density Gradientes
+    dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient))
+    dspl_density_s = 20*np.log10((density_secondary+density_ambient)/(2*density_ambient))
+    dspl_density_m = 20*np.log10((density_mixed+density_ambient)/(2*density_ambient))
+
+    #Noise attenuation due to Spherical divergence
+    dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
+    dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
+    dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed)
+
+   #Noise attenuation due to Geometric Near-Field
+    if near_field ==0:
+            dspl_geometric_p = 0.0
+            dspl_geometric_s = 0.0
+            dspl_geometric_m = 0.0
+    elif near_field ==1:
+            dspl_geometric_p = -10*np.log10(1+(2*Diameter_primary+(Diameter_primary*sound_ambient/frequency))/distance_primary)
+            dspl_geometric_s = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient/frequency))/distance_secondary)
+            dspl_geometric_m = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient/frequency))/distance_mixed)
+
+   #Noise attenuation due to Acoustic Near-Field
+    if near_field ==0:
+            dspl_acoustic_p = 0.0;
+            dspl_acoustic_s = 0.0;
+            dspl_acoustic_m = 0.0;
+    elif near_field ==1:
+            dspl_acoustic_p = 10*np.log10(1+0.13*(sound_ambient/(distance_primary*frequency))**2)
+            dspl_acoustic_s = 10*np.log10(1+0.13*(sound_ambient/(distance_secondary*frequency))**2)
+            dspl_acoustic_m = 10*np.log10(1+0.13*(sound_ambient/(distance_mixed*frequency))**2)
+
+    #Atmospheric attenuation coefficient
+    if tunnel==0:
+             #Atmospheric attenuation
+            delta_atmo = atmospheric_attenuation(distance_primary)
+            
+            dspl_attenuation_p = -delta_atmo 
+            dspl_attenuation_s = -delta_atmo 
+            dspl_attenuation_m = -delta_atmo 
+
+    elif tunnel==1: #These corrections are not applicable for jet rigs or static conditions
+            dspl_attenuation_p = np.zeros((nobservers,nsteps,24))
+            dspl_attenuation_s = np.zeros((nobservers,nsteps,24))
+            dspl_attenuation_m = np.zeros((nobservers,nsteps,24))
+            EX_m = np.zeros((nobservers,nsteps,24))
+            EX_p = 0
+            EX_s = 0
+
+   #Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
+    DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_geometric_p+dspl_acoustic_p+dspl_attenuation_p+dspl_spherical_p
+    DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_geometric_s+dspl_acoustic_s+dspl_attenuation_s+dspl_spherical_s
+    DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_geometric_m+dspl_acoustic_m+dspl_attenuation_m+dspl_spherical_m
+
+
+  #Calculation of interference effects on jet noise
+    ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft,theta_m)
+    INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
+    Plug    = external_plug_effect(Vp,Vs, Velocity_mixed, Diameter_primary,Diameter_secondary,Diameter_mixed, Plug_diameter, sound_ambient, theta_p,theta_s,theta_m)
+    GPROX_m = ground_proximity_effect(Velocity_mixed,sound_ambient,theta_m,engine_height,Diameter_mixed,frequency)
+
+  #Calculation of the sound pressure level for each jet component
+    # the primary jet model leaves out the last band, which keeps the plug effect summed over the positions
+    SPL_p          = np.zeros((nobservers,nsteps,24))
+    SPL_p[:,1:,23] = np.cumsum(Plug[0][:,:-1,23],axis=1)
+    
+    SPL_p = primary_noise_component(SPL_p,Vp,Tp,R_gas,theta_p,DVPS,sound_ambient,Vs,Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug[0]
+    
+    SPL_s = secondary_noise_component(None,Vp,theta_s,sound_ambient,Vs,Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug[1] + INST_s
+    
+    SPL_m = mixed_noise_component(None,Vp,theta_m,sound_ambient,Vs,Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + Plug[2] + ATK_m + GPROX_m
+
+ #Sum of the Total Noise
+    SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
+    
+    #Pack the results
+    spectra = Data()
+    spectra.primary   = SPL_p
+    spectra.secondary = SPL_s
+    spectra.mixed     = SPL_m
+    spectra.total     = SPL_total
+    spectra.dBA       = dbA_noise(SPL_total)
+
+    return spectra
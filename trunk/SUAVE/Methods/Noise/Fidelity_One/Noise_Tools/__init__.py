@@ -11,3 +11,7 @@ from .noise_geometric import noise_geometric
 from .noise_certification_limits import noise_certification_limits
 from .noise_counterplot import noise_counterplot
 from .senel_noise import senel_noise
+
+from .noise_footprint_geometric import noise_footprint_geometric
+from .noise_duration_sum import noise_duration_sum
+from .noise_metrics_accumulator import Noise_Metrics_Accumulator
\ No newline at end of file
@@ -0,0 +1,53 @@
+## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
+# noise_duration_sum.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Noise Duration Sum
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
+def noise_duration_sum(levels):
+    """This method calculates the sum of the noise energy of a time history over the time where the level is
+     higher than the maximum - 10 dB, the integral of the EPNL and the SENEL.
+
+        Inputs:
+                    levels                   - Noise level time history, the time on the last axis
+
+                Outputs:
+                    level_max                - Maximum level of each time history
+                    sumation                 - Sum of 10**(level/10) over the points within 10 dB of the maximum
+
+        Assumptions:
+                    The duration starts one point before the first point higher than the maximum - 10 dB, which is the
+                    last point when the history starts higher. It ends at the last point of that stretch, or at the
+                    point before last when the history ends higher."""
+
+    levels = np.asarray(levels)
+    nsteps = np.shape(levels)[-1]
+    steps  = np.arange(nsteps)
+
+    #Maximum level on the time history data
+    level_max = np.max(levels,axis=-1)
+    threshold = level_max[...,None]-10
+
+    #Finding the time duration for the noise history where the level is higher than the maximum - 10 dB
+    t1    = np.argmax(levels>threshold,axis=-1) #t1 is the first time interval
+    below = (levels<threshold) & (steps>t1[...,None])
+
+    #Correction for the maximum - 10 dB when it falls outside the limit of the data
+    t2 = np.where(levels[...,-1]>=threshold[...,0],nsteps-2,np.argmax(below,axis=-1)-1) #t2 is the last time interval
+
+    #Calculates the integral of the levels between t1 and t2 points, in the order of the points
+    first    = np.where(t1==0,10**(levels[...,-1]/10),0.)
+    energy   = np.where((steps>=t1[...,None]-1) & (steps<=t2[...,None]),10**(levels/10),0.)
+    sumation = np.cumsum(np.concatenate((first[...,None],energy),axis=-1),axis=-1)[...,-1]
+
+    return (level_max,sumation)
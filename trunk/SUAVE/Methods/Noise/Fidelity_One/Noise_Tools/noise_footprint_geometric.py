@@ -0,0 +1,55 @@
+## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
+# noise_footprint_geometric.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Noise Footprint Geometric
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
+def noise_footprint_geometric(noise_segment,observers):
+    """ SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.noise_footprint_geometric(noise_segment,observers):
+            Computes the geometric parameters of noise_counterplot for many microphones at once:
+            distance and emission angles for both polar and azimuthal angles.
+
+            Inputs:
+                noise_segment	 - SUAVE type segment
+                observers       - Microphone coordinates as rows of x, height, lateral position, [meters]
+
+            Outputs: [observers, time steps]
+                dist            - Distance vector from the aircraft position in relation to the microphone coordinates, [meters]
+                theta           - Polar angle emission vector relatively to the aircraft to the microphone coordinates, [rad]
+                phi             - Azimuthal angle emission vector relatively to the aircraft to the microphone coordinates, [rad]
+
+            Assumptions:
+                Same as noise_counterplot."""
+
+    #unpack
+    position_vector = noise_segment.conditions.frames.inertial.position_vector
+    observers       = np.atleast_2d(observers)
+
+    #X,Y,Z position of the aircraft, each time step is a column
+    x_aircraft = position_vector[None,:,0]
+    altitude   = - position_vector[None,:,2]
+    z_aircraft = position_vector[None,:,1]
+
+    #X,Y,Z position of each microphone, each microphone is a row
+    x_mic = observers[:,0,None]
+    y_mic = observers[:,1,None]
+    z_mic = observers[:,2,None]
+
+    dist = np.sqrt((x_aircraft-x_mic)**2+(altitude-y_mic)**2+(z_aircraft-z_mic)**2)
+    phi  = np.arctan(np.abs(z_mic)/altitude)
+
+    # the polar angle is measured from the front of the aircraft
+    with np.errstate(divide='ignore'):
+        theta = np.arctan(np.abs(altitude/(x_aircraft-x_mic)))
+    theta = np.where((x_aircraft-x_mic) < 0., theta, np.pi - theta)
+
+    return (dist,theta,phi)
@@ -0,0 +1,176 @@
+## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
+# noise_metrics_accumulator.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+from .pnl_noise             import pnl_noise
+from .noise_tone_correction import noise_tone_correction
+from .dbA_noise             import dbA_noise
+from .noise_duration_sum    import noise_duration_sum
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Noise Metrics Accumulator
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
+class Noise_Metrics_Accumulator(Data):
+    """Computes the EPNL and the SENEL of time histories of SPL spectra given a chunk of time steps at a time,
+    so the spectra of a whole history do not have to be kept.
+
+    Each chunk is reduced to its PNLT and maximum dBA as it comes. Only the levels from the point before the
+    first one within 10 dB of the running maximum are kept, the points before can not be in the duration of
+    epnl_noise and senel_noise whatever comes next.
+
+    Assumptions:
+    The time steps are half a second apart, as in epnl_noise and senel_noise.
+
+    Source:
+    N/A
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+        """
+        self.number_of_steps = 0
+        self.PNLT            = Data()
+        self.dBA             = Data()
+        for metric in [self.PNLT,self.dBA]:
+            metric.history = None    # levels that can still be in the duration, [histories, steps]
+            metric.maximum = None    # running maximum, [histories]
+            metric.nonzero = None    # whether any level was not zero, [histories]
+
+    def append(self,SPL,SPL_dBA=None):
+        """Adds the next time steps of the histories.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        SPL        - Sound Pressure Level in 1/3 octave band, [histories, steps, bands] or [steps, bands]
+        SPL_dBA    - A-weighted Sound Pressure Level, by default dbA_noise of the SPL
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+
+        if SPL_dBA is None:
+            SPL_dBA = dbA_noise(SPL)
+
+        self.number_of_steps += np.shape(SPL)[-2]
+
+        accumulate_levels(self.PNLT,pnl_noise(SPL)+noise_tone_correction(SPL))
+        accumulate_levels(self.dBA,np.max(SPL_dBA,axis=-1))
+
+    def EPNL(self):
+        """Effective Perceived Noise Level of the steps added so far, see epnl_noise.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        EPNL       - Effective Perceived Noise Level in EPNdB, [histories]
+
+        Properties Used:
+        self.PNLT
+        """
+
+        PNLT_max, sumation = noise_duration_sum(self.PNLT.history)
+
+        EPNL = PNLT_max+(10*np.log10(sumation)-PNLT_max-13)
+
+        return np.where(self.PNLT.nonzero,EPNL,0.)[()]
+
+    def SENEL(self):
+        """Single Event Noise Exposure Level of the steps added so far, see senel_noise.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        SENEL      - Single Event Noise Exposure Level in dBA, [histories]
+
+        Properties Used:
+        self.dBA
+        """
+
+        dBA_max, sumation = noise_duration_sum(self.dBA.history)
+
+        SENEL = 10*np.log10(sumation)
+
+        return np.where(self.dBA.nonzero,SENEL,0.)[()]
+
+def accumulate_levels(metric,levels):
+    """Adds levels to the history of a metric and drops the points that can no longer be in its duration.
+
+    Assumptions:
+    The running maximum only grows, so the duration can not start before the point before the first one
+    within 10 dB of it.
+
+    Source:
+    N/A
+
+    Inputs:
+    metric     - history, maximum and nonzero of Noise_Metrics_Accumulator
+    levels     - next levels, [histories, steps] or [steps]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    if metric.history is None:
+        metric.history = levels
+        metric.maximum = np.max(levels,axis=-1)
+        metric.nonzero = np.any(levels!=0,axis=-1)
+    else:
+        metric.history = np.concatenate((metric.history,levels),axis=-1)
+        metric.maximum = np.maximum(metric.maximum,np.max(levels,axis=-1))
+        metric.nonzero = metric.nonzero | np.any(levels!=0,axis=-1)
+
+    # keep the point before the first one within 10 dB of the maximum, of the history that has it first
+    first = np.min(np.argmax(metric.history>np.atleast_1d(metric.maximum)[...,None]-10,axis=-1))
+    if first > 1:
+        metric.history = metric.history[...,first-1:]
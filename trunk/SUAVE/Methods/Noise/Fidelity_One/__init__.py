@@ -4,4 +4,5 @@
 
 from . import Airframe
 from . import Engine
-from . import Noise_Tools
\ No newline at end of file
+from . import Noise_Tools
+from .noise_footprint import noise_footprint
\ No newline at end of file
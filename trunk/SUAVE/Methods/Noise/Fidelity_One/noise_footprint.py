@@ -0,0 +1,162 @@
+## @ingroupMethods-Noise-Fidelity_One
+# noise_footprint.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# SUAVE Imports
+from SUAVE.Core import Data
+
+from .Airframe import noise_airframe_Fink_source
+from .Airframe import noise_airframe_Fink_spectra
+from .Engine   import noise_SAE_source
+from .Engine   import noise_SAE_spectra
+
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import Noise_Metrics_Accumulator
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_footprint_geometric
+from SUAVE.Methods.Utilities.parallel_map import parallel_map, number_of_processes_used
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Noise Footprint
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One
+def noise_footprint(config,analyses,noise_segment,turbofan=None):
+    """This method computes the EPNL and SENEL of the airframe and the jet on a grid of microphones on the
+    ground. The sources are computed once for every position of the aircraft, then their noise is propagated
+    to the microphones in shards, on a pool of processes if asked for.
+
+        Inputs:
+                    config                     - SUAVE type vehicle, see noise_airframe_Fink
+                    analyses                   - with the atmosphere and the noise settings
+                    noise_segment              - SUAVE type segment
+                    turbofan                   - SUAVE type turbofan, see noise_SAE, None leaves the jet out
+
+                Outputs: [x positions, lateral positions]
+                    x_positions                - Position of the microphones along the path [m]
+                    lateral_positions          - Position of the microphones to the side of the path [m]
+                    EPNL                       - Effective Perceived Noise Level of the aircraft [EPNdB]
+                    SENEL                      - Single Event Noise Exposure Level of the aircraft [dBA]
+                    airframe                   - EPNL and SENEL of the airframe
+                    engine                     - EPNL and SENEL of the jet
+
+                Properties Used:
+                    analyses.noise.settings.
+                      footprint_x_positions
+                      footprint_lateral_positions
+                      footprint_observers_per_shard
+                      number_of_processes
+
+                Assumptions:
+                    The microphones are on the ground. The levels of the airframe and the jet are added as
+                    the noise of the aircraft is in the noise optimization."""
+
+    #unpack
+    settings          = analyses.noise.settings
+    x_positions       = np.atleast_1d(settings.footprint_x_positions)
+    lateral_positions = np.atleast_1d(settings.footprint_lateral_positions)
+    per_shard         = settings.get('footprint_observers_per_shard',100)
+    time              = noise_segment.conditions.frames.inertial.time[:,0]
+
+    #Microphone grid, each microphone as a row of x, height, lateral position
+    x_grid, lateral_grid = np.meshgrid(x_positions,lateral_positions,indexing='ij')
+    observers            = np.zeros((x_grid.size,3))
+    observers[:,0]       = x_grid.flatten()
+    observers[:,2]       = lateral_grid.flatten()
+
+    #Sources along the path, these do not depend on the microphones
+    airframe_source = noise_airframe_Fink_source(config,noise_segment,analyses)
+    if turbofan is None:
+        engine_source = None
+    else:
+        engine_source = noise_SAE_source(turbofan,noise_segment,analyses)
+    noise_time = airframe_source.time
+
+    #Distance and emission angles of every microphone, resampled as the sources
+    geometric = noise_footprint_geometric(noise_segment,observers)
+    dist, theta, phi = [np.array([np.interp(noise_time,time,row) for row in values]) for values in geometric]
+
+    #Split the microphones in shards, each evaluated at once
+    nshards   = int(np.ceil(len(observers)/float(per_shard)))
+    shards    = np.array_split(np.arange(len(observers)),nshards)
+    processes = number_of_processes_used(settings.get('number_of_processes',1),nshards)
+
+    arguments = []
+    for shard in shards:
+        arguments.append((airframe_source,engine_source,dist[shard],theta[shard],phi[shard]))
+
+    results = parallel_map(evaluate_footprint_observers,arguments,processes)
+
+    #Pack the results
+    footprint = Data()
+    footprint.x_positions       = x_grid
+    footprint.lateral_positions = lateral_grid
+    for component in ['airframe','engine']:
+        footprint[component] = Data()
+        for metric in ['EPNL','SENEL']:
+            values = np.hstack([result[component][metric] for result in results])
+            footprint[component][metric] = np.reshape(values,np.shape(x_grid))
+
+    #Noise of the aircraft
+    for metric in ['EPNL','SENEL']:
+        if turbofan is None:
+            footprint[metric] = footprint.airframe[metric]
+        else:
+            footprint[metric] = 10. * np.log10(10**(footprint.airframe[metric]/10) + 10**(footprint.engine[metric]/10))
+
+    return footprint
+
+## @ingroupMethods-Noise-Fidelity_One
+def evaluate_footprint_observers(arguments):
+    """Computes the EPNL and SENEL of the airframe and the jet at a shard of microphones, the function handed
+    to parallel_map.
+
+        Inputs:
+                    arguments                  - airframe source, jet source or None, distance, polar and
+                                                 azimuthal angles of the microphones [observers, positions]
+
+                Outputs:
+                    metrics                    - EPNL and SENEL of the airframe and the jet [observers]
+
+                Assumptions:
+                    None."""
+
+    airframe_source, engine_source, dist, theta, phi = arguments
+
+    metrics = Data()
+    metrics.airframe = footprint_metrics(noise_airframe_Fink_spectra(airframe_source,dist,theta,phi))
+    if engine_source is None:
+        metrics.engine       = Data()
+        metrics.engine.EPNL  = np.zeros(len(dist))
+        metrics.engine.SENEL = np.zeros(len(dist))
+    else:
+        metrics.engine = footprint_metrics(noise_SAE_spectra(engine_source,dist,theta))
+
+    return metrics
+
+## @ingroupMethods-Noise-Fidelity_One
+def footprint_metrics(spectra):
+    """Computes the EPNL and SENEL of the total SPL history of each microphone.
+
+        Inputs:
+                    spectra                    - total and dBA SPL [observers, positions, bands]
+
+                Outputs:
+                    metrics                    - EPNL and SENEL [observers]
+
+                Assumptions:
+                    None."""
+
+    accumulator = Noise_Metrics_Accumulator()
+    accumulator.append(spectra.total,spectra.dBA)
+
+    metrics       = Data()
+    metrics.EPNL  = accumulator.EPNL()
+    metrics.SENEL = accumulator.SENEL()
+
+    return metrics
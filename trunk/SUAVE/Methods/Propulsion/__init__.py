@@ -4,9 +4,11 @@
 
 from .ducted_fan_sizing import ducted_fan_sizing
 from .propeller_design import propeller_design
+from .rotor_inflow import solve_rotor_inflow, compute_rotor_sections, interpolate_airfoil_polars
 from .turbofan_emission_index import turbofan_emission_index
 from .electric_motor_sizing import size_from_kv, size_from_mass
 from .turbofan_sizing import turbofan_sizing
+from .turbofan_cycle import evaluate_turbofan_cycle, can_evaluate_turbofan_cycle
 from .turbojet_sizing import turbojet_sizing
 from .ramjet_sizing import ramjet_sizing
 from .scramjet_sizing import scramjet_sizing
@@ -0,0 +1,275 @@
+## @ingroup Methods-Propulsion
+# rotor_inflow.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Solve Rotor Inflow
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def solve_rotor_inflow(Ua,Ut,U,beta,r,c,R,B,a,nu,tc,polars=None,stall_limit=True,psi0=1.,tol=1e-5,max_iterations=2000):
+    """Solves the blade element momentum equations of a propeller or rotor for the inflow angle psi
+    with a Newton iteration. Each condition (row) iterates until the largest change of psi over its
+    stations drops under the tolerance, after that it is dropped from the iteration so the remaining
+    conditions are the only ones updated.
+
+    Assumptions:
+    A condition stops without converging when one of its stations goes past 85 degrees with psi still
+    growing, or after max_iterations. The sections returned are those of the last residual evaluation
+    of each condition.
+
+    Source:
+    Drela, M. "Qprop Formulation", MIT AeroAstro, June 2006
+    http://web.mit.edu/drela/Public/web/qprop/qprop_theory.pdf
+
+    Inputs:
+    Ua                  axial velocity                            [m/s]     (n_ctrl,N)
+    Ut                  tangential velocity                       [m/s]     (n_ctrl,N)
+    U                   total velocity                            [m/s]     (n_ctrl,N)
+    beta                twist                                     [radians] (N) or (n_ctrl,N)
+    r                   radial stations                           [m]       (N)
+    c                   chords                                    [m]       (N)
+    R                   tip radius                                [m]
+    B                   number of blades                          [-]
+    a                   speed of sound                            [m/s]     (n_ctrl,1)
+    nu                  kinematic viscosity                       [m^2/s]   (n_ctrl,1)
+    tc                  thickness to chord                        [-]
+    polars.             (optional, 2 pi lift curve slope without)
+      angle_of_attacks                                            [radians] (n_aoa)
+      lift_coefficients lift coefficients of each station         [-]       (N,n_aoa)
+    stall_limit         limits the lift coefficient by Cl max     [bool]
+    psi0                initial inflow angle                      [radians]
+    tol                 convergence tolerance                     [radians]
+    max_iterations                                                [-]
+
+    Outputs:
+    sections            see compute_rotor_sections                          (n_ctrl,N)
+    converged           convergence of each condition             [bool]    (n_ctrl,1)
+    iterations          iterations of each condition              [-]       (n_ctrl,1)
+
+    Properties Used:
+    N/A
+    """
+
+    n_ctrl, N = np.shape(U)
+    shape     = (n_ctrl,N)
+
+    # everything that varies over the stations is laid out per condition, so conditions can be dropped
+    inputs = [np.broadcast_to(np.asarray(x,dtype=float),shape) for x in [Ua,Ut,U,beta,r,c,a,nu,tc]]
+
+    # Setup a Newton iteration
+    psi        = np.ones(shape)*psi0
+    psiold     = np.zeros(shape)
+    psi_eval   = np.empty(shape)
+    converged  = np.zeros(n_ctrl,dtype=bool)
+    iterations = np.zeros(n_ctrl,dtype=int)
+    rows       = np.arange(n_ctrl)
+    active     = inputs
+    pi         = np.pi
+
+    for ii in range(max_iterations+1):
+        sections       = compute_rotor_sections(psi,*active,R,B,polars,stall_limit)
+        psi_eval[rows] = psi
+
+        dpsi   = -sections.residual/sections.dR_dpsi
+        psi    = psi + dpsi
+        diff   = np.max(abs(psiold-psi),axis=1)
+        psiold = psi
+
+        # If its really not going to converge
+        broke = np.any(psi>(pi*85.0/180.),axis=1) & np.any(dpsi>0.0,axis=1)
+
+        converged[rows]  = diff <= tol
+        iterations[rows] = ii + 1
+        done             = (diff <= tol) | broke | np.isnan(diff)
+        if np.all(done):
+            break
+
+        # only the conditions still iterating are carried on
+        if np.any(done):
+            keep   = ~done
+            rows   = rows[keep]
+            psi    = psi[keep]
+            psiold = psiold[keep]
+            active = [x[keep] for x in active]
+
+    sections           = compute_rotor_sections(psi_eval,*inputs,R,B,polars,stall_limit)
+    sections.psi       = psi_eval
+
+    return sections, converged[:,None], iterations[:,None]
+
+## @ingroup Methods-Propulsion
+def compute_rotor_sections(psi,Ua,Ut,U,beta,r,c,a,nu,tc,R,B,polars=None,stall_limit=True):
+    """Computes the blade sections of a propeller or rotor for an inflow angle, along with the residual
+    of the circulation and its derivative that drive the Newton iteration of solve_rotor_inflow.
+
+    Assumptions:
+    Without polars the lift curve slope is 2 pi. Karman-Tsien compressibility correction
+    for subsonic sections, stalled past 90 degrees.
+
+    Source:
+    Drela, M. "Qprop Formulation", MIT AeroAstro, June 2006
+    http://web.mit.edu/drela/Public/web/qprop/qprop_theory.pdf
+
+    Inputs:
+    psi                 inflow angle                              [radians]
+    see solve_rotor_inflow, all arrays shaped like psi
+
+    Outputs:
+    sections.
+      Wa, Wt, W         axial, tangential and total velocity      [m/s]
+      va, vt            induced axial and tangential velocity     [m/s]
+      alpha             angle of attack                           [radians]
+      Ma                Mach number                               [-]
+      Re                Reynolds number                           [-]
+      Gamma             circulation                               [m^2/s]
+      Cl                lift coefficient                          [-]
+      residual                                                    [m^2/s]
+      dR_dpsi           derivative of the residual                [m^2/s]
+
+    Properties Used:
+    N/A
+    """
+
+    pi      = np.pi
+    pi2     = pi*pi
+    BB      = B*B
+    BBB     = BB*B
+
+    sin_psi = np.sin(psi)
+    cos_psi = np.cos(psi)
+    Wa      = 0.5*Ua + 0.5*U*sin_psi
+    Wt      = 0.5*Ut + 0.5*U*cos_psi
+    va      = Wa - Ua
+    vt      = Ut - Wt
+    alpha   = beta - np.arctan2(Wa,Wt)
+    W       = (Wa*Wa + Wt*Wt)**0.5
+    Ma      = (W)/a #a is the speed of sound
+
+    lamdaw = r*Wa/(R*Wt)
+
+    # Limiter to keep from Nan-ing
+    lamdaw[lamdaw<0.] = 0.
+
+    f            = (B/2.)*(1.-r/R)/lamdaw
+    piece        = np.exp(-f)
+    arccos_piece = np.arccos(piece)
+    F            = 2.*arccos_piece/pi
+    Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
+
+    # Estimate Cl max
+    Re         = (W*c)/nu
+    Cl_max_ref = -0.0009*tc**3 + 0.0217*tc**2 - 0.0442*tc + 0.7005
+    Re_ref     = 9.*10**6
+    Cl1maxp    = Cl_max_ref * ( Re / Re_ref ) **0.1
+
+    # Compute blade CL distribution from the airfoil data
+    if polars is not None:
+        Cl = interpolate_airfoil_polars(alpha,polars.angle_of_attacks,polars.lift_coefficients)
+    else:
+        # If not airfoil polar provided, use 2*pi as lift curve slope
+        Cl = 2.*pi*alpha
+
+    # By 90 deg, it's totally stalled.
+    if stall_limit:
+        Cl[Cl>Cl1maxp]  = Cl1maxp[Cl>Cl1maxp] # This line of code is what changed the regression testing
+    Cl[alpha>=pi/2] = 0.
+
+    # Scale for Mach, this is Karmen_Tsien
+    Cl[Ma[:,:]<1.] = Cl[Ma[:,:]<1.]/((1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5))*Cl[Ma<1.]/2)
+
+    Rsquiggly = Gamma - 0.5*W*c*Cl
+
+    #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
+    #This was solved symbolically in Matlab and exported
+    f_wt_2 = 4*Wt*Wt
+    f_wa_2 = 4*Wa*Wa
+    Ucospsi  = U*cos_psi
+    Usinpsi  = U*sin_psi
+    Utcospsi = Ut*cos_psi
+    Uasinpsi = Ua*sin_psi
+
+    UapUsinpsi = (Ua + Usinpsi)
+    utpUcospsi = (Ut + Ucospsi)
+
+    utpUcospsi2 = utpUcospsi*utpUcospsi
+    UapUsinpsi2 = UapUsinpsi*UapUsinpsi
+
+    dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B -
+               (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
+               + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
+               - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. -
+              (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R -
+               r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U +
+               Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5)))
+
+    dR_dpsi[np.isnan(dR_dpsi)] = 0.1
+
+    sections          = Data()
+    sections.Wa       = Wa
+    sections.Wt       = Wt
+    sections.W        = W
+    sections.va       = va
+    sections.vt       = vt
+    sections.alpha    = alpha
+    sections.Ma       = Ma
+    sections.Re       = Re
+    sections.Gamma    = Gamma
+    sections.Cl       = Cl
+    sections.residual = Rsquiggly
+    sections.dR_dpsi  = dR_dpsi
+
+    return sections
+
+## @ingroup Methods-Propulsion
+def interpolate_airfoil_polars(alpha,angle_of_attacks,coefficients):
+    """Linearly interpolates the polar of each station at the angles of attack of every condition at once,
+    like np.interp does for one station.
+
+    Assumptions:
+    The angles of attack of the polars are increasing, coefficients are held outside of them.
+
+    Source:
+    N/A
+
+    Inputs:
+    alpha               angles of attack                          [radians] (n_ctrl,N)
+    angle_of_attacks    angles of attack of the polars            [radians] (n_aoa)
+    coefficients        coefficients of each station              [-]       (N,n_aoa)
+
+    Outputs:
+    values              coefficients at alpha                     [-]       (n_ctrl,N)
+
+    Properties Used:
+    N/A
+    """
+
+    xp      = np.asarray(angle_of_attacks)
+    n_aoa   = len(xp)
+    N       = np.shape(coefficients)[0]
+    station = np.broadcast_to(np.arange(N),np.shape(alpha))
+
+    j  = np.clip(np.searchsorted(xp,alpha,side='right') - 1,0,n_aoa-2)
+    x0 = xp[j]
+    f0 = coefficients[station,j]
+    f1 = coefficients[station,j+1]
+
+    slope  = (f1 - f0)/(xp[j+1] - x0)
+    values = slope*(alpha - x0) + f0
+
+    # held at the ends
+    below         = alpha < xp[0]
+    above         = alpha >= xp[-1]
+    values[below] = coefficients[station[below],0]
+    values[above] = coefficients[station[above],-1]
+
+    return values
@@ -0,0 +1,387 @@
+## @ingroup Methods-Propulsion
+# turbofan_cycle.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+from warnings import warn
+
+from SUAVE.Core import Data, Units
+from SUAVE.Methods.Propulsion.fm_id import fm_id
+
+# the unit conversions of the thrust, looked up once rather than on every evaluation
+hour     = 1.*Units.hour
+per_hour = 1./Units.hour
+
+# ----------------------------------------------------------------------
+#  Turbofan Cycle
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def evaluate_turbofan_cycle(turbofan,conditions):
+    """Evaluates the ram, inlet, compressors, fan, combustor, turbines, nozzles and thrust of a turbofan
+    in one pass, with the equations of each of the components. Only the quantities that reach the
+    thrust, the fuel flow and the acoustic outputs are computed, and they are passed from station to
+    station directly instead of through the inputs and outputs of the components.
+
+    Assumptions:
+    The components are those of the Turbofan network, see can_evaluate_turbofan_cycle. The results
+    are the same as linking the components one by one. Of the inputs and outputs of the components
+    only those read after the network is evaluated are updated, the stagnation states in and out of
+    the combustor and the outputs of the thrust.
+
+    Source:
+    https://web.stanford.edu/~cantwell/AA283_Course_Material/AA283_Course_Notes/
+
+    Inputs:
+    turbofan                        [SUAVE.Components.Energy.Networks.Turbofan]
+    conditions.freestream.
+      pressure                      [Pa]
+      temperature                   [K]
+      mach_number                   [-]
+      velocity                      [m/s]
+      speed_of_sound                [m/s]
+      gravity                       [m/s^2]
+    conditions.propulsion.throttle  [-]
+
+    Outputs:
+    results.
+      thrust_force_vector           [N]
+      vehicle_mass_rate             [kg/s]
+    conditions.freestream.
+      stagnation_temperature              [K]
+      stagnation_pressure                 [Pa]
+      isentropic_expansion_factor         [-]
+      specific_heat_at_constant_pressure  [J/(kg K)]
+      gas_specific_constant               [J/(kg K)]
+    conditions.propulsion.acoustic_outputs.core, .fan
+      see SUAVE.Components.Energy.Networks.Turbofan.evaluate_thrust
+    turbofan.combustor.
+      inputs.stagnation_temperature, stagnation_pressure
+      outputs.stagnation_temperature, stagnation_pressure, stagnation_enthalpy, fuel_to_air_ratio
+    turbofan.thrust.outputs
+      see SUAVE.Components.Energy.Processes.Thrust.compute
+
+    Properties Used:
+    The properties of the ram, inlet_nozzle, low_pressure_compressor, high_pressure_compressor, fan,
+    combustor, high_pressure_turbine, low_pressure_turbine, core_nozzle, fan_nozzle and thrust
+    """
+
+    #unpack from conditions
+    Po       = conditions.freestream.pressure
+    To       = conditions.freestream.temperature
+    Mo       = conditions.freestream.mach_number
+    u0       = conditions.freestream.velocity
+    a0       = conditions.freestream.speed_of_sound
+    g        = conditions.freestream.gravity
+    throttle = conditions.propulsion.throttle
+
+    inlet_nozzle             = turbofan.inlet_nozzle
+    low_pressure_compressor  = turbofan.low_pressure_compressor
+    high_pressure_compressor = turbofan.high_pressure_compressor
+    fan                      = turbofan.fan
+    combustor                = turbofan.combustor
+    high_pressure_turbine    = turbofan.high_pressure_turbine
+    low_pressure_turbine     = turbofan.low_pressure_turbine
+    core_nozzle              = turbofan.core_nozzle
+    fan_nozzle               = turbofan.fan_nozzle
+    thrust                   = turbofan.thrust
+    bypass_ratio             = turbofan.bypass_ratio
+    number_of_engines        = turbofan.number_of_engines
+
+    # ram, the working fluid properties are those of the freestream through the engine
+    working_fluid = turbofan.working_fluid
+    gamma         = working_fluid.compute_gamma(To,Po)
+    Cp            = working_fluid.compute_cp(To,Po)
+    R             = working_fluid.gas_specific_constant
+
+    Tto = To*(1.+((gamma-1.)/2.*Mo*Mo))
+    Pto = Po*((1.+(gamma-1.)/2.*Mo*Mo )**(gamma/(gamma-1.)))
+
+    conditions.freestream.stagnation_temperature               = Tto
+    conditions.freestream.stagnation_pressure                  = Pto
+    conditions.freestream.isentropic_expansion_factor          = gamma
+    conditions.freestream.specific_heat_at_constant_pressure   = Cp
+    conditions.freestream.gas_specific_constant                = R
+
+    # inlet nozzle
+    pid     = inlet_nozzle.pressure_ratio
+    eta_rec = inlet_nozzle.pressure_recovery
+    Pt_inlet = Pto*pid*eta_rec
+    Tt_inlet = Tto*(pid*eta_rec)**((gamma-1)/(gamma*inlet_nozzle.polytropic_efficiency))
+    if np.any(Pt_inlet<Po):
+        warn('Pt_out goes too low',RuntimeWarning)
+
+    # compressors and fan
+    Tt_lpc, Pt_lpc, work_lpc = compress(Tt_inlet,Pt_inlet,low_pressure_compressor,gamma,Cp)
+    Tt_hpc, Pt_hpc, work_hpc = compress(Tt_lpc,Pt_lpc,high_pressure_compressor,gamma,Cp)
+    Tt_fan, Pt_fan, work_fan = compress(Tt_inlet,Pt_inlet,fan,gamma,Cp)
+
+    # combustor
+    Tt4      = combustor.turbine_inlet_temperature
+    nondim_r = combustor.inputs.nondim_mass_ratio
+    ht4      = Cp*Tt4*nondim_r
+    ht_in    = Cp*Tt_hpc*nondim_r
+    f        = (ht4 - ht_in)/(combustor.efficiency*combustor.fuel_data.specific_energy-ht4)
+    Pt_comb  = Pt_hpc*combustor.pressure_ratio
+
+    # turbines, the fan is driven by the low pressure turbine only
+    Tt_hpt, Pt_hpt = expand(Tt4,Pt_comb,f,work_hpc,work_fan,0.0,high_pressure_turbine,gamma,Cp)
+    Tt_lpt, Pt_lpt = expand(Tt_hpt,Pt_hpt,f,work_lpc,work_fan,bypass_ratio,low_pressure_turbine,gamma,Cp)
+
+    # nozzles
+    core = exhaust(Tt_lpt,Pt_lpt,core_nozzle,gamma,Cp,Po,Pto,Tto,Mo)
+    byp  = exhaust(Tt_fan,Pt_fan,fan_nozzle,gamma,Cp,Po,Pto,Tto,Mo)
+
+    # thrust
+    flow_through_core = 1./(1.+bypass_ratio) #scaled constant to turn on core thrust computation
+    flow_through_fan  = bypass_ratio/(1.+bypass_ratio) #scaled constant to turn on fan thrust computation
+
+    core_thrust_nondimensional  = flow_through_core*(gamma*Mo*Mo*(core.velocity/u0-1.) + core.area_ratio*(core.static_pressure/Po-1.))
+    fan_thrust_nondimensional   = flow_through_fan*(gamma*Mo*Mo*(byp.velocity/u0-1.) + byp.area_ratio*(byp.static_pressure/Po-1.))
+    Thrust_nd                   = core_thrust_nondimensional + fan_thrust_nondimensional
+
+    Fsp              = 1./(gamma*Mo)*Thrust_nd
+    TSFC             = f*g/(Fsp*a0*(1.+bypass_ratio))*(1.-thrust.SFC_adjustment) * hour # 1/s is converted to 1/hr here
+    mdot_core        = thrust.compressor_nondimensional_massflow*np.sqrt(thrust.reference_temperature/Tt_lpc)*(Pt_lpc/thrust.reference_pressure)
+    FD2              = Fsp*a0*(1.+bypass_ratio)*mdot_core*number_of_engines*throttle
+    fuel_flow_rate   = np.fmax(FD2*TSFC/g,np.array([0.]))*per_hour
+
+    # the emission index reads the combustor after the network is evaluated, the sweeps of
+    # Input_Output.PostProcess the thrust
+    combustor.inputs.stagnation_temperature  = Tt_hpc
+    combustor.inputs.stagnation_pressure     = Pt_hpc
+    combustor.outputs.stagnation_temperature = Tt4
+    combustor.outputs.stagnation_pressure    = Pt_comb
+    combustor.outputs.stagnation_enthalpy    = Cp*Tt4
+    combustor.outputs.fuel_to_air_ratio      = f
+
+    thrust.outputs.thrust                            = FD2
+    thrust.outputs.thrust_specific_fuel_consumption  = TSFC
+    thrust.outputs.non_dimensional_thrust            = Fsp
+    thrust.outputs.core_mass_flow_rate               = mdot_core
+    thrust.outputs.fuel_flow_rate                    = fuel_flow_rate
+    thrust.outputs.power                             = FD2*u0
+    thrust.outputs.specific_impulse                  = Fsp*a0*(1.+bypass_ratio)/(f*g)
+
+    F_vec        = conditions.ones_row(3) * 0.0
+    F_vec[:,0]   = FD2[:,0]
+
+    results = Data()
+    results.thrust_force_vector = F_vec
+    results.vehicle_mass_rate   = fuel_flow_rate
+
+    # store data
+    results_conditions = Data
+    conditions.propulsion.acoustic_outputs.core = results_conditions(
+    exit_static_temperature             = core.static_temperature,
+    exit_static_pressure                = core.static_pressure,
+    exit_stagnation_temperature         = core.stagnation_temperature,
+    exit_stagnation_pressure            = core.static_pressure,
+    exit_velocity                       = core.velocity
+    )
+
+    conditions.propulsion.acoustic_outputs.fan = results_conditions(
+    exit_static_temperature             = byp.static_temperature,
+    exit_static_pressure                = byp.static_pressure,
+    exit_stagnation_temperature         = byp.stagnation_temperature,
+    exit_stagnation_pressure            = byp.static_pressure,
+    exit_velocity                       = byp.velocity
+    )
+
+    return results
+
+## @ingroup Methods-Propulsion
+def can_evaluate_turbofan_cycle(turbofan):
+    """Checks that a turbofan is made of the components evaluate_turbofan_cycle has the equations of.
+
+    Assumptions:
+    Inlets with compressibility effects and shaft power off-takes are left to the components.
+
+    Source:
+    N/A
+
+    Inputs:
+    turbofan                        [SUAVE.Components.Energy.Networks.Turbofan]
+
+    Outputs:
+    [bool]
+
+    Properties Used:
+    N/A
+    """
+
+    Converters = SUAVE.Components.Energy.Converters
+    Processes  = SUAVE.Components.Energy.Processes
+
+    components = [('ram'                     , Converters.Ram),
+                  ('inlet_nozzle'            , Converters.Compression_Nozzle),
+                  ('low_pressure_compressor' , Converters.Compressor),
+                  ('high_pressure_compressor', Converters.Compressor),
+                  ('fan'                     , Converters.Fan),
+                  ('combustor'               , Converters.Combustor),
+                  ('high_pressure_turbine'   , Converters.Turbine),
+                  ('low_pressure_turbine'    , Converters.Turbine),
+                  ('core_nozzle'             , Converters.Expansion_Nozzle),
+                  ('fan_nozzle'              , Converters.Expansion_Nozzle),
+                  ('thrust'                  , Processes.Thrust)]
+
+    for tag, component in components:
+        if type(turbofan.get(tag)) is not component:
+            return False
+
+    if turbofan.inlet_nozzle.compressibility_effects or 'Shaft_Power_Off_Take' in turbofan:
+        return False
+
+    for turbine in [turbofan.high_pressure_turbine,turbofan.low_pressure_turbine]:
+        if turbine.inputs.shaft_power_off_take is not None:
+            return False
+
+    return True
+
+## @ingroup Methods-Propulsion
+def compress(Tt_in,Pt_in,compressor,gamma,Cp):
+    """Stagnation temperature, pressure and work of a compressor or fan, see Compressor.compute
+
+    Assumptions:
+    None
+
+    Source:
+    https://web.stanford.edu/~cantwell/AA283_Course_Material/AA283_Course_Notes/
+
+    Inputs:
+    Tt_in        [K]
+    Pt_in        [Pa]
+    compressor.
+      pressure_ratio          [-]
+      polytropic_efficiency   [-]
+    gamma        [-]
+    Cp           [J/(kg K)]
+
+    Outputs:
+    Tt_out       [K]
+    Pt_out       [Pa]
+    work_done    [J/kg]
+
+    Properties Used:
+    N/A
+    """
+
+    pid       = compressor.pressure_ratio
+    Pt_out    = Pt_in*pid
+    Tt_out    = Tt_in*pid**((gamma-1)/(gamma*compressor.polytropic_efficiency))
+    work_done = Cp*Tt_out - Cp*Tt_in
+
+    return Tt_out, Pt_out, work_done
+
+## @ingroup Methods-Propulsion
+def expand(Tt_in,Pt_in,f,compressor_work,fan_work,alpha,turbine,gamma,Cp):
+    """Stagnation temperature and pressure of a turbine without shaft power off-take, see Turbine.compute
+
+    Assumptions:
+    None
+
+    Source:
+    https://web.stanford.edu/~cantwell/AA283_Course_Material/AA283_Course_Notes/
+
+    Inputs:
+    Tt_in             [K]
+    Pt_in             [Pa]
+    f                 fuel to air ratio  [-]
+    compressor_work   [J/kg]
+    fan_work          [J/kg]
+    alpha             bypass ratio       [-]
+    turbine.
+      mechanical_efficiency  [-]
+      polytropic_efficiency  [-]
+    gamma             [-]
+    Cp                [J/(kg K)]
+
+    Outputs:
+    Tt_out            [K]
+    Pt_out            [Pa]
+
+    Properties Used:
+    N/A
+    """
+
+    shaft_takeoff = 0.
+    deltah_ht = -1 / (1 + f) * 1 / turbine.mechanical_efficiency * (compressor_work + shaft_takeoff + alpha * fan_work)
+    Tt_out    =  Tt_in+deltah_ht/Cp
+    Pt_out    =  Pt_in*(Tt_out/Tt_in)**(gamma/((gamma-1)*turbine.polytropic_efficiency))
+
+    return Tt_out, Pt_out
+
+## @ingroup Methods-Propulsion
+def exhaust(Tt_in,Pt_in,nozzle,gamma,Cp,Po,Pto,Tto,Mo):
+    """Exit conditions of an expansion nozzle, see Expansion_Nozzle.compute
+
+    Assumptions:
+    None
+
+    Source:
+    https://web.stanford.edu/~cantwell/AA283_Course_Material/AA283_Course_Notes/
+
+    Inputs:
+    Tt_in             [K]
+    Pt_in             [Pa]
+    nozzle.
+      pressure_ratio         [-]
+      polytropic_efficiency  [-]
+    gamma             [-]
+    Cp                [J/(kg K)]
+    Po                [Pa]
+    Pto               [Pa]
+    Tto               [K]
+    Mo                [-]
+
+    Outputs:
+    exit.
+      stagnation_temperature [K]
+      static_temperature     [K]
+      static_pressure        [Pa]
+      velocity               [m/s]
+      area_ratio             [-]
+
+    Properties Used:
+    N/A
+    """
+
+    pid      = nozzle.pressure_ratio
+    Pt_out   = Pt_in*pid
+    Tt_out   = Tt_in*pid**((gamma-1)/(gamma)*nozzle.polytropic_efficiency)
+    ht_out   = Cp*Tt_out
+
+    # the nozzle is not over expanded
+    Pt_out   = np.where(Pt_out<Po,Po,Pt_out)
+
+    Mach     = np.sqrt((((Pt_out/Po)**((gamma-1)/gamma))-1)*2/(gamma-1))
+
+    # subsonic, or choked at the exit
+    i_low    = Mach < 1.0
+    Mach     = np.where(Mach >= 1.0,1.0,Mach)
+    P_out    = np.where(i_low,Po,Pt_out/(1.+(gamma-1.)/2.*Mach*Mach)**(gamma/(gamma-1.)))
+
+    if np.any(Mach<=0.0):
+        warn('Pressures Result in Negative Mach Number, making positive',RuntimeWarning)
+        Mach[Mach<=0.0] = 0.001
+
+    T_out         = Tt_out/(1+(gamma-1)/2*Mach*Mach)
+    h_out         = Cp*T_out
+    u_out         = np.sqrt(2*(ht_out-h_out))
+    area_ratio    = (fm_id(Mo,gamma)/fm_id(Mach,gamma)*(1/(Pt_out/Pto))*(np.sqrt(Tt_out/Tto)))
+
+    exit = Data()
+    exit.stagnation_temperature = Tt_out
+    exit.static_temperature     = T_out
+    exit.static_pressure        = P_out
+    exit.velocity               = u_out
+    exit.area_ratio             = area_ratio
+
+    return exit
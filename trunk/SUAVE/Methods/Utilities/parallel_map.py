@@ -0,0 +1,75 @@
+## @ingroup Methods-Utilities
+# parallel_map.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import multiprocessing
+
+# ----------------------------------------------------------------------
+#  parallel_map
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+def parallel_map(function,arguments,number_of_processes=1):
+    """Calls a function on every item of a list, on a pool of processes when more than one is asked for.
+
+    Assumptions:
+    The function is defined at module level and the items and results can be pickled.
+    Results come back in the order of the items.
+
+    Source:
+    N/A
+
+    Inputs:
+    function              [callable]
+    arguments             [list]
+    number_of_processes   [int] None uses every core
+
+    Outputs:
+    results               [list]
+
+    Properties Used:
+    N/A
+    """
+
+    arguments = list(arguments)
+    processes = number_of_processes_used(number_of_processes,len(arguments))
+
+    if processes <= 1:
+        return [function(argument) for argument in arguments]
+
+    with multiprocessing.Pool(processes) as pool:
+        results = pool.map(function,arguments,chunksize=1)
+
+    return results
+
+## @ingroup Methods-Utilities
+def number_of_processes_used(number_of_processes,number_of_tasks):
+    """Number of processes a parallel_map over a number of tasks runs on.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    number_of_processes   [int] None uses every core
+    number_of_tasks       [int]
+
+    Outputs:
+    processes             [int]
+
+    Properties Used:
+    N/A
+    """
+
+    if number_of_processes is None:
+        number_of_processes = os.cpu_count() or 1
+
+    return max(1,min(int(number_of_processes),number_of_tasks))
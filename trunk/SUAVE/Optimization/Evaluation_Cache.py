@@ -0,0 +1,161 @@
+## @ingroup Optimization
+# Evaluation_Cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from collections import OrderedDict
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Evaluation_Cache
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+class Evaluation_Cache(Data):
+    """Keeps the objective and constraint values of the last evaluations of a nexus, so points an
+        optimizer comes back to are not run again. The least recently used point is dropped when
+        the cache is full.
+
+        Assumptions:
+        Points match when every design variable is within the tolerance and the fidelity level is
+        the same, the nearest point is used when several are within the tolerance. Only the values
+        are kept, the vehicles and results are those of the last point run. A tolerance as large as
+        a finite difference step would give a perturbed point the values of the point itself and a
+        zero gradient, so the nexus looks up the points of its finite differences exactly.
+
+        Source:
+        N/A
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            The cache is off until it is given a size
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.size      = 0
+        self.tolerance = 0.
+        self.hits      = 0
+        self.misses    = 0
+        self.entries   = OrderedDict()
+
+    def lookup(self,x,fidelity_level,exact=False):
+        """Finds the values of a point, counting the hits and misses.
+
+            Assumptions:
+            An exact lookup ignores the tolerance
+
+            Source:
+            N/A
+
+            Inputs:
+            x                  [vector]
+            fidelity_level     [int]
+            exact              [bool]
+
+            Outputs:
+            values             [Data()] None when the point is not in the cache
+
+            Properties Used:
+            self.
+              size
+              tolerance
+        """
+
+        entries = self.entries
+        x       = np.asarray(x,dtype=float)
+        key     = (fidelity_level,x.tobytes())
+
+        # the nearest point within the tolerance
+        if key not in entries and self.tolerance > 0. and not exact:
+            nearest = self.tolerance
+            for other, (x_other,values) in entries.items():
+                if other[0] != fidelity_level:
+                    continue
+                distance = np.max(np.abs(x_other - x))
+                if distance <= nearest:
+                    key     = other
+                    nearest = distance
+
+        if key not in entries:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        entries.move_to_end(key)
+
+        return entries[key][1]
+
+    def store(self,x,fidelity_level,values):
+        """Keeps the values of a point, dropping the least recently used points past the size.
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            x                  [vector]
+            fidelity_level     [int]
+            values             [Data()]
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.size
+        """
+
+        if self.size <= 0:
+            return
+
+        x       = np.array(x,dtype=float)
+        entries = self.entries
+        key     = (fidelity_level,x.tobytes())
+
+        entries[key] = (x,values)
+        entries.move_to_end(key)
+        while len(entries) > self.size:
+            entries.popitem(last=False)
+
+    def clear(self):
+        """Forgets every point and resets the statistics.
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        self.entries.clear()
+        self.hits   = 0
+        self.misses = 0
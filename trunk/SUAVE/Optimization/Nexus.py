@@ -5,6 +5,7 @@
 # Modified: Feb 2016, M. Vegh
 #           Apr 2017, T. MacDonald
 #           Jul 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,6 +17,8 @@ from SUAVE.Core import Data, DataOrdered
 from SUAVE.Analyses import Process
 from copy import deepcopy
 from . import helper_functions as help_fun
+from .Evaluation_Cache import Evaluation_Cache
+from SUAVE.Methods.Utilities.parallel_map import parallel_map, number_of_processes_used
 import numpy as np
 
 # ----------------------------------------------------------------------
@@ -69,6 +72,10 @@ class Nexus(Data):
         self.last_fidelity          = None
         self.evaluation_count       = 0
         self.force_evaluate         = False
+        self.evaluation_cache       = Evaluation_Cache()
+        self.number_of_processes    = 1
+        self.central_differences    = False
+        self.alias_paths            = None
     
     def evaluate(self,x = None):
         """This function runs the problem you setup in SUAVE.
@@ -91,6 +98,26 @@ class Nexus(Data):
         """          
         
         self.unpack_inputs(x)
+        self._evaluate_inputs()
+        
+    def _evaluate_inputs(self):
+        """Runs the problem at the inputs already unpacked, unless they are those of the last run.
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """          
         
         # Check if last call was the same
         if np.all(self.optimization_problem.inputs==self.last_inputs) \
@@ -100,6 +127,57 @@ class Nexus(Data):
         else:
             self._really_evaluate()
         
+    def evaluate_values(self,x = None,exact = False):
+        """Retrieves the unscaled objective and constraint values of the problem at the inputs. The values
+            of points kept in the evaluation cache are returned without running the problem again.
+    
+            Assumptions:
+            With a cache hit the vehicles and results are left as they were at the last point run.
+            An exact lookup ignores the tolerance of the cache, as finite differences need.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            x                  [vector]
+            exact              [bool]
+    
+            Outputs:
+            values.
+              objective        [vector]
+              constraints      [vector]
+    
+            Properties Used:
+            None
+        """          
+        
+        self.unpack_inputs(x)
+        
+        problem  = self.optimization_problem
+        cache    = self.evaluation_cache
+        inputs   = problem.inputs
+        fidelity = self.fidelity_level
+        
+        # the cache is keyed on the scaled design vector
+        if cache.size > 0:
+            x_scaled = np.array(inputs[:,1]/inputs[:,3],dtype=float)
+            if not self.force_evaluate:
+                values = cache.lookup(x_scaled,fidelity,exact)
+                if values is not None:
+                    return values
+        
+        self._evaluate_inputs()
+        
+        paths  = self.compile_aliases()
+        
+        values = Data()
+        values.objective   = help_fun.get_path_values(self,paths.objective)
+        values.constraints = help_fun.get_path_values(self,paths.constraints)
+        
+        if cache.size > 0:
+            cache.store(x_scaled,fidelity,values)
+        
+        return values
     
     def _really_evaluate(self):
         """Tricky little function you're not supposed to use. Doesn't check if the last inputs were already run.
@@ -156,13 +234,11 @@ class Nexus(Data):
             None
         """           
     
-        self.evaluate(x)
+        values      = self.evaluate_values(x)
         
-        aliases     = self.optimization_problem.aliases
         objective   = self.optimization_problem.objective
-        results     = self.results
     
-        objective_value  = help_fun.get_values(self,objective,aliases)  
+        objective_value  = values.objective
         scaled_objective = help_fun.scale_obj_values(objective,objective_value)
         
         return scaled_objective.astype('Float64') 
@@ -186,11 +262,9 @@ class Nexus(Data):
             None
             """           
         
-        self.evaluate(x)
+        values      = self.evaluate_values(x)
         
-        aliases     = self.optimization_problem.aliases
         constraints = self.optimization_problem.constraints
-        results     = self.results
         
         # Setup constraints  
         indices = []
@@ -204,7 +278,7 @@ class Nexus(Data):
         else:
 
             # get constaint values 
-            constraint_values = help_fun.get_values(self,iqconstraints,aliases)          
+            constraint_values = np.delete(values.constraints,indices)
             
             # scale bounds 
             scaled_bnd_constraints  = help_fun.scale_const_bnds(iqconstraints)
@@ -239,11 +313,9 @@ class Nexus(Data):
             None
         """         
     
-        self.evaluate(x)
+        values      = self.evaluate_values(x)
 
-        aliases     = self.optimization_problem.aliases
         constraints = self.optimization_problem.constraints
-        results     = self.results
         
         # Setup constraints  
         indices = []
@@ -257,7 +329,7 @@ class Nexus(Data):
         if eqconstraints == []:
             scaled_constraints = []
         else:
-            constraint_values  = help_fun.get_values(self,eqconstraints,aliases)
+            constraint_values  = np.delete(values.constraints,indices)
             scaled_constraints = help_fun.scale_const_values(eqconstraints,constraint_values) - help_fun.scale_const_bnds(eqconstraints)
 
         return scaled_constraints   
@@ -281,18 +353,45 @@ class Nexus(Data):
             None
         """         
         
-        self.evaluate(x)
+        values      = self.evaluate_values(x)
         
-        aliases     = self.optimization_problem.aliases
         constraints = self.optimization_problem.constraints
-        results     = self.results
     
-        constraint_values  = help_fun.get_values(self,constraints,aliases) 
+        constraint_values  = values.constraints
         scaled_constraints = help_fun.scale_const_values(constraints,constraint_values) 
 
         return scaled_constraints     
     
     
+    def evaluate_point(self,x):
+        """Returns the scaled objective and constraint values at a point of the finite differences. The point
+            is looked up in the evaluation cache exactly, a point within the tolerance would be a step away.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            x                  [vector]
+    
+            Outputs:
+            scaled_objective   [float]
+            scaled_constraints [vector]
+    
+            Properties Used:
+            None
+        """         
+        
+        values  = self.evaluate_values(x,exact=True)
+        problem = self.optimization_problem
+        
+        scaled_objective   = help_fun.scale_obj_values(problem.objective,values.objective)
+        scaled_constraints = help_fun.scale_const_values(problem.constraints,values.constraints)
+        
+        return scaled_objective.astype('Float64'), scaled_constraints
+    
     def unpack_inputs(self,x = None):
         """Put's the values of the problem in the right place.
     
@@ -321,10 +420,50 @@ class Nexus(Data):
         converted_values = help_fun.convert_values(inputs)
         
         # Set the dictionary
-        aliases = self.optimization_problem.aliases
-        vehicle = self.vehicle_configurations
+        paths   = self.compile_aliases()
+        
+        self    = help_fun.set_path_values(self,paths.inputs,converted_values)     
+    
+    def compile_aliases(self):
+        """Resolves the aliases of the inputs, objective and constraints into paths, once for each problem.
+            The paths are resolved again when a table of the problem is replaced.
+    
+            Assumptions:
+            Wildcards stand for the keys there are at the first evaluation, set alias_paths to None
+            to resolve them again
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            paths.
+              inputs           [list of lists of paths]
+              objective        [list of paths]
+              constraints      [list of paths]
+    
+            Properties Used:
+            None
+        """           
+        
+        problem = self.optimization_problem
+        paths   = self.alias_paths
+        tables  = [problem.aliases,problem.inputs,problem.objective,problem.constraints]
+        
+        if paths is not None and all(a is b for a,b in zip(paths.tables,tables)):
+            return paths
         
-        self    = help_fun.set_values(self,inputs,converted_values,aliases)     
+        paths = Data()
+        paths.tables      = tables
+        paths.inputs      = help_fun.compile_input_paths(self,problem.inputs,problem.aliases)
+        paths.objective   = help_fun.compile_output_paths(problem.objective,problem.aliases)
+        paths.constraints = help_fun.compile_output_paths(problem.constraints,problem.aliases)
+        
+        self.alias_paths = paths
+        
+        return paths
     
     def constraints_individual(self,x = None):
         """Put's the values of the problem in the right place.
@@ -348,9 +487,11 @@ class Nexus(Data):
 
     def finite_difference(self,x,diff_interval=1e-8):
         """Finite difference gradients and jacobians of the problem.
+            The points are run on a pool of processes when more than one is asked for, each process
+            runs its share of the points on its own copy of the nexus.
     
             Assumptions:
-            N/A
+            The nexus can be pickled to be handed to the processes
     
             Source:
             N/A
@@ -364,39 +505,105 @@ class Nexus(Data):
             jac_con            [array]
     
             Properties Used:
-            None
+            self.
+              number_of_processes   [int] None uses every core
+              central_differences   [bool]
         """           
         
-        obj = self.objective(x)
-        con = self.all_constraints(x)
-        
         inpu  = self.optimization_problem.inputs
         const = self.optimization_problem.constraints
         
         inplen = len(inpu)
         conlen = len(const)
         
-        grad_obj = np.zeros(inplen)
-        jac_con  = np.zeros((inplen,conlen))
-        
-        con2 = (con*np.ones_like(jac_con))
-        
+        # the point itself for forward differences, then the perturbed points
+        points = []
+        if not self.central_differences:
+            points.append(x)
         for ii in range(0,inplen):
             newx     = np.asarray(x)*1.0
             newx[ii] = newx[ii] + diff_interval
-            
-            grad_obj[ii]  = self.objective(newx)
-            jac_con[ii,:] = self.all_constraints(newx)
+            points.append(newx)
+            if self.central_differences:
+                newx     = np.asarray(x)*1.0
+                newx[ii] = newx[ii] - diff_interval
+                points.append(newx)
         
-        grad_obj = (grad_obj - obj)/diff_interval
+        values = self.evaluate_points(points)
         
-        jac_con = (jac_con - con2).T/diff_interval
+        grad_obj = np.zeros(inplen)
+        jac_con  = np.zeros((inplen,conlen))
+        
+        if self.central_differences:
+            for ii in range(0,inplen):
+                grad_obj[ii]  = values[2*ii][0] - values[2*ii+1][0]
+                jac_con[ii,:] = values[2*ii][1] - values[2*ii+1][1]
+                
+            grad_obj = grad_obj/(2.*diff_interval)
+            
+            jac_con  = jac_con.T/(2.*diff_interval)
+            
+        else:
+            obj, con = values[0]
+            
+            con2 = (con*np.ones_like(jac_con))
+            
+            for ii in range(0,inplen):
+                grad_obj[ii]  = values[ii+1][0]
+                jac_con[ii,:] = values[ii+1][1]
+            
+            grad_obj = (grad_obj - obj)/diff_interval
+            
+            jac_con = (jac_con - con2).T/diff_interval
         
         grad_obj = grad_obj.astype(float)
         jac_con  = jac_con.astype(float)
         
         return grad_obj, jac_con
     
+    def evaluate_points(self,points):
+        """Retrieve the scaled objective and constraint values at a list of points, in order, on a pool of
+            processes when more than one is asked for.
+    
+            Assumptions:
+            The nexus can be pickled to be handed to the processes. The points are looked up in the evaluation
+            cache exactly.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            points             [list of vectors]
+    
+            Outputs:
+            values             [list of (objective, constraints)]
+    
+            Properties Used:
+            self.number_of_processes   [int] None uses every core
+        """           
+        
+        processes = number_of_processes_used(self.number_of_processes,len(points))
+        
+        if processes <= 1:
+            return [self.evaluate_point(x) for x in points]
+        
+        # the units are turned into floats as the helper functions do, the units themselves do not pickle
+        problem = self.optimization_problem
+        for table in [problem.inputs,problem.objective,problem.constraints]:
+            if len(table) and table.dtype == object:
+                table[:,-1] = table[:,-1]*1.0
+        
+        # each process gets a copy of the nexus with a contiguous share of the points
+        shares    = np.array_split(np.arange(len(points)),processes)
+        arguments = [(self,[points[ii] for ii in share]) for share in shares]
+        results   = parallel_map(evaluate_nexus_points,arguments,processes)
+        
+        values = []
+        for share_values, evaluation_count in results:
+            values.extend(share_values)
+            self.evaluation_count += evaluation_count
+        
+        return values
     
     def translate(self,x = None):
         """Make a pretty table view of the problem with objective and constraints at the current inputs
@@ -442,7 +649,32 @@ class Nexus(Data):
         print(const_table)
         '''
         return inpu #,const_table
-                               
-        
+
+
+## @ingroup Optimization
+def evaluate_nexus_points(arguments):
+    """Runs a copy of a nexus at a share of the points of Nexus.evaluate_points, the function handed to parallel_map.
+    
+        Assumptions:
+        The points are looked up in the evaluation cache of the copy exactly
+    
+        Source:
+        N/A
+    
+        Inputs:
+        arguments          [tuple] nexus and its share of the points
+    
+        Outputs:
+        values             [list of (objective, constraints)]
+        evaluation_count   [int] runs of the procedure for the share
+    
+        Properties Used:
+        None
+    """
+    
+    nexus, points = arguments
+    
+    count  = nexus.evaluation_count
+    values = [nexus.evaluate_point(x) for x in points]
     
- 
+    return values, nexus.evaluation_count - count
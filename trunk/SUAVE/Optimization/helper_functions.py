@@ -3,14 +3,22 @@
 # 
 # Created:  May 2015, E. Botero
 # Modified: Feb 2015, M. Vegh
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
 # ----------------------------------------------------------------------    
 
 import numpy as np
+import re
 from SUAVE.Core import Data
 
+# an alias made of names and integer indices, like wings.main_wing.origin[0]
+alias_path_pattern = re.compile(r'^[A-Za-z_]\w*(\.[A-Za-z_]\w*)*(\[-?\d+\])*$')
+
+# expressions of aliases that are not paths, compiled once
+alias_expressions  = {}
+
 # ----------------------------------------------------------------------        
 #   Set_values
 # ----------------------------------------------------------------------    
@@ -220,6 +228,250 @@ def get_values(dictionary,outputs,aliases):
     
     return values
 
+## @ingroup Optimization
+def compile_input_paths(dictionary,input_dictionary,aliases):
+    """ Resolves the aliases of the inputs once into the paths set_path_values sets,
+        wildcards are expanded over the keys of the dictionary at that point
+
+    Assumptions:
+    The keys a wildcard stands for do not change after this
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    input_dictionary [Data()]
+    aliases          [list of str]
+
+    Outputs:
+    paths            [list of lists of paths] one list per input
+
+    Properties Used:
+    N/A
+    """      
+    
+    pointers = alias_pointers(input_dictionary[:,0],aliases)
+    
+    paths = []
+    for pointer in pointers:
+        if isinstance(pointer,str):
+            pointer = [pointer]
+        input_paths = []
+        for string in pointer:
+            for expanded in expand_wildcards(dictionary,string):
+                input_paths.append(alias_path(expanded))
+        paths.append(input_paths)
+        
+    return paths
+
+## @ingroup Optimization
+def compile_output_paths(outputs,aliases):
+    """ Resolves the aliases of the outputs once into the paths get_path_values retrieves
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    outputs          [Data()]
+    aliases          [list of str]
+
+    Outputs:
+    paths            [list of paths]
+
+    Properties Used:
+    N/A
+    """      
+    
+    if len(outputs) == 0:
+        return []
+    
+    pointers = alias_pointers(np.array(outputs)[:,0],aliases)
+    
+    return [alias_path(pointer) for pointer in pointers]
+
+## @ingroup Optimization
+def set_path_values(dictionary,paths,converted_values):
+    """ Sets the values of the inputs at the paths of compile_input_paths, like set_values does
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    paths            [list of lists of paths]
+    converted_values [array]
+
+    Outputs:
+    dictionary       [Data()]
+
+    Properties Used:
+    N/A
+    """      
+    
+    for input_paths, value in zip(paths,converted_values):
+        for path in input_paths:
+            if isinstance(path,str):
+                dictionary.deep_set(path,value)
+                continue
+            keys, indices = path
+            data = dictionary
+            for key in keys[:-1]:
+                data = data[key]
+            if indices:
+                data = data[keys[-1]]
+                for index in indices[:-1]:
+                    data = data[index]
+                data[indices[-1]] = value
+            else:
+                data[keys[-1]] = value
+            
+    return dictionary
+
+## @ingroup Optimization
+def get_path_values(dictionary,paths):
+    """ Retrieves the values at the paths of compile_output_paths, like get_values does
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    paths            [list of paths]
+
+    Outputs:
+    values           [array]
+
+    Properties Used:
+    N/A
+    """      
+    
+    values = np.zeros(len(paths))
+    for ii, path in enumerate(paths):
+        if isinstance(path,str):
+            expression = alias_expressions.get(path)
+            if expression is None:
+                expression = alias_expressions[path] = compile('dictionary.'+path,path,'eval')
+            values[ii] = eval(expression,{'dictionary':dictionary})
+            continue
+        keys, indices = path
+        data = dictionary
+        for key in keys:
+            data = data[key] if isinstance(data,dict) and key in data else getattr(data,key)
+        for index in indices:
+            data = data[index]
+        values[ii] = data
+    
+    return values
+
+## @ingroup Optimization
+def alias_pointers(names,aliases):
+    """ Finds the alias of each name, the first one when a name has more
+
+    Assumptions:
+    Every name has an alias
+
+    Source:
+    N/A
+
+    Inputs:
+    names            [list of str]
+    aliases          [list of str]
+
+    Outputs:
+    pointers         [list of str or lists of str]
+
+    Properties Used:
+    N/A
+    """      
+    
+    lookup = {}
+    for alias in aliases:
+        lookup.setdefault(alias[0],alias[1])
+    
+    pointers = []
+    for name in names:
+        if name not in lookup:
+            raise KeyError('no alias for ' + str(name))
+        pointers.append(lookup[name])
+        
+    return pointers
+
+## @ingroup Optimization
+def expand_wildcards(dictionary,string):
+    """ Expands the wildcards of an alias over the keys of the dictionary, like find_a_star does for one
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    string           [str]
+
+    Outputs:
+    newstrings       [list of str]
+
+    Properties Used:
+    N/A
+    """      
+    
+    if '*' not in string:
+        return [string]
+    
+    splitstring = string.split('.')
+    ii          = [jj for jj in range(len(splitstring)) if '*' in splitstring[jj]][0]
+    data        = dictionary
+    for key in splitstring[0:ii]:
+        data = data[key]
+    
+    newstrings = []
+    for key in data.keys():
+        newstring = '.'.join(splitstring[0:ii] + [key] + splitstring[ii+1:])
+        newstrings.extend(expand_wildcards(dictionary,newstring))
+    
+    return newstrings
+
+## @ingroup Optimization
+def alias_path(string):
+    """ Splits an alias into its keys and indices, aliases that are not plain paths are kept as strings
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    string           [str]
+
+    Outputs:
+    path             [tuple] keys and indices, or the string
+
+    Properties Used:
+    N/A
+    """      
+    
+    if not alias_path_pattern.match(string):
+        return string
+    
+    parts   = string.split('[')
+    keys    = tuple(parts[0].split('.'))
+    indices = tuple(int(part[:-1]) for part in parts[1:])
+    
+    return keys, indices
+
 ## @ingroup Optimization
 def scale_obj_values(inputs,x):
     """ Rescales an objective based on Nexus inputs scale